@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: event loop latency during a burst of concurrent logins
+
+Simulates every judge logging in at once and measures how late a 10 ms ticker
+fires on the event loop while the bcrypt verifications run:
+- inline: bcrypt.verify called directly in the coroutine (the old login path)
+- pool:   server.password_hasher.verify (thread pool + concurrency limit)
+
+Usage (from backend/):
+    python benchmarks/bench_password_hashing.py --logins 20 --rounds 12
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "burnout_benchmark")
+
+from passlib.hash import bcrypt  # noqa: E402
+import server  # noqa: E402
+
+TICK_SECONDS = 0.01
+
+async def measure_loop_lag(stop: asyncio.Event) -> list:
+    """Sleep in 10 ms ticks and record how late each wake-up is (ms)"""
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append((time.perf_counter() - started - TICK_SECONDS) * 1000)
+    return lags
+
+async def inline_verify(password: str, password_hash: str) -> bool:
+    return bcrypt.verify(password, password_hash)
+
+async def run_burst(verify, logins: int, password_hash: str) -> dict:
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_loop_lag(stop))
+    await asyncio.sleep(TICK_SECONDS * 3)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[verify("admin123", password_hash) for _ in range(logins)])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    lags = await ticker
+    assert all(results)
+    return {
+        "elapsed_s": elapsed,
+        "lag_max_ms": max(lags),
+        "lag_p95_ms": statistics.quantiles(lags, n=20)[-1] if len(lags) >= 20 else max(lags),
+        "ticks": len(lags)
+    }
+
+def report(name: str, result: dict):
+    print(f"{name:<8} burst {result['elapsed_s']:6.2f}s  "
+          f"loop lag max {result['lag_max_ms']:8.1f} ms  p95 {result['lag_p95_ms']:8.1f} ms  "
+          f"ticks {result['ticks']}")
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=20, help="concurrent logins in the burst")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor for the test hash")
+    args = parser.parse_args()
+
+    password_hash = bcrypt.using(rounds=args.rounds).hash("admin123")
+    print(f"{args.logins} concurrent logins, bcrypt cost {args.rounds}, "
+          f"pool workers {server.password_hasher.workers}, concurrency {server.password_hasher.max_concurrency}")
+
+    report("inline", await run_burst(inline_verify, args.logins, password_hash))
+    report("pool", await run_burst(server.password_hasher.verify, args.logins, password_hash))
+    print(f"pool metrics: {server.password_hasher.stats()}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: competitor score report rendering
+
+Renders the all-completed-rounds report for a synthetic field (default 1,000
+competitors x 4 rounds x 5 judges, with a 50 KB logo) with
+server.render_competitor_report, and with the same function as it was at a
+baseline git revision (--baseline, default HEAD) so a change to the renderer can
+be checked against the code it replaces. Prints render time per report, HTML
+size and the size of one complete SMTP message. No database access is involved;
+ReportBatch prefetches everything before rendering starts.
+
+Usage (from backend/):
+    python benchmarks/bench_report_rendering.py --reports 1000 --rounds 4 --judges 5 --logo-kb 50 --baseline HEAD~1
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+import types
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "burnout_benchmark")
+
+import server  # noqa: E402
+
+def build_data(report_count: int, round_count: int, judge_count: int, logo_kb: int, seed: int = 1):
+    rng = random.Random(seed)
+    rounds = {f"round-{r}": {"id": f"round-{r}", "name": f"Round {r + 1}", "is_minor": r < round_count - 1}
+              for r in range(round_count)}
+    classes = {"class-0": {"id": "class-0", "name": "V8 Open"}}
+    competitors = [{"id": f"comp-{c}", "name": f"Competitor {c}", "car_number": str(c),
+                    "vehicle_info": "Holden Commodore", "class_id": "class-0"} for c in range(report_count)]
+    scores = {}
+    for competitor in competitors:
+        for round_id in rounds:
+            for _ in range(judge_count):
+                score = {
+                    "round_id": round_id,
+                    **{field: rng.randint(0, 10) for field in
+                       ["tip_in", "instant_smoke", "constant_smoke", "volume_of_smoke", "driving_skill"]},
+                    "tyres_popped": rng.randint(0, 2),
+                    "penalty_reversing": int(rng.random() < 0.1),
+                    "penalty_small_fire": int(rng.random() < 0.05),
+                    "penalty_disqualified": rng.random() < 0.01
+                }
+                score["score_subtotal"] = sum(score[f] for f in
+                                              ["tip_in", "instant_smoke", "constant_smoke", "volume_of_smoke", "driving_skill"])
+                score["penalty_total"] = 5 * (score["penalty_reversing"] + score["penalty_small_fire"])
+                score["final_score"] = 0 if score["penalty_disqualified"] else float(score["score_subtotal"] - score["penalty_total"])
+                scores.setdefault(competitor["id"], []).append(score)
+
+    logo = {"data": rng.randbytes(logo_kb * 1024), "content_type": "image/png", "filename": "logo.png"} if logo_kb else None
+    report_data = {"event_name": "Summernats", "event_date": "03/01/2026", "website_url": "https://example.com",
+                   "logo": logo, "rounds_dict": rounds, "classes_dict": classes}
+    return report_data, competitors, scores
+
+def load_baseline(revision: str) -> types.ModuleType:
+    """server.py as it was at `revision`, imported under another name"""
+    source = subprocess.run(["git", "show", f"{revision}:./server.py"], cwd=BACKEND_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    module = types.ModuleType("server_baseline")
+    module.__file__ = os.path.join(BACKEND_DIR, "server.py")
+    sys.modules[module.__name__] = module
+    exec(compile(source, f"{revision}:server.py", "exec"), module.__dict__)
+    if not hasattr(module, "render_competitor_report"):
+        sys.exit(f"{revision} has no render_competitor_report to compare against")
+    return module
+
+def report_context(module: types.ModuleType, report_data: dict) -> dict:
+    """The data shaped the way load_report_context returns it"""
+    logo = report_data["logo"]
+    return {
+        "event_name": report_data["event_name"],
+        "website_url": report_data["website_url"],
+        "logo": logo,
+        "header_html": module.render_report_header(
+            f"cid:{module.REPORT_LOGO_CID}" if logo else None, report_data["event_name"], report_data["event_date"]
+        ),
+        "rounds_dict": report_data["rounds_dict"],
+        "classes_dict": report_data["classes_dict"]
+    }
+
+def render_all(render, context: dict, competitors: list, scores: dict) -> int:
+    return sum(len(render(context, c, scores[c["id"]])["html"]) for c in competitors)
+
+def message_kb(email_data: dict) -> float:
+    message = server.build_report_message(email_data, "results@example.com", "driver@example.com")
+    return len(message.as_bytes()) / 1024
+
+def timed(func, *args, repeat: int = 5):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--judges", type=int, default=5)
+    parser.add_argument("--logo-kb", type=int, default=50, help="size of the synthetic logo (0 for none)")
+    parser.add_argument("--baseline", default="HEAD", help="git revision whose renderer to compare against")
+    args = parser.parse_args()
+
+    report_data, competitors, scores = build_data(args.reports, args.rounds, args.judges, args.logo_kb)
+    print(f"{len(competitors)} reports, {args.rounds} rounds x {args.judges} judges each, logo {args.logo_kb} KB")
+
+    baseline = load_baseline(args.baseline)
+    results = []
+    for name, module in [(f"baseline ({args.baseline})", baseline), ("working tree", server)]:
+        context = report_context(module, report_data)
+        seconds, size = timed(render_all, module.render_competitor_report, context, competitors, scores)
+        competitor = competitors[0]
+        message = module.render_competitor_report(context, competitor, scores[competitor["id"]])
+        results.append((name, seconds, size, message_kb(message)))
+
+    current_s = results[-1][1]
+    for name, seconds, size, kb in results:
+        print(f"{name:<22} {seconds * 1000:8.1f} ms  ({seconds / len(competitors) * 1000:.3f} ms/report, "
+              f"{size / len(competitors) / 1024:.1f} KB/report, {kb:.1f} KB message)  "
+              f"{seconds / current_s:.2f}x working tree time")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scoring-error detection
+
+Builds a synthetic competition (default 50 active rounds x 500 competitors x 7
+judges, with a sprinkling of missing, duplicate and deviating scores) and times:
+- legacy: the previous get_scoring_errors loop (rescans every score per round and
+          checks judges against a list)
+- single: server.detect_scoring_errors (one grouping pass, set/dict membership)
+
+Both must report the same errors. The database round trip is not included; the
+endpoint now also asks MongoDB for active-round scores only instead of every score.
+Finally the vectorized deviation pass (server.find_score_deviations) is timed on
+its own for every deviation mode.
+
+Usage (from backend/):
+    python benchmarks/bench_scoring_errors.py --rounds 50 --competitors 500 --judges 7
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "burnout_benchmark")
+
+import server  # noqa: E402
+
+def build_data(round_count: int, competitor_count: int, judge_count: int, seed: int = 1):
+    rng = random.Random(seed)
+    rounds = [{"id": f"round-{r}", "name": f"Round {r}"} for r in range(round_count)]
+    competitors = [{"id": f"comp-{c}", "name": f"Competitor {c}", "car_number": str(c)} for c in range(competitor_count)]
+    judges = [{"id": f"judge-{j}", "name": f"Judge {j}"} for j in range(judge_count)]
+    # One extra judge that has been deactivated mid-event
+    inactive_judge = {"id": "judge-inactive", "name": "Inactive Judge"}
+
+    scores = []
+    for round_data in rounds:
+        for competitor in competitors:
+            base = rng.uniform(40, 80)
+            for judge in judges:
+                roll = rng.random()
+                if roll < 0.01:
+                    continue  # missing score
+                score = {
+                    "id": f"score-{len(scores)}",
+                    "round_id": round_data["id"],
+                    "competitor_id": competitor["id"],
+                    "judge_id": judge["id"],
+                    "final_score": round(base + rng.uniform(-3, 3) + (15 if roll > 0.995 else 0), 1),
+                    "deviation_acknowledged": rng.random() < 0.2,
+                    **{field: rng.randint(0, 10) for field in
+                       ["tip_in", "instant_smoke", "constant_smoke", "volume_of_smoke", "driving_skill"]},
+                    "tyres_popped": rng.randint(0, 2)
+                }
+                scores.append(score)
+                if roll > 0.998:
+                    scores.append({**score, "id": f"score-{len(scores)}"})  # duplicate
+            if rng.random() < 0.05:
+                scores.append({
+                    "id": f"score-{len(scores)}",
+                    "round_id": round_data["id"],
+                    "competitor_id": competitor["id"],
+                    "judge_id": inactive_judge["id"],
+                    "final_score": base
+                })
+    rng.shuffle(scores)
+    return rounds, competitors, judges, scores
+
+def legacy_detect(rounds, all_scores, active_judges, competitor_map, deviation_threshold):
+    """The previous algorithm, kept here as the baseline"""
+    errors = []
+    active_judge_ids = [j["id"] for j in active_judges]
+    active_judge_map = {j["id"]: j["name"] for j in active_judges}
+    active_judge_count = len(active_judge_ids)
+    for round_data in rounds:
+        round_id = round_data["id"]
+        round_scores = [s for s in all_scores if s["round_id"] == round_id]
+        competitor_scores_map = {}
+        for score in round_scores:
+            competitor_scores_map.setdefault(score["competitor_id"], []).append(score)
+        for comp_id, scores in competitor_scores_map.items():
+            if comp_id not in competitor_map:
+                continue
+            active_scores = [s for s in scores if s["judge_id"] in active_judge_ids]
+            judge_ids = [s["judge_id"] for s in active_scores]
+            unique_active_judges = set(judge_ids)
+            if len(unique_active_judges) < active_judge_count:
+                errors.append((round_id, comp_id, "missing_scores", None))
+            if len(judge_ids) != len(unique_active_judges):
+                Counter(judge_ids)
+                errors.append((round_id, comp_id, "duplicate_scores", None))
+            if len(active_scores) >= 2:
+                avg_score = sum(s.get("final_score", 0) for s in active_scores) / len(active_scores)
+                for score in active_scores:
+                    if score.get("deviation_acknowledged", False):
+                        continue
+                    # Rounded like find_score_deviations so borderline float noise agrees
+                    if round(abs(score.get("final_score", 0) - avg_score), 9) > deviation_threshold:
+                        errors.append((round_id, comp_id, "score_deviation", score["id"]))
+    return errors
+
+def timed(func, *args, repeat: int = 3):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--competitors", type=int, default=500)
+    parser.add_argument("--judges", type=int, default=7)
+    parser.add_argument("--threshold", type=float, default=5)
+    args = parser.parse_args()
+
+    rounds, competitors, judges, scores = build_data(args.rounds, args.competitors, args.judges)
+    competitor_map = {c["id"]: c for c in competitors}
+    print(f"{len(rounds)} rounds, {len(competitors)} competitors, {len(judges)} active judges, {len(scores)} scores")
+
+    legacy_s, legacy_errors = timed(legacy_detect, rounds, scores, judges, competitor_map, args.threshold, repeat=1)
+    single_s, errors = timed(server.detect_scoring_errors, rounds, scores, judges, competitor_map, args.threshold)
+
+    single_keys = sorted((e.round_id, e.competitor_id, e.error_type, e.score_id or "") for e in errors)
+    legacy_keys = sorted((r, c, t, sid or "") for r, c, t, sid in legacy_errors)
+    assert single_keys == legacy_keys, "detectors disagree"
+
+    counts = Counter(e.error_type for e in errors)
+    print(f"errors: {dict(counts)}")
+    print(f"legacy {legacy_s * 1000:10.1f} ms")
+    print(f"single {single_s * 1000:10.1f} ms  ({legacy_s / single_s:.1f}x faster)")
+
+    active_ids = {j["id"] for j in judges}
+    active_scores = [s for s in scores if s["judge_id"] in active_ids]
+    for mode in server.SCORE_DEVIATION_MODES:
+        mode_s, flagged = timed(server.find_score_deviations, active_scores, args.threshold, mode)
+        print(f"deviations[{mode:<12}] {mode_s * 1000:8.1f} ms  flagged {len(flagged)}")
+
+if __name__ == "__main__":
+    main()
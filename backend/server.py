@@ -3,12 +3,30 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DeleteOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 import os
+import asyncio
+import hashlib
+import html as html_lib
+import importlib.util
+import json
 import logging
+import math
+import socket
+import tempfile
+import time
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, ValidationError
 from typing import List, Optional
 import uuid
+import numpy as np
+import pandas as pd
 from datetime import datetime, timezone, timedelta
 from passlib.hash import bcrypt
 import jwt
@@ -18,6 +36,7 @@ import base64
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.mime.image import MIMEImage
 from email.mime.base import MIMEBase
 from email import encoders
 import email.charset
@@ -41,7 +60,26 @@ JWT_SECRET = os.environ.get('JWT_SECRET', 'burnout-secret-key-change-in-producti
 JWT_ALGORITHM = 'HS256'
 
 # Rate limiting setup
-limiter = Limiter(key_func=get_remote_address)
+# Limits are keyed by the authenticated user so judges sharing a venue NAT address do
+# not share one budget; unauthenticated requests (login) fall back to the client IP.
+# Counters live in RATE_LIMIT_STORAGE_URI: memory:// is per process, so deployments
+# running several uvicorn workers should point it at MongoDB (mongodb://host:27017).
+def rate_limit_key(request: Request) -> str:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    token = token or request.query_params.get("token", "")
+    if token and (scheme.lower() == "bearer" or not scheme):
+        try:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+            return f"user:{payload['user_id']}"
+        except Exception:
+            pass
+    return f"ip:{get_remote_address(request)}"
+
+limiter = Limiter(
+    key_func=rate_limit_key,
+    storage_uri=os.environ.get('RATE_LIMIT_STORAGE_URI', 'memory://'),
+    in_memory_fallback_enabled=True
+)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
@@ -73,6 +111,9 @@ class ProfileUpdate(BaseModel):
     name: Optional[str] = None
     password: Optional[str] = None
 
+class ProfileUpdateResponse(User):
+    token: Optional[str] = None  # Replacement token when the change revoked the old one
+
 class CompetitionClass(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -165,6 +206,7 @@ class Score(BaseModel):
     final_score: float = 0
     email_sent: bool = False  # Track if score report was emailed
     deviation_acknowledged: bool = False  # Mark as reviewed if score deviates from average
+    client_key: Optional[str] = None  # Idempotency key sent by the judge's device
     submitted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     edited_at: Optional[datetime] = None
 
@@ -184,6 +226,7 @@ class ScoreCreate(BaseModel):
     penalty_failed_drive_off: int = 0
     penalty_large_fire: int = 0
     penalty_disqualified: bool = False
+    client_key: Optional[str] = None  # Retries with the same key return the stored score
 
 class ScoreUpdate(BaseModel):
     tip_in: Optional[float] = None
@@ -251,17 +294,310 @@ class MinorRoundsLeaderboardEntry(BaseModel):
     rounds_competed: int
     score_count: int
 
+# User cache
+# authenticate_token runs on every request, so resolved users are kept in a small
+# LRU with a TTL. Every write to a user document invalidates its entry; the TTL only
+# bounds staleness for changes made outside this process.
+class UserCache:
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()  # user_id -> (expires_at, User)
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, user_id: str) -> Optional[User]:
+        entry = self.entries.get(user_id)
+        if entry and entry[0] > time.monotonic():
+            self.entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+        if entry:
+            del self.entries[user_id]
+        self.misses += 1
+        return None
+
+    def put(self, user: User, generation: int):
+        """Store a user loaded while `generation` was current. Skipped if anything was
+        invalidated in the meantime, so a slow lookup cannot re-cache stale data."""
+        if generation != self.generation:
+            return
+        self.entries[user.id] = (time.monotonic() + self.ttl, user)
+        self.entries.move_to_end(user.id)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: str):
+        self.generation += 1
+        self.entries.pop(user_id, None)
+
+    def clear(self):
+        self.generation += 1
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+user_cache = UserCache(
+    max_size=int(os.environ.get('USER_CACHE_SIZE', '1024')),
+    ttl=float(os.environ.get('USER_CACHE_TTL', '60'))
+)
+
+# Token epochs
+# Tokens carry the user's claims (role, name, is_active) plus the user's token_epoch,
+# so most requests are authorized without touching the database. Revoking tokens
+# (deactivate, delete, password or name change) bumps token_epoch on the user; this
+# table mirrors the epochs in memory. A token older than the table is rejected, one
+# that matches is trusted as-is, and anything else (pre-epoch tokens, users this
+# process has not loaded yet, a table behind another worker) takes the database path.
+class TokenEpochs:
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.epochs: dict = {}  # user_id -> token_epoch
+        self.generation = 0
+        self.claim_hits = 0
+        self.fallbacks = 0
+        self.revoked = 0
+
+    def get(self, user_id: str) -> Optional[int]:
+        return self.epochs.get(user_id)
+
+    def set(self, user_id: str, epoch: int):
+        self.generation += 1
+        self.epochs[user_id] = max(epoch, self.epochs.get(user_id, 0))
+
+    def remove(self, user_id: str):
+        self.generation += 1
+        self.epochs.pop(user_id, None)
+
+    async def refresh(self):
+        """Reload every user's epoch. A result that raced with a local change is dropped
+        (the next refresh picks it up) so it cannot roll an epoch back."""
+        generation = self.generation
+        docs = await db.users.find({}, {"_id": 0, "id": 1, "token_epoch": 1}).to_list(None)
+        if generation == self.generation:
+            self.epochs = {d["id"]: d.get("token_epoch", 0) for d in docs}
+
+    async def refresh_forever(self):
+        """Pick up revocations made by other worker processes"""
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Token epoch refresh failed: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self.epochs),
+            "refresh_seconds": self.refresh_seconds,
+            "claim_hits": self.claim_hits,
+            "fallbacks": self.fallbacks,
+            "revoked": self.revoked
+        }
+
+token_epochs = TokenEpochs(refresh_seconds=float(os.environ.get('TOKEN_EPOCH_REFRESH', '10')))
+
+def issue_token(user_data: dict) -> str:
+    created_at = user_data.get("created_at")
+    token_payload = {
+        "user_id": user_data["id"],
+        "username": user_data["username"],
+        "name": user_data["name"],
+        "role": user_data["role"],
+        "is_active": user_data.get("is_active", True),
+        "created_at": created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+        "epoch": user_data.get("token_epoch", 0),
+        "exp": datetime.now(timezone.utc) + timedelta(days=7)
+    }
+    return jwt.encode(token_payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+async def update_user_and_revoke(user_id: str, update_data: dict) -> Optional[dict]:
+    """Apply a change that invalidates the user's existing tokens"""
+    user_data = await db.users.find_one_and_update(
+        {"id": user_id},
+        {"$set": update_data, "$inc": {"token_epoch": 1}},
+        projection={"_id": 0, "password_hash": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    user_cache.invalidate(user_id)
+    if user_data:
+        token_epochs.set(user_id, user_data["token_epoch"])
+    return user_data
+
+# Password hashing
+# bcrypt is deliberately slow (hundreds of ms per call on ARM boards), so hashing and
+# verification run in a dedicated thread pool instead of on the event loop. The
+# semaphore caps how many calls can be queued or running at once; anything beyond
+# that waits here rather than piling up work behind the pool. The target cost lives
+# in db.settings ("bcrypt") and is re-read every settings_ttl seconds, so a
+# calibration made on one worker reaches the others and they all rehash to it.
+BCRYPT_DEFAULT_ROUNDS = 12
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 14
+BCRYPT_TARGET_MS = float(os.environ.get('BCRYPT_TARGET_MS', '250'))
+
+def bcrypt_rounds_of(password_hash: str) -> Optional[int]:
+    """Cost factor encoded in a bcrypt hash ($2b$<rounds>$...), None if unparseable"""
+    try:
+        return int(password_hash.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+class PasswordHasher:
+    def __init__(self, workers: int, max_concurrency: int, settings_ttl: float):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password")
+        self.rounds = BCRYPT_DEFAULT_ROUNDS
+        self.settings_ttl = settings_ttl
+        self.rounds_expire_at = 0.0
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.calls = {"hash": 0, "verify": 0}
+        self.total_ms = {"hash": 0.0, "verify": 0.0}
+        self.max_ms = {"hash": 0.0, "verify": 0.0}
+        self.total_wait_ms = 0.0
+
+    async def _run(self, kind: str, func, *args):
+        queued_at = time.perf_counter()
+        async with self.semaphore:
+            started_at = time.perf_counter()
+            self.in_flight += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+            finally:
+                self.in_flight -= 1
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                self.calls[kind] += 1
+                self.total_ms[kind] += elapsed_ms
+                self.max_ms[kind] = max(self.max_ms[kind], elapsed_ms)
+                self.total_wait_ms += (started_at - queued_at) * 1000
+
+    def set_rounds(self, rounds: int):
+        self.rounds = rounds
+        self.rounds_expire_at = time.monotonic() + self.settings_ttl
+
+    async def target_rounds(self) -> int:
+        """The calibrated cost shared by every worker, cached for settings_ttl seconds"""
+        if time.monotonic() >= self.rounds_expire_at:
+            try:
+                settings = await db.settings.find_one({"key": "bcrypt"}, {"_id": 0, "rounds": 1})
+                self.set_rounds(settings["rounds"] if settings and settings.get("rounds") else self.rounds)
+            except Exception as e:
+                logger.warning(f"Could not read bcrypt settings, keeping cost {self.rounds}: {e}")
+        return self.rounds
+
+    async def hash(self, password: str) -> str:
+        rounds = await self.target_rounds()
+        return await self._run("hash", bcrypt.using(rounds=rounds).hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run("verify", bcrypt.verify, password, password_hash)
+
+    async def needs_rehash(self, password_hash: str) -> bool:
+        return bcrypt_rounds_of(password_hash) != await self.target_rounds()
+
+    async def calibrate(self, target_ms: float) -> dict:
+        """Pick the highest cost whose hash time stays within target_ms on this host.
+        Each extra round doubles the work, so one timing at the floor cost is enough
+        to extrapolate; the fastest of three samples filters out scheduler noise."""
+        def sample() -> float:
+            hasher = bcrypt.using(rounds=BCRYPT_MIN_ROUNDS)
+            timings = []
+            for _ in range(3):
+                started = time.perf_counter()
+                hasher.hash("calibration")
+                timings.append((time.perf_counter() - started) * 1000)
+            return min(timings)
+
+        async with self.semaphore:
+            floor_ms = await asyncio.get_running_loop().run_in_executor(self.executor, sample)
+        extra_rounds = math.floor(math.log2(target_ms / floor_ms)) if target_ms > floor_ms else 0
+        rounds = max(BCRYPT_MIN_ROUNDS, min(BCRYPT_MAX_ROUNDS, BCRYPT_MIN_ROUNDS + extra_rounds))
+        return {
+            "rounds": rounds,
+            "target_ms": target_ms,
+            "estimated_ms": round(floor_ms * 2 ** (rounds - BCRYPT_MIN_ROUNDS), 1),
+            "calibrated_at": datetime.now(timezone.utc).isoformat()
+        }
+
+    def stats(self) -> dict:
+        calls = sum(self.calls.values())
+        return {
+            "rounds": self.rounds,
+            "settings_ttl_seconds": self.settings_ttl,
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "calls": dict(self.calls),
+            "avg_ms": {k: round(self.total_ms[k] / self.calls[k], 2) if self.calls[k] else 0.0 for k in self.calls},
+            "max_ms": {k: round(v, 2) for k, v in self.max_ms.items()},
+            "avg_wait_ms": round(self.total_wait_ms / calls, 2) if calls else 0.0
+        }
+
+password_hasher = PasswordHasher(
+    workers=int(os.environ.get('PASSWORD_HASH_WORKERS', '2')),
+    max_concurrency=int(os.environ.get('PASSWORD_HASH_CONCURRENCY', '8')),
+    settings_ttl=float(os.environ.get('BCRYPT_SETTINGS_TTL', '30'))
+)
+
 # Helper functions
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
+    return await authenticate_token(credentials.credentials)
+
+async def authenticate_token(token: str) -> User:
+    """Resolve a JWT to its user (shared by header auth and ?token= auth for EventSource)"""
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        user_data = await db.users.find_one({"id": payload["user_id"]}, {"_id": 0})
+        user_id = payload["user_id"]
+        epoch = payload.get("epoch", 0)  # Tokens issued before epochs count as epoch 0
+        current_epoch = token_epochs.get(user_id)
+        if current_epoch is not None and epoch < current_epoch:
+            token_epochs.revoked += 1
+            raise HTTPException(status_code=401, detail="Token revoked")
+        if "role" in payload and epoch == current_epoch:
+            token_epochs.claim_hits += 1
+            return User(
+                id=user_id,
+                username=payload["username"],
+                name=payload["name"],
+                role=payload["role"],
+                is_active=payload["is_active"],
+                created_at=datetime.fromisoformat(payload["created_at"])
+            )
+
+        token_epochs.fallbacks += 1
+        user = user_cache.get(user_id)
+        if user:
+            return user
+        generation = user_cache.generation
+        user_data = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
         if not user_data:
             raise HTTPException(status_code=401, detail="User not found")
+        token_epochs.set(user_id, user_data.get("token_epoch", 0))
+        if epoch < user_data.get("token_epoch", 0):
+            token_epochs.revoked += 1
+            raise HTTPException(status_code=401, detail="Token revoked")
         if isinstance(user_data.get('created_at'), str):
             user_data['created_at'] = datetime.fromisoformat(user_data['created_at'])
-        return User(**user_data)
+        user = User(**user_data)
+        user_cache.put(user, generation)
+        return user
+    except HTTPException:
+        raise
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except Exception:
@@ -272,6 +608,47 @@ async def require_admin(current_user: User = Depends(get_current_user)) -> User:
         raise HTTPException(status_code=403, detail="Admin access required")
     return current_user
 
+# Change versions
+# change_versions holds a monotonically increasing counter per scope: "classes",
+# "competitors", "events", "rounds", "scores" and "scores:<round_id>". Every write
+# bumps the scopes it touches and read endpoints turn the counters into an ETag,
+# so an unchanged poll is answered with 304 without reading the data collections.
+# A scope with no counter yet (data that predates it) is never cached.
+async def bump_versions(*scopes: str):
+    for scope in scopes:
+        await db.change_versions.update_one({"key": scope}, {"$inc": {"version": 1}}, upsert=True)
+
+async def bump_all_score_versions():
+    """Invalidate every per-round scores scope (resets and rebuilds touch all rounds),
+    creating the counter for rounds that have never had one"""
+    await bump_versions("scores")
+    round_keys = [f"scores:{round_id}" for round_id in await db.rounds.distinct("id")]
+    if round_keys:
+        await db.change_versions.bulk_write([
+            UpdateOne({"key": key}, {"$inc": {"version": 1}}, upsert=True) for key in round_keys
+        ], ordered=False)
+    # Counters left behind by deleted rounds
+    await db.change_versions.update_many(
+        {"key": {"$regex": "^scores:", "$nin": round_keys}}, {"$inc": {"version": 1}}
+    )
+
+async def check_etag(request: Request, response: Response, scopes: List[str], *params) -> Optional[Response]:
+    """Set the ETag for a read built from the given scopes (plus query params that change
+    the payload). Returns a 304 response to send instead if the client copy is current."""
+    docs = await db.change_versions.find({"key": {"$in": scopes}}, {"_id": 0}).to_list(None)
+    versions = {d["key"]: d["version"] for d in docs}
+    if len(versions) < len(scopes):
+        return None  # No counter to invalidate a cached copy with
+    tag = "|".join([request.url.path] + [f"{s}={versions[s]}" for s in scopes] + [str(p) for p in params])
+    etag = f'W/"{hashlib.sha1(tag.encode()).hexdigest()[:20]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = [t.strip() for t in request.headers.get("if-none-match", "").split(",")]
+    if etag in if_none_match:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
 # Auth routes
 @api_router.post("/auth/login", response_model=LoginResponse)
 @limiter.limit("5/minute")
@@ -280,14 +657,19 @@ async def login(request: Request, login_request: LoginRequest):
     if not user_data:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    if not bcrypt.verify(login_request.password, user_data["password_hash"]):
+    if not await password_hasher.verify(login_request.password, user_data["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    # Bring the stored hash to the calibrated cost while the plaintext is available
+    if await password_hasher.needs_rehash(user_data["password_hash"]):
+        new_hash = await password_hasher.hash(login_request.password)
+        await db.users.update_one(
+            {"id": user_data["id"], "password_hash": user_data["password_hash"]},
+            {"$set": {"password_hash": new_hash}}
+        )
     
-    token_payload = {
-        "user_id": user_data["id"],
-        "exp": datetime.now(timezone.utc) + timedelta(days=7)
-    }
-    token = jwt.encode(token_payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    token = issue_token(user_data)
+    token_epochs.set(user_data["id"], user_data.get("token_epoch", 0))
     
     if isinstance(user_data.get('created_at'), str):
         user_data['created_at'] = datetime.fromisoformat(user_data['created_at'])
@@ -308,13 +690,17 @@ async def register(user_create: UserCreate, admin: User = Depends(require_admin)
     )
     
     doc = user.model_dump()
-    doc["password_hash"] = bcrypt.hash(user_create.password)
+    doc["password_hash"] = await password_hasher.hash(user_create.password)
     doc['created_at'] = doc['created_at'].isoformat()
     
     await db.users.insert_one(doc)
+    user_cache.invalidate(user.id)
+    token_epochs.set(user.id, 0)
+    if user.role == "judge":
+        await refresh_judge_dependents()
     return user
 
-@api_router.put("/auth/profile", response_model=User)
+@api_router.put("/auth/profile", response_model=ProfileUpdateResponse)
 async def update_profile(profile_update: ProfileUpdate, current_user: User = Depends(get_current_user)):
     update_data = {}
     
@@ -322,20 +708,21 @@ async def update_profile(profile_update: ProfileUpdate, current_user: User = Dep
         update_data["name"] = profile_update.name
     
     if profile_update.password:
-        update_data["password_hash"] = bcrypt.hash(profile_update.password)
+        update_data["password_hash"] = await password_hasher.hash(profile_update.password)
     
+    # Name and password changes revoke existing tokens, so hand back a fresh one
+    token = None
     if update_data:
-        await db.users.update_one(
-            {"id": current_user.id},
-            {"$set": update_data}
-        )
-    
-    # Return updated user
-    updated_user = await db.users.find_one({"id": current_user.id}, {"_id": 0, "password_hash": 0})
+        updated_user = await update_user_and_revoke(current_user.id, update_data)
+        token = issue_token(updated_user)
+        if "name" in update_data and current_user.role == "judge":
+            await refresh_scoring_errors()  # Judge names appear in error details
+    else:
+        updated_user = await db.users.find_one({"id": current_user.id}, {"_id": 0, "password_hash": 0})
     if isinstance(updated_user.get('created_at'), str):
         updated_user['created_at'] = datetime.fromisoformat(updated_user['created_at'])
     
-    return User(**updated_user)
+    return ProfileUpdateResponse(**updated_user, token=token)
 
 # Admin - Judge management
 @api_router.get("/admin/judges", response_model=List[User])
@@ -349,8 +736,11 @@ async def get_judges(admin: User = Depends(require_admin)):
 @api_router.delete("/admin/judges/{judge_id}")
 async def delete_judge(judge_id: str, admin: User = Depends(require_admin)):
     result = await db.users.delete_one({"id": judge_id, "role": "judge"})
+    user_cache.invalidate(judge_id)
+    token_epochs.remove(judge_id)
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Judge not found")
+    await refresh_judge_dependents()
     return {"message": "Judge deleted"}
 
 @api_router.put("/admin/judges/{judge_id}/toggle-active")
@@ -361,10 +751,8 @@ async def toggle_judge_active(judge_id: str, admin: User = Depends(require_admin
         raise HTTPException(status_code=404, detail="Judge not found")
     
     new_status = not judge.get("is_active", True)
-    await db.users.update_one(
-        {"id": judge_id},
-        {"$set": {"is_active": new_status}}
-    )
+    await update_user_and_revoke(judge_id, {"is_active": new_status})
+    await refresh_judge_dependents()
     return {"message": f"Judge {'activated' if new_status else 'deactivated'}", "is_active": new_status}
 
 class ScoringError(BaseModel):
@@ -384,63 +772,132 @@ class ScoringError(BaseModel):
 @api_router.get("/admin/scoring-errors", response_model=List[ScoringError])
 async def get_scoring_errors(admin: User = Depends(require_admin)):
     """Check for scoring errors: missing scores, duplicate scores, or score deviations"""
+    rounds = await db.rounds.find({"round_status": "active"}, {"_id": 0, "id": 1}).to_list(100)
+    round_order = {r["id"]: idx for idx, r in enumerate(rounds)}
+    entries = await db.scoring_errors.find(
+        {"round_id": {"$in": list(round_order)}}, {"_id": 0}
+    ).to_list(None)
+    entries.sort(key=lambda e: (round_order[e["round_id"]], e.get("first_seen", "")))
+    return [ScoringError(**error) for entry in entries for error in entry["errors"]]
+
+@api_router.post("/admin/scoring-errors/rebuild")
+async def rebuild_scoring_errors(admin: User = Depends(require_admin)):
+    """Recompute the scoring error registry from the scores (use if it falls out of sync)"""
+    entry_count = await refresh_scoring_errors()
+    return {"message": f"Scoring errors rebuilt ({entry_count} competitors with errors)", "entries": entry_count}
+
+# Deviation modes: compare each final score with the mean or median of all the
+# judges' scores for that competitor and round, its own included (as the original
+# average check did); "mad" also widens the threshold to mad_multiplier robust standard
+# deviations (1.4826 x median absolute deviation) when three or more judges scored;
+# "per_category" compares every scoring category with that category's mean.
+SCORE_DEVIATION_MODES = ["mean", "median", "mad", "per_category"]
+SCORE_CATEGORIES = [("Tip In", "tip_in", 1), ("Instant Smoke", "instant_smoke", 1),
+                    ("Constant Smoke", "constant_smoke", 1), ("Volume of Smoke", "volume_of_smoke", 1),
+                    ("Driving Skill", "driving_skill", 1), ("Tyres Popped", "tyres_popped", 5)]
+
+def find_score_deviations(scores: List[dict], threshold: float, mode: str = "mean",
+                          mad_multiplier: float = 3.0) -> dict:
+    """Vectorized deviation check over many (round, competitor) groups at once.
+    `scores` are active-judge scores; returns {score_id: {deviation, value, reference,
+    category}} for unacknowledged scores beyond the threshold."""
+    if not scores:
+        return {}
+    category_fields = [field for _, field, _ in SCORE_CATEGORIES]
+    df = pd.DataFrame.from_records(
+        scores, columns=["id", "round_id", "competitor_id", "final_score", "deviation_acknowledged"] + category_fields
+    )
+    keys = ["round_id", "competitor_id"]
+    df = df[df.groupby(keys, sort=False)["id"].transform("size") >= 2]
+    if df.empty:
+        return {}
+    groups = [df["round_id"], df["competitor_id"]]
+
+    if mode == "per_category":
+        weights = np.array([weight for _, _, weight in SCORE_CATEGORIES], dtype=float)
+        values = df[category_fields].fillna(0).astype(float) * weights
+        reference = values.groupby(groups, sort=False).transform("mean")
+        deviations = (values - reference).abs().to_numpy()
+        worst = deviations.argmax(axis=1)
+        rows = np.arange(len(df))
+        deviation = deviations[rows, worst]
+        value = values.to_numpy()[rows, worst]
+        reference_value = reference.to_numpy()[rows, worst]
+        category = np.array([label for label, _, _ in SCORE_CATEGORIES])[worst]
+        cutoff = threshold
+    else:
+        values = df["final_score"].fillna(0).astype(float)
+        reference_series = values.groupby(groups, sort=False).transform("mean" if mode == "mean" else "median")
+        deviation_series = (values - reference_series).abs()
+        cutoff = threshold
+        if mode == "mad":
+            mad = deviation_series.groupby(groups, sort=False).transform("median")
+            count = values.groupby(groups, sort=False).transform("size")
+            cutoff = np.maximum(threshold, np.where(count >= 3, mad_multiplier * 1.4826 * mad, 0))
+        deviation = deviation_series.to_numpy()
+        value = values.to_numpy()
+        reference_value = reference_series.to_numpy()
+        category = np.full(len(df), None)
+
+    # Scores are entered to 0.1 pts; round away float noise so a deviation of exactly
+    # the threshold is never flagged
+    deviation = np.round(deviation, 9)
+    acknowledged = df["deviation_acknowledged"].eq(True).to_numpy()
+    flagged = np.flatnonzero((deviation > cutoff) & ~acknowledged)
+    ids = df["id"].to_numpy()
+    return {
+        ids[i]: {
+            "deviation": float(deviation[i]),
+            "value": float(value[i]),
+            "reference": float(reference_value[i]),
+            "category": category[i]
+        }
+        for i in flagged
+    }
+
+def detect_scoring_errors(rounds: List[dict], scores: List[dict], active_judges: List[dict],
+                          competitor_map: dict, deviation_threshold: float, deviation_mode: str = "mean",
+                          mad_multiplier: float = 3.0) -> List[ScoringError]:
+    """Find missing, duplicate and deviating scores in one pass over the scores.
+    Errors are reported per round (in `rounds` order), then per competitor in the
+    order their first score appears."""
     errors = []
-    
-    # Get score deviation threshold from settings (default 5)
-    deviation_settings = await db.settings.find_one({"key": "score_deviation"}, {"_id": 0})
-    deviation_threshold = deviation_settings.get("threshold", 5) if deviation_settings else 5
-    
-    # Get active judges
-    active_judges = await db.users.find(
-        {"role": "judge", "is_active": {"$ne": False}},
-        {"_id": 0, "id": 1, "name": 1}
-    ).to_list(100)
-    active_judge_ids = [j["id"] for j in active_judges]
     active_judge_map = {j["id"]: j["name"] for j in active_judges}
-    active_judge_count = len(active_judge_ids)
-    
+    active_judge_count = len(active_judge_map)
     if active_judge_count == 0:
         return errors
     
-    # Get all active rounds
-    rounds = await db.rounds.find({"round_status": "active"}, {"_id": 0}).to_list(100)
-    
-    # Get all competitors
-    competitors = await db.competitors.find({}, {"_id": 0}).to_list(10000)
-    competitor_map = {c["id"]: c for c in competitors}
+    # Group once: round_id -> competitor_id -> scores from active judges
+    scores_by_round = {r["id"]: {} for r in rounds}
+    for score in scores:
+        round_scores = scores_by_round.get(score["round_id"])
+        if round_scores is None:
+            continue
+        competitor_scores = round_scores.setdefault(score["competitor_id"], [])
+        if score["judge_id"] in active_judge_map:
+            competitor_scores.append(score)
     
-    # Get all scores
-    all_scores = await db.scores.find({}, {"_id": 0}).to_list(100000)
+    deviations = find_score_deviations(
+        [s for round_scores in scores_by_round.values() for group in round_scores.values() for s in group],
+        deviation_threshold, deviation_mode, mad_multiplier
+    )
+    reference_name = "average" if deviation_mode in ("mean", "per_category") else "median"
     
     for round_data in rounds:
         round_id = round_data["id"]
         round_name = round_data.get("name", "Unknown Round")
         
-        # Group scores by competitor for this round
-        round_scores = [s for s in all_scores if s["round_id"] == round_id]
-        
-        # Build a map: competitor_id -> list of scores
-        competitor_scores_map = {}
-        for score in round_scores:
-            comp_id = score["competitor_id"]
-            if comp_id not in competitor_scores_map:
-                competitor_scores_map[comp_id] = []
-            competitor_scores_map[comp_id].append(score)
-        
         # Check each competitor that has at least one score in this round
-        for comp_id, scores in competitor_scores_map.items():
+        for comp_id, active_scores in scores_by_round[round_id].items():
             competitor = competitor_map.get(comp_id)
             if not competitor:
                 continue
             
-            # Only consider scores from active judges
-            active_scores = [s for s in scores if s["judge_id"] in active_judge_ids]
-            judge_ids = [s["judge_id"] for s in active_scores]
-            unique_active_judges = set(judge_ids)
+            judge_counts = Counter(s["judge_id"] for s in active_scores)
             
             # Check for missing scores (not all active judges have scored)
-            if len(unique_active_judges) < active_judge_count:
-                missing_count = active_judge_count - len(unique_active_judges)
+            if len(judge_counts) < active_judge_count:
+                missing_count = active_judge_count - len(judge_counts)
                 errors.append(ScoringError(
                     round_id=round_id,
                     round_name=round_name,
@@ -449,14 +906,12 @@ async def get_scoring_errors(admin: User = Depends(require_admin)):
                     car_number=competitor.get("car_number", "?"),
                     error_type="missing_scores",
                     details=f"Missing {missing_count} score(s) from active judges",
-                    judge_count=len(unique_active_judges),
+                    judge_count=len(judge_counts),
                     expected_count=active_judge_count
                 ))
             
             # Check for duplicate scores (same judge scored same competitor twice in round)
-            if len(judge_ids) != len(unique_active_judges):
-                from collections import Counter
-                judge_counts = Counter(judge_ids)
+            if len(active_scores) != len(judge_counts):
                 duplicates = [jid for jid, count in judge_counts.items() if count > 1]
                 duplicate_names = [active_judge_map.get(jid, "Unknown") for jid in duplicates]
                 
@@ -468,89 +923,241 @@ async def get_scoring_errors(admin: User = Depends(require_admin)):
                     car_number=competitor.get("car_number", "?"),
                     error_type="duplicate_scores",
                     details=f"Duplicate scores from: {', '.join(duplicate_names)}",
-                    judge_count=len(judge_ids),
+                    judge_count=len(active_scores),
                     expected_count=active_judge_count
                 ))
             
-            # Check for score deviations (only if we have multiple scores to compare)
-            if len(active_scores) >= 2:
-                # Calculate average final score
-                final_scores = [s.get("final_score", 0) for s in active_scores]
-                avg_score = sum(final_scores) / len(final_scores)
+            # Check for score deviations (computed above for all groups at once)
+            for score in active_scores:
+                flagged = deviations.get(score.get("id"))
+                if not flagged:
+                    continue
                 
-                # Check each score against the average
-                for score in active_scores:
-                    # Skip if already acknowledged
-                    if score.get("deviation_acknowledged", False):
-                        continue
-                    
-                    score_value = score.get("final_score", 0)
-                    deviation = abs(score_value - avg_score)
-                    
-                    if deviation > deviation_threshold:
-                        judge_name = active_judge_map.get(score["judge_id"], "Unknown")
-                        errors.append(ScoringError(
-                            round_id=round_id,
-                            round_name=round_name,
-                            competitor_id=comp_id,
-                            competitor_name=competitor.get("name", "Unknown"),
-                            car_number=competitor.get("car_number", "?"),
-                            error_type="score_deviation",
-                            details=f"{judge_name}'s score ({score_value}) deviates {deviation:.1f} pts from average ({avg_score:.1f})",
-                            judge_count=len(active_scores),
-                            expected_count=active_judge_count,
-                            score_id=score.get("id"),
-                            judge_name=judge_name,
-                            deviation_amount=deviation
-                        ))
+                judge_name = active_judge_map.get(score["judge_id"], "Unknown")
+                if flagged["category"]:
+                    what = f"{flagged['category']} ({flagged['value']:g})"
+                else:
+                    what = f"score ({score.get('final_score', 0)})"
+                errors.append(ScoringError(
+                    round_id=round_id,
+                    round_name=round_name,
+                    competitor_id=comp_id,
+                    competitor_name=competitor.get("name", "Unknown"),
+                    car_number=competitor.get("car_number", "?"),
+                    error_type="score_deviation",
+                    details=f"{judge_name}'s {what} deviates {flagged['deviation']:.1f} pts from {reference_name} ({flagged['reference']:.1f})",
+                    judge_count=len(active_scores),
+                    expected_count=active_judge_count,
+                    score_id=score.get("id"),
+                    judge_name=judge_name,
+                    deviation_amount=flagged["deviation"]
+                ))
     
     return errors
 
+# Scoring error registry
+# scoring_errors holds one document per (round, competitor) that currently has errors,
+# so the admin panel reads the list with an indexed lookup. Score writes and
+# acknowledgements refresh their pair; round and competitor changes refresh that
+# round/competitor; changes to the judge set, judge names or the threshold refresh
+# everything. POST /admin/scoring-errors/rebuild repairs any drift.
+#
+# Refreshes are not serialized: several can run at once, in this process or in other
+# workers. Each one takes a number from a shared counter before reading, stamps the
+# rows it writes with it, and only replaces or deletes rows stamped by a refresh that
+# started earlier - so a slow full refresh never blocks score writes and never drops
+# rows that a newer refresh wrote.
+async def next_refresh_seq(name: str) -> int:
+    """Cluster-wide increasing number for one refresh of a derived collection"""
+    counter = await db.change_versions.find_one_and_update(
+        {"key": f"refresh:{name}"},
+        {"$inc": {"version": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return counter["version"]
+
+async def write_refreshed_rows(collection, key_fields: tuple, scope: dict, rows: List[dict], refresh_seq: int):
+    """Replace the rows in scope with `rows`, leaving anything a later refresh wrote"""
+    older = {"refresh_seq": {"$not": {"$gte": refresh_seq}}}  # Also matches unstamped rows
+    for row in rows:
+        key = {field: row[field] for field in key_fields}
+        try:
+            await collection.replace_one({**key, **older}, {**row, "refresh_seq": refresh_seq}, upsert=True)
+        except DuplicateKeyError:
+            pass  # A newer refresh already wrote this pair
+    await collection.delete_many({**scope, **older})
+
+def refresh_scope(round_id: Optional[str], competitor_id: Optional[str], competitor_ids: Optional[List[str]]) -> dict:
+    """Query selecting the (round, competitor) pairs a refresh covers"""
+    scope = {k: v for k, v in (("round_id", round_id), ("competitor_id", competitor_id)) if v}
+    if competitor_ids is not None:
+        scope["competitor_id"] = {"$in": list(competitor_ids)}
+    return scope
+
+async def refresh_scoring_errors(round_id: Optional[str] = None, competitor_id: Optional[str] = None,
+                                 competitor_ids: Optional[List[str]] = None) -> int:
+    """Recompute registry entries for one pair, several competitors in a round, one round,
+    one competitor, or (no arguments) every pair. Returns the number of (round,
+    competitor) entries with errors."""
+    scope = refresh_scope(round_id, competitor_id, competitor_ids)
+    refresh_seq = await next_refresh_seq("scoring_errors")
+    deviation_settings = await db.settings.find_one({"key": "score_deviation"}, {"_id": 0}) or {}
+    active_judges = await db.users.find(
+        {"role": "judge", "is_active": {"$ne": False}},
+        {"_id": 0, "id": 1, "name": 1}
+    ).to_list(100)
+    round_query = {"round_status": "active", **({"id": round_id} if round_id else {})}
+    rounds = await db.rounds.find(round_query, {"_id": 0, "id": 1, "name": 1}).to_list(100)
+
+    entries = {}
+    if active_judges and rounds:
+        score_query = {**scope, "round_id": {"$in": [r["id"] for r in rounds]}}
+        scores = await db.scores.find(
+            score_query,
+            {"_id": 0, "id": 1, "round_id": 1, "competitor_id": 1, "judge_id": 1, "final_score": 1,
+             "deviation_acknowledged": 1, "submitted_at": 1, **{field: 1 for _, field, _ in SCORE_CATEGORIES}}
+        ).to_list(None)
+        first_seen = {}
+        for score in scores:
+            key = (score["round_id"], score["competitor_id"])
+            first_seen[key] = min(first_seen.get(key, score["submitted_at"]), score["submitted_at"])
+        competitors = await db.competitors.find(
+            {"id": {"$in": list({s["competitor_id"] for s in scores})}},
+            {"_id": 0, "id": 1, "name": 1, "car_number": 1}
+        ).to_list(None)
+
+        for error in detect_scoring_errors(
+            rounds, scores, active_judges, {c["id"]: c for c in competitors},
+            deviation_settings.get("threshold", 5),
+            deviation_settings.get("mode", "mean"),
+            deviation_settings.get("mad_multiplier", 3.0)
+        ):
+            key = (error.round_id, error.competitor_id)
+            entry = entries.setdefault(key, {
+                "round_id": error.round_id,
+                "competitor_id": error.competitor_id,
+                "first_seen": first_seen[key],
+                "errors": []
+            })
+            entry["errors"].append(error.model_dump())
+
+    # Entries in scope whose errors are gone are dropped
+    now = datetime.now(timezone.utc).isoformat()
+    await write_refreshed_rows(
+        db.scoring_errors, ("round_id", "competitor_id"), scope,
+        [{**entry, "updated_at": now} for entry in entries.values()], refresh_seq
+    )
+    return len(entries)
+
 # Score deviation settings
 @api_router.get("/admin/settings/score-deviation")
 async def get_score_deviation_settings(admin: User = Depends(require_admin)):
     """Get score deviation threshold setting"""
-    settings = await db.settings.find_one({"key": "score_deviation"}, {"_id": 0})
-    return {"threshold": settings.get("threshold", 5) if settings else 5}
+    settings = await db.settings.find_one({"key": "score_deviation"}, {"_id": 0}) or {}
+    return {
+        "threshold": settings.get("threshold", 5),
+        "mode": settings.get("mode", "mean"),
+        "mad_multiplier": settings.get("mad_multiplier", 3.0),
+        "modes": SCORE_DEVIATION_MODES
+    }
 
 @api_router.put("/admin/settings/score-deviation")
-async def update_score_deviation_settings(threshold: float, admin: User = Depends(require_admin)):
-    """Update score deviation threshold setting"""
+async def update_score_deviation_settings(
+    threshold: float,
+    mode: Optional[str] = None,
+    mad_multiplier: Optional[float] = None,
+    admin: User = Depends(require_admin)
+):
+    """Update score deviation threshold setting (and optionally the comparison mode).
+    Modes: mean / median of every judge's final score for the pair (including the score
+    being checked), mad (median with a spread-widened threshold), per_category."""
     if threshold < 0:
         raise HTTPException(status_code=400, detail="Threshold must be positive")
-    
-    await db.settings.update_one(
+    if mode is not None and mode not in SCORE_DEVIATION_MODES:
+        raise HTTPException(status_code=400, detail=f"Mode must be one of: {', '.join(SCORE_DEVIATION_MODES)}")
+    if mad_multiplier is not None and mad_multiplier <= 0:
+        raise HTTPException(status_code=400, detail="MAD multiplier must be positive")
+    
+    update = {"key": "score_deviation", "threshold": threshold}
+    if mode is not None:
+        update["mode"] = mode
+    if mad_multiplier is not None:
+        update["mad_multiplier"] = mad_multiplier
+    settings = await db.settings.find_one_and_update(
         {"key": "score_deviation"},
-        {"$set": {"key": "score_deviation", "threshold": threshold}},
+        {"$set": update},
+        projection={"_id": 0},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    await refresh_scoring_errors()
+    return {
+        "threshold": threshold,
+        "mode": settings.get("mode", "mean"),
+        "mad_multiplier": settings.get("mad_multiplier", 3.0),
+        "message": "Threshold updated"
+    }
+
+# Password hashing settings
+async def save_bcrypt_calibration(target_ms: float) -> dict:
+    calibration = await password_hasher.calibrate(target_ms)
+    await db.settings.update_one(
+        {"key": "bcrypt"},
+        {"$set": {"key": "bcrypt", **calibration}},
         upsert=True
     )
-    return {"threshold": threshold, "message": "Threshold updated"}
+    password_hasher.set_rounds(calibration["rounds"])
+    return calibration
+
+@api_router.get("/admin/settings/bcrypt")
+async def get_bcrypt_settings(admin: User = Depends(require_admin)):
+    """Get the calibrated bcrypt cost in use"""
+    settings = await db.settings.find_one({"key": "bcrypt"}, {"_id": 0, "key": 0})
+    return {**(settings or {}), "rounds": await password_hasher.target_rounds()}
+
+@api_router.post("/admin/settings/bcrypt/calibrate")
+async def calibrate_bcrypt_settings(target_ms: Optional[float] = None, admin: User = Depends(require_admin)):
+    """Re-measure hash time on this host and pick a new bcrypt cost. Existing
+    passwords are rehashed to the new cost the next time each user logs in."""
+    target_ms = target_ms if target_ms is not None else BCRYPT_TARGET_MS
+    if target_ms <= 0:
+        raise HTTPException(status_code=400, detail="Target must be positive")
+    calibration = await save_bcrypt_calibration(target_ms)
+    return {**calibration, "message": f"bcrypt cost set to {calibration['rounds']}"}
 
 @api_router.post("/admin/scores/{score_id}/acknowledge-deviation")
 async def acknowledge_score_deviation(score_id: str, admin: User = Depends(require_admin)):
     """Mark a score's deviation as acknowledged/reviewed"""
-    result = await db.scores.update_one(
+    score = await db.scores.find_one_and_update(
         {"id": score_id},
-        {"$set": {"deviation_acknowledged": True}}
+        {"$set": {"deviation_acknowledged": True}},
+        projection={"_id": 0, "round_id": 1, "competitor_id": 1}
     )
-    if result.matched_count == 0:
+    if not score:
         raise HTTPException(status_code=404, detail="Score not found")
+    await refresh_scoring_errors(score["round_id"], score["competitor_id"])
     return {"message": "Score deviation acknowledged"}
 
 @api_router.post("/admin/scores/{score_id}/unacknowledge-deviation")
 async def unacknowledge_score_deviation(score_id: str, admin: User = Depends(require_admin)):
     """Remove acknowledgment from a score's deviation"""
-    result = await db.scores.update_one(
+    score = await db.scores.find_one_and_update(
         {"id": score_id},
-        {"$set": {"deviation_acknowledged": False}}
+        {"$set": {"deviation_acknowledged": False}},
+        projection={"_id": 0, "round_id": 1, "competitor_id": 1}
     )
-    if result.matched_count == 0:
+    if not score:
         raise HTTPException(status_code=404, detail="Score not found")
+    await refresh_scoring_errors(score["round_id"], score["competitor_id"])
     return {"message": "Score deviation acknowledgment removed"}
 
 # Admin - Class management
 @api_router.get("/admin/classes", response_model=List[CompetitionClass])
-async def get_classes(current_user: User = Depends(get_current_user)):
+async def get_classes(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    not_modified = await check_etag(request, response, ["classes"])
+    if not_modified:
+        return not_modified
     classes = await db.classes.find({}, {"_id": 0}).to_list(1000)
     for cls in classes:
         if isinstance(cls.get('created_at'), str):
@@ -563,6 +1170,7 @@ async def create_class(class_create: CompetitionClassCreate, admin: User = Depen
     doc = comp_class.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     await db.classes.insert_one(doc)
+    await bump_versions("classes")
     return comp_class
 
 @api_router.put("/admin/classes/{class_id}", response_model=CompetitionClass)
@@ -573,6 +1181,7 @@ async def update_class(class_id: str, class_update: CompetitionClassCreate, admi
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Class not found")
+    await bump_versions("classes")
     
     updated = await db.classes.find_one({"id": class_id}, {"_id": 0})
     if isinstance(updated.get('created_at'), str):
@@ -584,11 +1193,15 @@ async def delete_class(class_id: str, admin: User = Depends(require_admin)):
     result = await db.classes.delete_one({"id": class_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Class not found")
+    await bump_versions("classes")
     return {"message": "Class deleted"}
 
 # Admin - Competitor management
 @api_router.get("/admin/competitors", response_model=List[CompetitorWithClass])
-async def get_competitors(current_user: User = Depends(get_current_user)):
+async def get_competitors(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    not_modified = await check_etag(request, response, ["competitors", "classes"])
+    if not_modified:
+        return not_modified
     competitors = await db.competitors.find({}, {"_id": 0}).to_list(1000)
     classes_dict = {}
     classes = await db.classes.find({}, {"_id": 0}).to_list(1000)
@@ -611,60 +1224,258 @@ async def create_competitor(competitor_create: CompetitorCreate, admin: User = D
     doc = competitor.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     await db.competitors.insert_one(doc)
+    await bump_versions("competitors")
     return competitor
 
-@api_router.post("/admin/competitors/bulk")
-@limiter.limit("2/minute")
-async def bulk_import_competitors(request: Request, admin: User = Depends(require_admin)):
+# Background jobs
+# Long-running admin work runs as an asyncio task that records its status, progress
+# and result in db.jobs; clients poll GET /admin/jobs/{job_id}. Finished jobs get a
+# finished_at date and a TTL index removes them JOB_RETENTION_SECONDS later.
+JOB_RETENTION_SECONDS = int(os.environ.get('JOB_RETENTION_SECONDS', str(7 * 24 * 3600)))
+background_jobs = {}  # job_id -> task; strong references so running tasks are not garbage collected
+
+async def create_job(job_type: str, **fields) -> str:
+    """Record a queued job and return its id"""
+    now = datetime.now(timezone.utc).isoformat()
+    job_id = str(uuid.uuid4())
+    await db.jobs.insert_one({
+        "id": job_id,
+        "type": job_type,
+        "status": "queued",
+        "progress": 0.0,
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+        **fields
+    })
+    return job_id
+
+async def update_job(job_id: str, **fields):
+    await db.jobs.update_one(
+        {"id": job_id},
+        {"$set": {**fields, "updated_at": datetime.now(timezone.utc).isoformat()}}
+    )
+
+def start_job(job_id: str, work, lock: Optional[asyncio.Lock] = None):
+    """Run the `work` coroutine in the background; its return value becomes the job result.
+    Jobs sharing a lock run one at a time, staying queued until their turn."""
+    async def execute():
+        await update_job(job_id, status="running")
+        try:
+            result = await work
+        except Exception as e:
+            logger.exception(f"Job {job_id} failed")
+            await update_job(job_id, status="failed", error=str(e), finished_at=datetime.now(timezone.utc))
+        else:
+            await update_job(job_id, status="completed", progress=1.0, result=result,
+                             finished_at=datetime.now(timezone.utc))
+
+    async def run():
+        try:
+            if lock is None:
+                await execute()
+                return
+            async with lock:
+                await execute()
+        except asyncio.CancelledError:
+            work.close()  # Never started if the job was cancelled while queued
+            await update_job(job_id, status="cancelled", error="Cancelled", finished_at=datetime.now(timezone.utc))
+
+    task = asyncio.create_task(run())
+    background_jobs[job_id] = task
+    task.add_done_callback(lambda _: background_jobs.pop(job_id, None))
+
+@api_router.get("/admin/jobs/{job_id}")
+async def get_job(job_id: str, admin: User = Depends(require_admin)):
+    """Status, progress and (once finished) result or error of a background job"""
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@api_router.post("/admin/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str, admin: User = Depends(require_admin)):
+    """Cancel a queued or running job. Work it already finished is kept (e.g. emails
+    already sent stay in the job's sent list)."""
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0, "status": 1})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    task = background_jobs.get(job_id)
+    if task is None:
+        raise HTTPException(status_code=400, detail=f"Job is not running (status: {job['status']})")
+    task.cancel()
+    return {"message": "Job cancellation requested"}
+
+# Competitor CSV import
+# The upload is spooled to a temporary file (in memory up to 1 MB, then on disk) and
+# parsed row by row; valid rows are written BULK_IMPORT_BATCH_SIZE at a time.
+# Uploads larger than BULK_IMPORT_BACKGROUND_BYTES run as a background job.
+BULK_IMPORT_BATCH_SIZE = int(os.environ.get("BULK_IMPORT_BATCH_SIZE", "500"))
+BULK_IMPORT_BACKGROUND_BYTES = int(os.environ.get("BULK_IMPORT_BACKGROUND_BYTES", str(256 * 1024)))
+BULK_IMPORT_MAX_REPORTED_ERRORS = 1000
+
+async def spool_request_body(request: Request):
+    """Copy the request body into a temporary file without holding it all in memory"""
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    return spool
+
+def parse_competitor_row(row: dict, class_name_to_id: dict, class_id_set: set):
+    """Validate one CSV row. Returns (competitor document, None) or (None, error)"""
+    def field(name):
+        return (row.get(name) or '').strip()
+
+    class_value = field('class_id') or field('class') or field('class_name')
+    
+    # Try to resolve class - accept either ID or name
+    resolved_class_id = None
+    if class_value:
+        if class_value in class_id_set:
+            # It's already a valid class ID
+            resolved_class_id = class_value
+        elif class_value.lower() in class_name_to_id:
+            # It's a class name - look up the ID
+            resolved_class_id = class_name_to_id[class_value.lower()]
+        else:
+            return None, f"Unknown class '{class_value}'"
+    if not field('name'):
+        return None, "Missing name"
+    if not field('car_number'):
+        return None, "Missing car_number"
+    
+    competitor = Competitor(
+        name=field('name'),
+        car_number=field('car_number'),
+        vehicle_info=field('vehicle_info'),
+        plate=field('plate'),
+        class_id=resolved_class_id or '',
+        email=field('email')
+    )
+    doc = competitor.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    return doc, None
+
+async def write_competitor_batch(docs: List[dict], upsert: bool, dry_run: bool, report: dict):
+    """Insert (or upsert on car_number) one batch; in a dry run only count what would happen.
+    Blank fields in an upserted row keep the existing competitor's value."""
+    if not upsert:
+        if not dry_run:
+            await db.competitors.insert_many(docs, ordered=False)
+        report["inserted"] += len(docs)
+        return
+    
+    if dry_run:
+        existing = await db.competitors.find(
+            {"car_number": {"$in": [d["car_number"] for d in docs]}}, {"_id": 0, "car_number": 1}
+        ).to_list(None)
+        existing_numbers = {c["car_number"] for c in existing}
+        updated = sum(1 for d in docs if d["car_number"] in existing_numbers)
+        report["updated"] += updated
+        report["inserted"] += len(docs) - updated
+        return
+    
+    result = await db.competitors.bulk_write([
+        UpdateOne(
+            {"car_number": d["car_number"]},
+            {
+                "$set": {k: v for k, v in d.items() if k not in ("id", "created_at") and v != ""},
+                "$setOnInsert": {k: v for k, v in d.items() if k in ("id", "created_at") or v == ""}
+            },
+            upsert=True
+        )
+        for d in docs
+    ], ordered=False)
+    report["inserted"] += result.upserted_count
+    report["updated"] += result.matched_count
+
+async def import_competitors_csv(spool, upsert: bool, dry_run: bool, job_id: Optional[str] = None) -> dict:
+    """Parse and write the spooled CSV, returning a row-level report. With a job_id,
+    progress (fraction of the file read) is recorded on the job after every batch."""
     try:
-        csv_data = await request.body()
-        csv_data = csv_data.decode('utf-8')
-        csv_file = io.StringIO(csv_data)
-        reader = csv.DictReader(csv_file)
-        imported = 0
-        errors = []
+        total_bytes = max(spool.tell(), 1)
+        spool.seek(0)
         
         # Get all classes for name-to-id lookup
-        classes = await db.classes.find({}, {"_id": 0}).to_list(1000)
+        classes = await db.classes.find({}, {"_id": 0, "id": 1, "name": 1}).to_list(1000)
         class_name_to_id = {c["name"].lower(): c["id"] for c in classes}
         class_id_set = {c["id"] for c in classes}
         
+        report = {"dry_run": dry_run, "upsert": upsert, "rows": 0, "inserted": 0, "updated": 0,
+                  "error_count": 0, "errors": []}
+        first_row_for_car = {}
+        batch = []
+        reader = csv.DictReader(io.TextIOWrapper(spool, encoding="utf-8-sig", newline=""))
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-            class_value = row.get('class_id', '').strip() or row.get('class', '').strip() or row.get('class_name', '').strip()
-            
-            # Try to resolve class - accept either ID or name
-            resolved_class_id = None
-            if class_value:
-                if class_value in class_id_set:
-                    # It's already a valid class ID
-                    resolved_class_id = class_value
-                elif class_value.lower() in class_name_to_id:
-                    # It's a class name - look up the ID
-                    resolved_class_id = class_name_to_id[class_value.lower()]
-                else:
-                    errors.append(f"Row {row_num}: Unknown class '{class_value}'")
-                    continue
+            report["rows"] += 1
+            doc, error = parse_competitor_row(row, class_name_to_id, class_id_set)
+            if doc and upsert:
+                first_row = first_row_for_car.setdefault(doc["car_number"], row_num)
+                if first_row != row_num:
+                    doc, error = None, f"Duplicate car_number '{row['car_number'].strip()}' (first on row {first_row})"
+            if error:
+                report["error_count"] += 1
+                if len(report["errors"]) < BULK_IMPORT_MAX_REPORTED_ERRORS:
+                    report["errors"].append({"row": row_num, "error": error})
+                continue
             
-            competitor = Competitor(
-                name=row.get('name', ''),
-                car_number=row.get('car_number', ''),
-                vehicle_info=row.get('vehicle_info', ''),
-                plate=row.get('plate', ''),
-                class_id=resolved_class_id or '',
-                email=row.get('email', '').strip()
-            )
-            doc = competitor.model_dump()
-            doc['created_at'] = doc['created_at'].isoformat()
-            await db.competitors.insert_one(doc)
-            imported += 1
-        
-        message = f"Imported {imported} competitors"
-        if errors:
-            message += f". Errors: {'; '.join(errors[:5])}"
-            if len(errors) > 5:
-                message += f" (+{len(errors) - 5} more)"
-        
-        return {"message": message}
+            batch.append(doc)
+            if len(batch) >= BULK_IMPORT_BATCH_SIZE:
+                await write_competitor_batch(batch, upsert, dry_run, report)
+                batch = []
+                if job_id:
+                    await update_job(job_id, progress=round(min(spool.tell() / total_bytes, 1.0), 3),
+                                     processed_rows=report["rows"])
+        if batch:
+            await write_competitor_batch(batch, upsert, dry_run, report)
+    finally:
+        spool.close()
+    
+    if not dry_run and (report["inserted"] or report["updated"]):
+        await bump_versions("competitors")
+        if report["updated"]:
+            # Renamed competitors show up in scoring error details
+            await refresh_scoring_errors()
+    
+    if dry_run:
+        message = f"Dry run: {report['inserted']} would be imported"
+        if upsert:
+            message += f", {report['updated']} updated"
+    else:
+        message = f"Imported {report['inserted']} competitors"
+        if upsert:
+            message += f", updated {report['updated']}"
+    if report["errors"]:
+        shown = [f"Row {e['row']}: {e['error']}" for e in report["errors"][:5]]
+        message += f". Errors: {'; '.join(shown)}"
+        if report["error_count"] > 5:
+            message += f" (+{report['error_count'] - 5} more)"
+    report["message"] = message
+    return report
+
+@api_router.post("/admin/competitors/bulk")
+@limiter.limit("2/minute")
+async def bulk_import_competitors(
+    request: Request,
+    response: Response,
+    upsert: bool = False,
+    dry_run: bool = False,
+    admin: User = Depends(require_admin)
+):
+    """Import competitors from CSV (name,car_number,vehicle_info,plate,class_name,email).
+    upsert=true updates competitors with the same car_number instead of adding duplicates;
+    dry_run=true validates every row and reports what would happen without writing.
+    Large uploads return 202 with a job_id to poll at /admin/jobs/{job_id}."""
+    spool = await spool_request_body(request)
+    if spool.tell() > BULK_IMPORT_BACKGROUND_BYTES:
+        job_id = await create_job("competitor_import", processed_rows=0)
+        start_job(job_id, import_competitors_csv(spool, upsert, dry_run, job_id))
+        response.status_code = 202
+        return {"message": "Import started", "job_id": job_id}
+    
+    try:
+        return await import_competitors_csv(spool, upsert, dry_run)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Import failed: {str(e)}")
 
@@ -676,6 +1487,8 @@ async def update_competitor(competitor_id: str, competitor_update: CompetitorCre
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Competitor not found")
+    await bump_versions("competitors")
+    await refresh_scoring_errors(competitor_id=competitor_id)
     
     updated = await db.competitors.find_one({"id": competitor_id}, {"_id": 0})
     if isinstance(updated.get('created_at'), str):
@@ -690,6 +1503,8 @@ async def update_competitor(competitor_id: str, competitor_update: CompetitorCre
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Competitor not found")
+    await bump_versions("competitors")
+    await refresh_scoring_errors(competitor_id=competitor_id)
     
     updated = await db.competitors.find_one({"id": competitor_id}, {"_id": 0})
     if isinstance(updated.get('created_at'), str):
@@ -701,11 +1516,16 @@ async def delete_competitor(competitor_id: str, admin: User = Depends(require_ad
     result = await db.competitors.delete_one({"id": competitor_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Competitor not found")
+    await bump_versions("competitors")
+    await refresh_scoring_errors(competitor_id=competitor_id)
     return {"message": "Competitor deleted"}
 
 # Admin - Event management
 @api_router.get("/admin/events", response_model=List[Event])
-async def get_events(current_user: User = Depends(get_current_user)):
+async def get_events(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    not_modified = await check_etag(request, response, ["events"])
+    if not_modified:
+        return not_modified
     events = await db.events.find({}, {"_id": 0}).to_list(1000)
     for evt in events:
         if isinstance(evt.get('created_at'), str):
@@ -718,6 +1538,7 @@ async def create_event(event_create: EventCreate, admin: User = Depends(require_
     doc = event_obj.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     await db.events.insert_one(doc)
+    await bump_versions("events")
     return event_obj
 
 @api_router.put("/admin/events/{event_id}", response_model=Event)
@@ -728,6 +1549,7 @@ async def update_event(event_id: str, event_update: EventCreate, admin: User = D
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Event not found")
+    await bump_versions("events")
     
     updated = await db.events.find_one({"id": event_id}, {"_id": 0})
     if isinstance(updated.get('created_at'), str):
@@ -739,11 +1561,15 @@ async def delete_event(event_id: str, admin: User = Depends(require_admin)):
     result = await db.events.delete_one({"id": event_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Event not found")
+    await bump_versions("events")
     return {"message": "Event deleted"}
 
 # Admin - Round management
 @api_router.get("/admin/rounds", response_model=List[Round])
-async def get_rounds(current_user: User = Depends(get_current_user)):
+async def get_rounds(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    not_modified = await check_etag(request, response, ["rounds"])
+    if not_modified:
+        return not_modified
     rounds = await db.rounds.find({}, {"_id": 0}).to_list(1000)
     for rnd in rounds:
         if isinstance(rnd.get('created_at'), str):
@@ -756,6 +1582,8 @@ async def create_round(round_create: RoundCreate, admin: User = Depends(require_
     doc = round_obj.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     await db.rounds.insert_one(doc)
+    # Start the round's scores counter so its leaderboard is cacheable from the first poll
+    await bump_versions("rounds", f"scores:{round_obj.id}")
     return round_obj
 
 @api_router.put("/admin/rounds/{round_id}", response_model=Round)
@@ -766,6 +1594,8 @@ async def update_round(round_id: str, round_update: RoundCreate, admin: User = D
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Round not found")
+    await bump_versions("rounds")
+    await refresh_scoring_errors(round_id=round_id)
     
     updated = await db.rounds.find_one({"id": round_id}, {"_id": 0})
     if isinstance(updated.get('created_at'), str):
@@ -777,11 +1607,91 @@ async def delete_round(round_id: str, admin: User = Depends(require_admin)):
     result = await db.rounds.delete_one({"id": round_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Round not found")
+    await bump_versions("rounds")
+    await refresh_scoring_errors(round_id=round_id)
     return {"message": "Round deleted"}
 
+# Materialized leaderboard
+# leaderboard_summary holds one row per (round, competitor) with total_score and
+# score_count. Every score write applies its delta here with a single $inc so
+# leaderboard reads never have to regroup the raw scores. Averages are not stored:
+# build_leaderboard_pipeline divides at read time, so no read ever sees a row whose
+# average lags its totals. Rows whose count reached 0 are deleted; until then reads
+# skip them.
+async def apply_leaderboard_delta(round_id: str, competitor_id: str, total_delta: float, count_delta: int):
+    """Atomically apply a score change to the competitor's leaderboard row"""
+    await apply_leaderboard_deltas([(round_id, competitor_id, total_delta, count_delta)])
+
+async def apply_leaderboard_deltas(changes: List[tuple]):
+    """apply_leaderboard_delta for many (round_id, competitor_id, total_delta, count_delta)
+    changes with distinct pairs: one bulk $inc, then one bulk delete of emptied rows"""
+    now = datetime.now(timezone.utc).isoformat()
+    await db.leaderboard_summary.bulk_write([
+        UpdateOne(
+            {"round_id": round_id, "competitor_id": competitor_id},
+            {"$inc": {"total_score": total_delta, "score_count": count_delta}, "$set": {"updated_at": now}},
+            upsert=True
+        )
+        for round_id, competitor_id, total_delta, count_delta in changes
+    ], ordered=False)
+    # Only removals can empty a row; the count guard leaves it if a newer insert landed
+    emptied = [
+        DeleteOne({"round_id": round_id, "competitor_id": competitor_id, "score_count": {"$lte": 0}})
+        for round_id, competitor_id, _, count_delta in changes if count_delta < 0
+    ]
+    if emptied:
+        await db.leaderboard_summary.bulk_write(emptied, ordered=False)
+
+async def record_score_change(round_id: str, competitor_id: str, total_delta: float, count_delta: int):
+    """Run every derived-data update for a score insert, edit or delete"""
+    await record_score_changes([(round_id, competitor_id, total_delta, count_delta)])
+
+async def record_score_changes(changes: List[tuple]):
+    """record_score_change for many (round_id, competitor_id, total_delta, count_delta)
+    changes with distinct pairs, e.g. a batch sync: the leaderboard deltas go out in bulk
+    and versions and derived collections are refreshed once per round"""
+    competitors_by_round = {}
+    for round_id, competitor_id, _, _ in changes:
+        competitors_by_round.setdefault(round_id, []).append(competitor_id)
+    await apply_leaderboard_deltas(changes)
+    await bump_versions("scores", *[f"scores:{round_id}" for round_id in competitors_by_round])
+    for round_id, competitor_ids in competitors_by_round.items():
+        await refresh_scoring_errors(round_id, competitor_ids=competitor_ids)
+        await refresh_round_completeness(round_id, competitor_ids=competitor_ids)
+
+async def rebuild_leaderboard_summary() -> int:
+    """Recompute leaderboard_summary from the raw scores, replacing it in one $out"""
+    await db.scores.aggregate([
+        {"$group": {
+            "_id": {"round_id": "$round_id", "competitor_id": "$competitor_id"},
+            "total_score": {"$sum": {"$ifNull": ["$final_score", 0]}},
+            "score_count": {"$sum": 1}
+        }},
+        {"$project": {
+            "_id": 0,
+            "round_id": "$_id.round_id",
+            "competitor_id": "$_id.competitor_id",
+            "total_score": 1,
+            "score_count": 1,
+            "updated_at": {"$literal": datetime.now(timezone.utc).isoformat()}
+        }},
+        {"$out": "leaderboard_summary"}
+    ]).to_list(None)
+    return await db.leaderboard_summary.count_documents({})
+
+@api_router.post("/admin/leaderboard/rebuild")
+async def rebuild_leaderboard(admin: User = Depends(require_admin)):
+    """Rebuild the materialized leaderboard from scores (use if it falls out of sync)"""
+    row_count = await rebuild_leaderboard_summary()
+    await bump_all_score_versions()
+    return {"message": f"Leaderboard rebuilt ({row_count} rows)", "rows": row_count}
+
 # Judge - Scoring
 @api_router.get("/judge/competitors/{round_id}", response_model=List[CompetitorWithClass])
-async def get_competitors_for_round(round_id: str, current_user: User = Depends(get_current_user)):
+async def get_competitors_for_round(round_id: str, request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    not_modified = await check_etag(request, response, ["competitors", "classes"])
+    if not_modified:
+        return not_modified
     competitors = await db.competitors.find({}, {"_id": 0}).to_list(1000)
     classes_dict = {}
     classes = await db.classes.find({}, {"_id": 0}).to_list(1000)
@@ -798,34 +1708,55 @@ async def get_competitors_for_round(round_id: str, current_user: User = Depends(
         ))
     return result
 
-@api_router.post("/judge/scores", response_model=Score)
-@limiter.limit("10/minute")
-async def submit_score(request: Request, score_create: ScoreCreate, current_user: User = Depends(get_current_user)):
-    # Calculate scores
+def calculate_score_totals(values: dict):
+    """Subtotal, penalty total and final score for a score's category values"""
     score_subtotal = (
-        score_create.tip_in +
-        score_create.instant_smoke +
-        score_create.constant_smoke +
-        score_create.volume_of_smoke +
-        score_create.driving_skill +
-        (score_create.tyres_popped * 5)
+        values.get("tip_in", 0) +
+        values.get("instant_smoke", 0) +
+        values.get("constant_smoke", 0) +
+        values.get("volume_of_smoke", 0) +
+        values.get("driving_skill", 0) +
+        (values.get("tyres_popped", 0) * 5)
     )
     
     # Calculate penalties (cumulative)
     penalty_total = (
-        (score_create.penalty_reversing * 5) +
-        (score_create.penalty_stopping * 5) +
-        (score_create.penalty_contact_barrier * 5) +
-        (score_create.penalty_small_fire * 5) +
-        (score_create.penalty_failed_drive_off * 10) +
-        (score_create.penalty_large_fire * 10)
+        (values.get("penalty_reversing", 0) * 5) +
+        (values.get("penalty_stopping", 0) * 5) +
+        (values.get("penalty_contact_barrier", 0) * 5) +
+        (values.get("penalty_small_fire", 0) * 5) +
+        (values.get("penalty_failed_drive_off", 0) * 10) +
+        (values.get("penalty_large_fire", 0) * 10)
     )
     
     # If disqualified, final score is 0
-    if score_create.penalty_disqualified:
+    if values.get("penalty_disqualified", False):
         final_score = 0
     else:
         final_score = max(0, score_subtotal - penalty_total)
+    return score_subtotal, penalty_total, final_score
+
+ALREADY_SCORED = "You have already scored this competitor in this round - edit the existing score instead"
+DUPLICATE_KEY_CODE = 11000
+
+async def find_replayed_score(judge_id: str, round_id: str, competitor_id: str, client_key: Optional[str]):
+    """The judge's stored score for the pair if it was written with the same client key"""
+    existing = await db.scores.find_one(
+        {"judge_id": judge_id, "round_id": round_id, "competitor_id": competitor_id}, {"_id": 0}
+    )
+    if existing and client_key and existing.get("client_key") == client_key:
+        return existing
+    return None
+
+@api_router.post("/judge/scores", response_model=Score)
+@limiter.limit("10/minute")
+async def submit_score(request: Request, score_create: ScoreCreate, current_user: User = Depends(get_current_user)):
+    """Submit a score. Each judge scores a competitor once per round (unique index);
+    a retry carrying the same client_key (body or Idempotency-Key header) returns
+    the stored score instead of failing."""
+    if not score_create.client_key:
+        score_create.client_key = request.headers.get("Idempotency-Key")
+    score_subtotal, penalty_total, final_score = calculate_score_totals(score_create.model_dump())
     
     score = Score(
         judge_id=current_user.id,
@@ -838,9 +1769,146 @@ async def submit_score(request: Request, score_create: ScoreCreate, current_user
     
     doc = score.model_dump()
     doc['submitted_at'] = doc['submitted_at'].isoformat()
-    await db.scores.insert_one(doc)
+    try:
+        await db.scores.insert_one(doc)
+    except DuplicateKeyError:
+        replayed = await find_replayed_score(current_user.id, score.round_id, score.competitor_id, score.client_key)
+        if replayed:
+            return Score(**replayed)
+        raise HTTPException(status_code=409, detail=ALREADY_SCORED)
+    await record_score_change(score.round_id, score.competitor_id, score.final_score, 1)
     return score
 
+# Batch submission for tablets that queued scores while offline
+SCORE_BATCH_MAX = 50
+
+class ScoreBatch(BaseModel):
+    scores: List[dict]  # ScoreCreate items, validated one by one so a bad item does not sink the batch
+
+@api_router.post("/judge/scores/batch")
+@limiter.limit("10/minute")
+async def submit_score_batch(request: Request, batch: ScoreBatch, current_user: User = Depends(get_current_user)):
+    """Submit up to SCORE_BATCH_MAX scores in one request. Each item is validated and
+    scored like POST /judge/scores; valid items are written with one insert_many.
+    Returns one result per item, in request order."""
+    if len(batch.scores) > SCORE_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {SCORE_BATCH_MAX} scores per batch")
+    
+    results = [None] * len(batch.scores)
+    parsed = []
+    for index, item in enumerate(batch.scores):
+        try:
+            parsed.append((index, ScoreCreate.model_validate(item)))
+        except ValidationError as e:
+            error = e.errors()[0]
+            results[index] = {"index": index, "status": "error",
+                              "error": f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"}
+    
+    competitor_ids = {score_create.competitor_id for _, score_create in parsed}
+    round_ids = {score_create.round_id for _, score_create in parsed}
+    known_competitors = {c["id"] for c in await db.competitors.find(
+        {"id": {"$in": list(competitor_ids)}}, {"_id": 0, "id": 1}).to_list(None)}
+    known_rounds = {r["id"] for r in await db.rounds.find(
+        {"id": {"$in": list(round_ids)}}, {"_id": 0, "id": 1}).to_list(None)}
+    
+    # The judge's scores already stored for these pairs (replays of an earlier sync)
+    stored = {
+        (s["round_id"], s["competitor_id"]): s
+        for s in await db.scores.find(
+            {"judge_id": current_user.id, "round_id": {"$in": list(round_ids)},
+             "competitor_id": {"$in": list(competitor_ids)}},
+            {"_id": 0}
+        ).to_list(None)
+    }
+    
+    scores = []
+    seen_pairs = {}
+    for index, score_create in parsed:
+        pair = (score_create.round_id, score_create.competitor_id)
+        if score_create.competitor_id not in known_competitors:
+            error = "Competitor not found"
+        elif score_create.round_id not in known_rounds:
+            error = "Round not found"
+        elif pair in seen_pairs:
+            error = f"Duplicate of item {seen_pairs[pair]}"
+        elif pair in stored:
+            existing = stored[pair]
+            if score_create.client_key and existing.get("client_key") == score_create.client_key:
+                seen_pairs[pair] = index
+                results[index] = {"index": index, "status": "existing", "score": Score(**existing)}
+                continue
+            error = ALREADY_SCORED
+        else:
+            error = None
+        if error:
+            results[index] = {"index": index, "status": "error", "error": error}
+            continue
+        seen_pairs[pair] = index
+        
+        score_subtotal, penalty_total, final_score = calculate_score_totals(score_create.model_dump())
+        score = Score(
+            judge_id=current_user.id,
+            judge_name=current_user.name,
+            **score_create.model_dump(),
+            score_subtotal=score_subtotal,
+            penalty_total=penalty_total,
+            final_score=final_score
+        )
+        scores.append((index, score))
+        results[index] = {"index": index, "status": "created", "score": score}
+    
+    if scores:
+        docs = []
+        for _, score in scores:
+            doc = score.model_dump()
+            doc['submitted_at'] = doc['submitted_at'].isoformat()
+            docs.append(doc)
+        try:
+            await db.scores.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            write_errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+            duplicates = [scores[position][1] for position, error in write_errors.items()
+                          if error.get("code") == DUPLICATE_KEY_CODE]
+            # A concurrent request stored these pairs first - possibly a replay of the same item
+            replayed = {}
+            if duplicates:
+                replayed = {
+                    (s["round_id"], s["competitor_id"]): s
+                    for s in await db.scores.find(
+                        {"judge_id": current_user.id, "round_id": {"$in": list({d.round_id for d in duplicates})},
+                         "competitor_id": {"$in": list({d.competitor_id for d in duplicates})}},
+                        {"_id": 0}
+                    ).to_list(None)
+                }
+            for position, error in write_errors.items():
+                index, score = scores[position]
+                existing = replayed.get((score.round_id, score.competitor_id))
+                if error.get("code") != DUPLICATE_KEY_CODE:
+                    results[index] = {"index": index, "status": "error", "error": error.get("errmsg", "Write failed")}
+                elif existing and score.client_key and existing.get("client_key") == score.client_key:
+                    results[index] = {"index": index, "status": "existing", "score": Score(**existing)}
+                else:
+                    results[index] = {"index": index, "status": "error", "error": ALREADY_SCORED}
+            scores = [item for position, item in enumerate(scores) if position not in write_errors]
+            write_concern_errors = e.details.get("writeConcernErrors")
+            if write_concern_errors:
+                # The documents were written but not acknowledged as asked; the client sees
+                # a failure and a retry with the same client_key comes back as existing
+                message = write_concern_errors[0].get("errmsg", "Write concern failed")
+                for index, _ in scores:
+                    results[index] = {"index": index, "status": "error", "error": message}
+        # Pairs are unique within a batch; derived data is updated once per round
+        if scores:
+            await record_score_changes([(score.round_id, score.competitor_id, score.final_score, 1)
+                                        for _, score in scores])
+    
+    return {
+        "created": sum(1 for r in results if r["status"] == "created"),
+        "existing": sum(1 for r in results if r["status"] == "existing"),
+        "failed": sum(1 for r in results if r["status"] == "error"),
+        "results": results
+    }
+
 @api_router.get("/judge/scores", response_model=List[ScoreWithDetails])
 async def get_judge_scores(current_user: User = Depends(get_current_user)):
     scores = await db.scores.find({"judge_id": current_user.id}, {"_id": 0}).to_list(1000)
@@ -889,29 +1957,7 @@ async def update_score(score_id: str, score_update: ScoreUpdate, current_user: U
         # Recalculate scores with updated values
         updated_score = {**existing_score, **update_data}
         
-        score_subtotal = (
-            updated_score.get("tip_in", 0) +
-            updated_score["instant_smoke"] +
-            updated_score["constant_smoke"] +
-            updated_score["volume_of_smoke"] +
-            updated_score["driving_skill"] +
-            (updated_score["tyres_popped"] * 5)
-        )
-        
-        penalty_total = (
-            (updated_score["penalty_reversing"] * 5) +
-            (updated_score["penalty_stopping"] * 5) +
-            (updated_score["penalty_contact_barrier"] * 5) +
-            (updated_score["penalty_small_fire"] * 5) +
-            (updated_score["penalty_failed_drive_off"] * 10) +
-            (updated_score["penalty_large_fire"] * 10)
-        )
-        
-        # If disqualified, final score is 0
-        if updated_score.get("penalty_disqualified", False):
-            final_score = 0
-        else:
-            final_score = max(0, score_subtotal - penalty_total)
+        score_subtotal, penalty_total, final_score = calculate_score_totals(updated_score)
         
         update_data["score_subtotal"] = score_subtotal
         update_data["penalty_total"] = penalty_total
@@ -922,6 +1968,12 @@ async def update_score(score_id: str, score_update: ScoreUpdate, current_user: U
             {"id": score_id},
             {"$set": update_data}
         )
+        await record_score_change(
+            existing_score["round_id"],
+            existing_score["competitor_id"],
+            final_score - existing_score.get("final_score", 0),
+            0
+        )
     
     # Return updated score
     updated = await db.scores.find_one({"id": score_id}, {"_id": 0})
@@ -972,9 +2024,10 @@ async def get_all_scores(
 @api_router.delete("/admin/scores/{score_id}")
 async def delete_score(score_id: str, admin: User = Depends(require_admin)):
     """Delete a specific score"""
-    result = await db.scores.delete_one({"id": score_id})
-    if result.deleted_count == 0:
+    deleted = await db.scores.find_one_and_delete({"id": score_id}, projection={"_id": 0})
+    if not deleted:
         raise HTTPException(status_code=404, detail="Score not found")
+    await record_score_change(deleted["round_id"], deleted["competitor_id"], -deleted.get("final_score", 0), -1)
     return {"message": "Score deleted successfully"}
 
 @api_router.put("/admin/scores/{score_id}")
@@ -991,29 +2044,7 @@ async def admin_edit_score(score_id: str, score_update: ScoreUpdate, admin: User
         # Recalculate scores with updated values
         updated_score = {**existing_score, **update_data}
         
-        score_subtotal = (
-            updated_score.get("tip_in", 0) +
-            updated_score.get("instant_smoke", 0) +
-            updated_score.get("constant_smoke", 0) +
-            updated_score.get("volume_of_smoke", 0) +
-            updated_score.get("driving_skill", 0) +
-            (updated_score.get("tyres_popped", 0) * 5)
-        )
-        
-        penalty_total = (
-            (updated_score.get("penalty_reversing", 0) * 5) +
-            (updated_score.get("penalty_stopping", 0) * 5) +
-            (updated_score.get("penalty_contact_barrier", 0) * 5) +
-            (updated_score.get("penalty_small_fire", 0) * 5) +
-            (updated_score.get("penalty_failed_drive_off", 0) * 10) +
-            (updated_score.get("penalty_large_fire", 0) * 10)
-        )
-        
-        # If disqualified, final score is 0
-        if updated_score.get("penalty_disqualified", False):
-            final_score = 0
-        else:
-            final_score = max(0, score_subtotal - penalty_total)
+        score_subtotal, penalty_total, final_score = calculate_score_totals(updated_score)
         
         update_data["score_subtotal"] = score_subtotal
         update_data["penalty_total"] = penalty_total
@@ -1024,11 +2055,86 @@ async def admin_edit_score(score_id: str, score_update: ScoreUpdate, admin: User
             {"id": score_id},
             {"$set": update_data}
         )
+        await record_score_change(
+            existing_score["round_id"],
+            existing_score["competitor_id"],
+            final_score - existing_score.get("final_score", 0),
+            0
+        )
     
     # Return updated score
     updated = await db.scores.find_one({"id": score_id}, {"_id": 0})
     return updated
 
+# Round completeness
+# round_completeness holds one document per (competitor, round) with scores: the
+# active judges who have scored it, whether that is all of them (complete) and
+# whether the report has been emailed. Score writes refresh their pair, changes to
+# the judge set refresh everything, and sending a report sets email_sent, so the
+# pending-email list and bulk reports read it instead of rescanning the scores.
+# Concurrent refreshes are reconciled with refresh_seq like the scoring error registry.
+async def refresh_round_completeness(round_id: Optional[str] = None, competitor_id: Optional[str] = None,
+                                     competitor_ids: Optional[List[str]] = None) -> int:
+    """Recompute completeness for one pair, several competitors in a round, one round,
+    one competitor, or (no arguments) every pair. Returns the number of pairs with scores."""
+    scope = refresh_scope(round_id, competitor_id, competitor_ids)
+    refresh_seq = await next_refresh_seq("round_completeness")
+    active_judges = await db.users.find(
+        {"role": "judge", "is_active": {"$ne": False}},
+        {"_id": 0, "id": 1}
+    ).to_list(100)
+    active_judge_ids = {j["id"] for j in active_judges}
+    scores = await db.scores.find(
+        scope, {"_id": 0, "round_id": 1, "competitor_id": 1, "judge_id": 1, "email_sent": 1}
+    ).to_list(None)
+
+    pairs = {}
+    for score in scores:
+        pair = pairs.setdefault((score["competitor_id"], score["round_id"]), {
+            "judge_ids": set(),
+            "score_count": 0,
+            "email_sent": False
+        })
+        if score["judge_id"] in active_judge_ids:
+            pair["judge_ids"].add(score["judge_id"])
+            pair["score_count"] += 1
+        # If any score in this round has been emailed, the round counts as sent
+        pair["email_sent"] = pair["email_sent"] or score.get("email_sent", False)
+
+    # Pairs in scope that no longer have any scores are dropped
+    now = datetime.now(timezone.utc).isoformat()
+    await write_refreshed_rows(db.round_completeness, ("competitor_id", "round_id"), scope, [
+        {
+            "competitor_id": pair_competitor_id,
+            "round_id": pair_round_id,
+            "judge_ids": sorted(pair["judge_ids"]),
+            "score_count": pair["score_count"],
+            "complete": bool(active_judge_ids) and len(pair["judge_ids"]) >= len(active_judge_ids),
+            "email_sent": pair["email_sent"],
+            "updated_at": now
+        }
+        for (pair_competitor_id, pair_round_id), pair in pairs.items()
+    ], refresh_seq)
+    return len(pairs)
+
+async def mark_rounds_emailed(competitor_id: str, round_id: Optional[str] = None) -> int:
+    """Flag a competitor's scores (one round or all) and their completeness entries as emailed"""
+    query = {"competitor_id": competitor_id, **({"round_id": round_id} if round_id else {})}
+    result = await db.scores.update_many(query, {"$set": {"email_sent": True}})
+    await db.round_completeness.update_many(query, {"$set": {"email_sent": True}})
+    return result.modified_count
+
+async def refresh_judge_dependents():
+    """Rebuild everything that depends on the set of active judges"""
+    await refresh_scoring_errors()
+    await refresh_round_completeness()
+
+@api_router.post("/admin/round-completeness/rebuild")
+async def rebuild_round_completeness(admin: User = Depends(require_admin)):
+    """Recompute the round completeness index from the scores (use if it falls out of sync)"""
+    pair_count = await refresh_round_completeness()
+    return {"message": f"Round completeness rebuilt ({pair_count} competitor rounds)", "pairs": pair_count}
+
 class PendingEmailStats(BaseModel):
     total_competitors_scored: int
     competitors_pending_email: int
@@ -1037,69 +2143,34 @@ class PendingEmailStats(BaseModel):
 @api_router.get("/admin/pending-emails", response_model=PendingEmailStats)
 async def get_pending_emails(admin: User = Depends(require_admin)):
     """Get count of competitors who have been scored but not emailed"""
-    # Get active judges count
-    active_judges = await db.users.find(
-        {"role": "judge", "is_active": {"$ne": False}},
-        {"_id": 0, "id": 1}
-    ).to_list(100)
-    active_judge_count = len(active_judges)
-    
-    if active_judge_count == 0:
-        return PendingEmailStats(
-            total_competitors_scored=0,
-            competitors_pending_email=0,
-            competitors_list=[]
-        )
-    
-    # Get all scores
-    scores = await db.scores.find({}, {"_id": 0}).to_list(100000)
-    
-    # Get competitors and rounds
-    competitors = await db.competitors.find({}, {"_id": 0}).to_list(10000)
-    rounds = await db.rounds.find({}, {"_id": 0}).to_list(100)
+    # Both counts come from the completeness index; pending is a subset of complete
+    total_scored = await db.round_completeness.count_documents({"complete": True})
+    pending = await db.round_completeness.find(
+        {"complete": True, "email_sent": False},
+        {"_id": 0, "competitor_id": 1, "round_id": 1, "score_count": 1}
+    ).to_list(None)
+    
+    competitors = await db.competitors.find(
+        {"id": {"$in": list({p["competitor_id"] for p in pending})}},
+        {"_id": 0, "id": 1, "name": 1, "car_number": 1}
+    ).to_list(None)
+    rounds = await db.rounds.find({}, {"_id": 0, "id": 1, "name": 1}).to_list(100)
     
     competitors_dict = {c["id"]: c for c in competitors}
     rounds_dict = {r["id"]: r for r in rounds}
     
-    # Group scores by competitor and round
-    competitor_round_scores = {}
-    for score in scores:
-        comp_id = score["competitor_id"]
-        round_id = score["round_id"]
-        key = (comp_id, round_id)
-        if key not in competitor_round_scores:
-            competitor_round_scores[key] = {
-                "scores": [],
-                "email_sent": False
-            }
-        competitor_round_scores[key]["scores"].append(score)
-        # If any score in this round has been emailed, mark as sent
-        if score.get("email_sent", False):
-            competitor_round_scores[key]["email_sent"] = True
-    
-    # Find competitors with complete scoring (all active judges) but not emailed
     pending_list = []
-    total_scored = 0
-    
-    for (comp_id, round_id), data in competitor_round_scores.items():
-        active_judge_ids = [j["id"] for j in active_judges]
-        scores_from_active = [s for s in data["scores"] if s["judge_id"] in active_judge_ids]
-        unique_judges = set(s["judge_id"] for s in scores_from_active)
-        
-        # Check if all active judges have scored
-        if len(unique_judges) >= active_judge_count:
-            total_scored += 1
-            if not data["email_sent"]:
-                competitor = competitors_dict.get(comp_id, {})
-                round_info = rounds_dict.get(round_id, {})
-                pending_list.append({
-                    "competitor_id": comp_id,
-                    "competitor_name": competitor.get("name", "Unknown"),
-                    "car_number": competitor.get("car_number", "?"),
-                    "round_id": round_id,
-                    "round_name": round_info.get("name", "Unknown Round"),
-                    "score_count": len(scores_from_active)
-                })
+    for entry in pending:
+        competitor = competitors_dict.get(entry["competitor_id"], {})
+        round_info = rounds_dict.get(entry["round_id"], {})
+        pending_list.append({
+            "competitor_id": entry["competitor_id"],
+            "competitor_name": competitor.get("name", "Unknown"),
+            "car_number": competitor.get("car_number", "?"),
+            "round_id": entry["round_id"],
+            "round_name": round_info.get("name", "Unknown Round"),
+            "score_count": entry["score_count"]
+        })
     
     return PendingEmailStats(
         total_competitors_scored=total_scored,
@@ -1110,234 +2181,520 @@ async def get_pending_emails(admin: User = Depends(require_admin)):
 @api_router.post("/admin/mark-emailed/{competitor_id}/{round_id}")
 async def mark_scores_emailed(competitor_id: str, round_id: str, admin: User = Depends(require_admin)):
     """Mark all scores for a competitor in a round as emailed"""
-    result = await db.scores.update_many(
-        {"competitor_id": competitor_id, "round_id": round_id},
-        {"$set": {"email_sent": True}}
-    )
-    return {"message": f"Marked {result.modified_count} scores as emailed"}
+    modified_count = await mark_rounds_emailed(competitor_id, round_id)
+    return {"message": f"Marked {modified_count} scores as emailed"}
 
 # Leaderboard
-@api_router.get("/leaderboard/{round_id}", response_model=List[LeaderboardEntry])
-async def get_leaderboard(round_id: str, class_id: Optional[str] = None, current_user: User = Depends(get_current_user)):
-    # Get all scores for the round
-    scores = await db.scores.find({"round_id": round_id}, {"_id": 0}).to_list(10000)
-    
-    # Get competitors and classes
-    competitors = await db.competitors.find({}, {"_id": 0}).to_list(1000)
-    classes = await db.classes.find({}, {"_id": 0}).to_list(1000)
-    
-    competitors_dict = {c["id"]: c for c in competitors}
-    classes_dict = {c["id"]: c["name"] for c in classes}
+async def get_class_competitor_ids(class_id: str) -> List[str]:
+    """IDs of the competitors in a class - used to push class filters into $match"""
+    competitors = await db.competitors.find({"class_id": class_id}, {"_id": 0, "id": 1}).to_list(None)
+    return [c["id"] for c in competitors]
+
+def build_leaderboard_pipeline(match: dict, sort_field: str, cumulative: bool = False) -> List[dict]:
+    """Aggregation pipeline over leaderboard_summary that returns finished leaderboard rows
+
+    Args:
+        match: $match stage for leaderboard_summary (round and class filters)
+        sort_field: Field to rank by, descending ("average_score" or "total_score")
+        cumulative: If True, sum the per-round rows of each competitor and add rounds_competed
+    """
+    # A row emptied by a delete is skipped until it is removed (and never divides by 0)
+    pipeline = [{"$match": {**match, "score_count": {"$gt": 0}}}]
+    project = {
+        "_id": 0,
+        "competitor_id": 1,
+        "competitor_name": {"$ifNull": ["$competitor.name", "Unknown"]},
+        "car_number": {"$ifNull": ["$competitor.car_number", ""]},
+        "vehicle_info": {"$ifNull": ["$competitor.vehicle_info", ""]},
+        "class_name": {"$ifNull": [{"$arrayElemAt": ["$competitor_class.name", 0]}, "Unknown"]},
+        "total_score": {"$round": ["$total_score", 2]},
+        "average_score": {"$round": ["$average_score", 2]},
+        "score_count": 1
+    }
+    if cumulative:
+        pipeline += [
+            {"$group": {
+                "_id": "$competitor_id",
+                "total_score": {"$sum": "$total_score"},
+                "score_count": {"$sum": "$score_count"},
+                "rounds_competed": {"$sum": 1}
+            }},
+            {"$addFields": {
+                "competitor_id": "$_id",
+                "average_score": {"$divide": ["$total_score", "$score_count"]}
+            }}
+        ]
+        project["rounds_competed"] = 1
+    else:
+        pipeline.append({"$addFields": {"average_score": {"$divide": ["$total_score", "$score_count"]}}})
+
+    return pipeline + [
+        {"$sort": {sort_field: -1, "competitor_id": 1}},
+        {"$lookup": {"from": "competitors", "localField": "competitor_id", "foreignField": "id", "as": "competitor"}},
+        # Rows for deleted competitors have nothing to join and drop out here
+        {"$unwind": "$competitor"},
+        {"$lookup": {"from": "classes", "localField": "competitor.class_id", "foreignField": "id", "as": "competitor_class"}},
+        {"$project": project}
+    ]
+
+async def compute_round_leaderboard(round_id: str, class_id: Optional[str] = None) -> List[LeaderboardEntry]:
+    match = {"round_id": round_id}
     
-    # Calculate totals and averages
-    competitor_scores = {}
-    for score in scores:
-        comp_id = score["competitor_id"]
-        if comp_id not in competitor_scores:
-            competitor_scores[comp_id] = []
-        competitor_scores[comp_id].append(score.get("final_score", 0))
-    
-    leaderboard = []
-    for comp_id, score_list in competitor_scores.items():
-        if comp_id not in competitors_dict:
-            continue
-        
-        competitor = competitors_dict[comp_id]
-        
-        # Filter by class if specified
-        if class_id and competitor.get("class_id") != class_id:
-            continue
-        
-        total_score = sum(score_list)
-        avg_score = total_score / len(score_list) if score_list else 0
-        leaderboard.append(LeaderboardEntry(
-            competitor_id=comp_id,
-            competitor_name=competitor.get("name", "Unknown"),
-            car_number=competitor.get("car_number", ""),
-            vehicle_info=competitor.get("vehicle_info", ""),
-            class_name=classes_dict.get(competitor.get("class_id"), "Unknown"),
-            total_score=round(total_score, 2),
-            average_score=round(avg_score, 2),
-            score_count=len(score_list)
-        ))
+    # Filter by class if specified
+    if class_id:
+        match["competitor_id"] = {"$in": await get_class_competitor_ids(class_id)}
     
     # Sort by average score descending (default)
-    leaderboard.sort(key=lambda x: x.average_score, reverse=True)
-    return leaderboard
+    rows = await db.leaderboard_summary.aggregate(build_leaderboard_pipeline(match, "average_score")).to_list(None)
+    return [LeaderboardEntry(**row) for row in rows]
 
-@api_router.get("/leaderboard/minor-rounds/cumulative", response_model=List[MinorRoundsLeaderboardEntry])
-async def get_minor_rounds_leaderboard(class_id: Optional[str] = None, current_user: User = Depends(get_current_user)):
-    """Get cumulative leaderboard for all minor rounds"""
+async def compute_minor_rounds_leaderboard(class_id: Optional[str] = None) -> List[MinorRoundsLeaderboardEntry]:
     # Get all minor rounds
-    minor_rounds = await db.rounds.find({"is_minor": True}, {"_id": 0}).to_list(100)
+    minor_rounds = await db.rounds.find({"is_minor": True}, {"_id": 0, "id": 1}).to_list(None)
     minor_round_ids = [r["id"] for r in minor_rounds]
     
     if not minor_round_ids:
         return []
     
-    # Get all scores for minor rounds
-    scores = await db.scores.find({"round_id": {"$in": minor_round_ids}}, {"_id": 0}).to_list(10000)
-    
-    # Get competitors and classes
-    competitors = await db.competitors.find({}, {"_id": 0}).to_list(1000)
-    classes = await db.classes.find({}, {"_id": 0}).to_list(1000)
-    
-    competitors_dict = {c["id"]: c for c in competitors}
-    classes_dict = {c["id"]: c["name"] for c in classes}
+    match = {"round_id": {"$in": minor_round_ids}}
     
-    # Calculate cumulative scores
-    competitor_data = {}
-    for score in scores:
-        comp_id = score["competitor_id"]
-        round_id = score["round_id"]
-        if comp_id not in competitor_data:
-            competitor_data[comp_id] = {"scores": [], "rounds": set()}
-        competitor_data[comp_id]["scores"].append(score.get("final_score", 0))
-        competitor_data[comp_id]["rounds"].add(round_id)
-    
-    leaderboard = []
-    for comp_id, data in competitor_data.items():
-        if comp_id not in competitors_dict:
-            continue
-        
-        competitor = competitors_dict[comp_id]
-        
-        # Filter by class if specified
-        if class_id and competitor.get("class_id") != class_id:
-            continue
-        
-        total_score = sum(data["scores"])
-        avg_score = total_score / len(data["scores"]) if data["scores"] else 0
-        leaderboard.append(MinorRoundsLeaderboardEntry(
-            competitor_id=comp_id,
-            competitor_name=competitor.get("name", "Unknown"),
-            car_number=competitor.get("car_number", ""),
-            vehicle_info=competitor.get("vehicle_info", ""),
-            class_name=classes_dict.get(competitor.get("class_id"), "Unknown"),
-            total_score=round(total_score, 2),
-            average_score=round(avg_score, 2),
-            rounds_competed=len(data["rounds"]),
-            score_count=len(data["scores"])
-        ))
+    # Filter by class if specified
+    if class_id:
+        match["competitor_id"] = {"$in": await get_class_competitor_ids(class_id)}
     
     # Sort by total score descending
-    leaderboard.sort(key=lambda x: x.total_score, reverse=True)
-    return leaderboard
+    rows = await db.leaderboard_summary.aggregate(
+        build_leaderboard_pipeline(match, "total_score", cumulative=True)
+    ).to_list(None)
+    return [MinorRoundsLeaderboardEntry(**row) for row in rows]
+
+@api_router.get("/leaderboard/{round_id}", response_model=List[LeaderboardEntry])
+async def get_leaderboard(round_id: str, request: Request, response: Response, class_id: Optional[str] = None, current_user: User = Depends(get_current_user)):
+    not_modified = await check_etag(request, response, [f"scores:{round_id}", "competitors", "classes"], class_id)
+    if not_modified:
+        return not_modified
+    return await compute_round_leaderboard(round_id, class_id)
+
+@api_router.get("/leaderboard/minor-rounds/cumulative", response_model=List[MinorRoundsLeaderboardEntry])
+async def get_minor_rounds_leaderboard(request: Request, response: Response, class_id: Optional[str] = None, current_user: User = Depends(get_current_user)):
+    """Get cumulative leaderboard for all minor rounds"""
+    not_modified = await check_etag(request, response, ["scores", "rounds", "competitors", "classes"], class_id)
+    if not_modified:
+        return not_modified
+    return await compute_minor_rounds_leaderboard(class_id)
+
+# Live leaderboard stream (Server-Sent Events)
+MINOR_ROUNDS_STREAM = "minor-rounds"  # Stream key for the cumulative minor rounds leaderboard
+SSE_HEARTBEAT_SECONDS = 15
+SSE_DEBOUNCE_SECONDS = 0.25  # Coalesce a burst of score writes into one recompute
+
+class LeaderboardBroadcaster:
+    """Computes each watched leaderboard once per change and fans it out to every subscriber
+
+    Streams are keyed by (round_id, class_id). Writes can land on any worker process, so
+    changes are detected from the change_versions counters: every watch_seconds each
+    process reads the scopes its subscribers depend on and republishes the streams whose
+    counters moved. The event id is a hash of the rankings, so it is the same on every
+    worker and clients resume with Last-Event-ID wherever they reconnect.
+    """
+
+    def __init__(self, watch_seconds: float):
+        self.watch_seconds = watch_seconds
+        self.subscribers = {}  # (round_id, class_id) -> set of asyncio.Queue
+        self.latest = {}  # (round_id, class_id) -> (event_id, payload)
+        self.seen = {}  # change_versions scope -> version at the last poll
+        self.pending = {}  # round_id -> scheduled publish task
+
+    def subscribe(self, key: tuple) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=1)
+        self.subscribers.setdefault(key, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, key: tuple, queue: asyncio.Queue):
+        queues = self.subscribers.get(key)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            # Keep latest: a client reconnecting later still resumes if nothing changed
+            del self.subscribers[key]
+
+    async def poll(self):
+        """Publish the watched streams whose change_versions scopes moved since the last poll"""
+        round_ids = {key[0] for key in self.subscribers}
+        if not round_ids:
+            self.seen.clear()
+            return
+        scopes = ["competitors", "classes", "rounds", "scores"]
+        scopes += [f"scores:{round_id}" for round_id in round_ids if round_id != MINOR_ROUNDS_STREAM]
+        docs = await db.change_versions.find({"key": {"$in": scopes}}, {"_id": 0}).to_list(None)
+        versions = {d["key"]: d["version"] for d in docs}
+        # Scopes seen for the first time count as changed: a write may have landed
+        # between a new subscriber's snapshot and this poll
+        changed = {scope for scope in scopes if self.seen.get(scope) != versions.get(scope, 0)}
+        self.seen = {scope: versions.get(scope, 0) for scope in scopes}
+
+        if changed & {"competitors", "classes", "rounds"}:
+            self.notify_all()
+            return
+        if "scores" in changed:
+            self._schedule(MINOR_ROUNDS_STREAM)
+        for scope in changed - {"scores"}:
+            self._schedule(scope.split(":", 1)[1])
+
+    async def watch_forever(self):
+        """Follow writes made by this and every other worker process"""
+        while True:
+            await asyncio.sleep(self.watch_seconds)
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.warning(f"Leaderboard change poll failed: {e}")
+
+    def notify_all(self):
+        """Rounds, competitors or classes changed - refresh every watched stream"""
+        for round_id in {key[0] for key in self.subscribers}:
+            self._schedule(round_id)
+
+    def _schedule(self, round_id: str):
+        if round_id in self.pending or not any(key[0] == round_id for key in self.subscribers):
+            return
+        self.pending[round_id] = asyncio.create_task(self._publish(round_id))
+
+    async def _publish(self, round_id: str):
+        await asyncio.sleep(SSE_DEBOUNCE_SECONDS)
+        self.pending.pop(round_id, None)
+        for key in [k for k in self.subscribers if k[0] == round_id]:
+            try:
+                previous = self.latest.get(key)
+                event_id, payload = await self._refresh(key)
+                if previous and previous[0] == event_id:
+                    continue  # Rankings unchanged - nothing to send
+                for queue in list(self.subscribers.get(key, ())):
+                    if queue.full():
+                        queue.get_nowait()  # Slow client: keep only the newest rankings
+                    queue.put_nowait((event_id, payload))
+            except Exception as e:
+                logger.warning(f"Leaderboard stream update failed for {key}: {e}")
+
+    async def _refresh(self, key: tuple) -> tuple:
+        round_id, class_id = key
+        if round_id == MINOR_ROUNDS_STREAM:
+            entries = await compute_minor_rounds_leaderboard(class_id)
+        else:
+            entries = await compute_round_leaderboard(round_id, class_id)
+        payload = json.dumps([entry.model_dump() for entry in entries])
+
+        self.latest[key] = (hashlib.sha1(payload.encode()).hexdigest()[:16], payload)
+        return self.latest[key]
+
+    async def snapshot(self, key: tuple) -> tuple:
+        """Current (event_id, payload) for a stream
+
+        While other clients are watching, publishes keep latest current. Otherwise it may
+        be stale, so recompute - the id only changes if the rankings changed meanwhile.
+        """
+        if key in self.latest and len(self.subscribers.get(key, ())) > 1:
+            return self.latest[key]
+        return await self._refresh(key)
+
+leaderboard_broadcaster = LeaderboardBroadcaster(watch_seconds=float(os.environ.get('LEADERBOARD_WATCH_SECONDS', '1')))
+
+@api_router.get("/leaderboard/{round_id}/stream")
+async def stream_leaderboard(request: Request, round_id: str, token: str, class_id: Optional[str] = None):
+    """Stream leaderboard rankings as Server-Sent Events
+
+    Use round_id "minor-rounds" for the cumulative minor rounds leaderboard. The token is
+    passed as a query parameter because EventSource cannot send an Authorization header.
+    A new "leaderboard" event is pushed only when the rankings change (within about a
+    second of the write, on any worker); reconnecting clients that send Last-Event-ID
+    with the current id skip the initial snapshot.
+    """
+    await authenticate_token(token)
+    key = (round_id, class_id or None)
+    queue = leaderboard_broadcaster.subscribe(key)
+    last_event_id = request.headers.get("last-event-id")
+
+    async def event_stream():
+        try:
+            event_id, payload = await leaderboard_broadcaster.snapshot(key)
+            if event_id != last_event_id:
+                yield f"id: {event_id}\nevent: leaderboard\ndata: {payload}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event_id, payload = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+                    yield f"id: {event_id}\nevent: leaderboard\ndata: {payload}\n\n"
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+        finally:
+            leaderboard_broadcaster.unsubscribe(key, queue)
 
-# Export
-@api_router.get("/export/all-data")
-async def export_all_data(admin: User = Depends(require_admin)):
-    # Export all data including competitors, rounds, classes, and all scores
-    competitors = await db.competitors.find({}, {"_id": 0}).to_list(10000)
-    rounds = await db.rounds.find({}, {"_id": 0}).to_list(10000)
-    classes = await db.classes.find({}, {"_id": 0}).to_list(10000)
-    scores = await db.scores.find({}, {"_id": 0}).to_list(10000)
-    
-    # Create dictionaries for lookups
-    competitors_dict = {c["id"]: c for c in competitors}
-    rounds_dict = {r["id"]: r for r in rounds}
-    classes_dict = {c["id"]: c for c in classes}
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write comprehensive header (includes Tip In)
-    writer.writerow([
-        "Score ID", "Judge Name", "Round Name", "Round Date", "Competitor Name", 
-        "Car Number", "Plate", "Vehicle", "Class", "Tip In", "Instant Smoke", "Constant Smoke", 
-        "Volume Smoke", "Driving Skill", "Tyres Popped", "Tyres Points",
-        "Reversing Count", "Stopping Count", "Barrier Contact Count", "Small Fire Count",
-        "Failed Drive Off Count", "Large Fire Count",
-        "Score Subtotal", "Penalty Total", "Final Score", 
-        "Submitted At", "Edited At", "Was Edited"
-    ])
-    
-    for score in scores:
-        comp = competitors_dict.get(score["competitor_id"], {})
-        round_data = rounds_dict.get(score["round_id"], {})
-        class_name = classes_dict.get(comp.get("class_id", ""), {}).get("name", "Unknown")
-        
-        was_edited = "Yes" if score.get("edited_at") else "No"
-        
-        writer.writerow([
-            score["id"],
-            score["judge_name"],
-            round_data.get("name", "Unknown"),
-            round_data.get("date", ""),
-            comp.get("name", "Unknown"),
-            comp.get("car_number", ""),
-            comp.get("plate", ""),
-            comp.get("vehicle_info", ""),
-            class_name,
-            score.get("tip_in", 0),  # Handle old scores without tip_in
-            score.get("instant_smoke", 0),
-            score.get("constant_smoke", 0),
-            score.get("volume_of_smoke", 0),
-            score.get("driving_skill", 0),
-            score.get("tyres_popped", 0),
-            score.get("tyres_popped", 0) * 5,
-            score.get("penalty_reversing", 0),
-            score.get("penalty_stopping", 0),
-            score.get("penalty_contact_barrier", 0),
-            score.get("penalty_small_fire", 0),
-            score.get("penalty_failed_drive_off", 0),
-            score.get("penalty_large_fire", 0),
-            score.get("score_subtotal", 0),
-            score.get("penalty_total", 0),
-            score.get("final_score", 0),
-            score.get("submitted_at", ""),
-            score.get("edited_at", ""),
-            was_edited
-        ])
-    
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=burnout_scoring_all_data.csv"}
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Export
+# Exports stream straight from a MongoDB cursor: the header goes out at once, then rows
+# are encoded EXPORT_BATCH_SIZE at a time, so memory stays flat however many scores exist.
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", "1000"))
+
+ALL_DATA_COLUMNS = [
+    "Score ID", "Judge Name", "Round Name", "Round Date", "Competitor Name", 
+    "Car Number", "Plate", "Vehicle", "Class", "Tip In", "Instant Smoke", "Constant Smoke", 
+    "Volume Smoke", "Driving Skill", "Tyres Popped", "Tyres Points",
+    "Reversing Count", "Stopping Count", "Barrier Contact Count", "Small Fire Count",
+    "Failed Drive Off Count", "Large Fire Count",
+    "Score Subtotal", "Penalty Total", "Final Score", 
+    "Submitted At", "Edited At", "Was Edited"
+]
+
+ROUND_SCORES_COLUMNS = [
+    "Competitor Name", "Car Number", "Vehicle", "Class", "Judge",
+    "Tip In", "Instant Smoke", "Constant Smoke", "Volume Smoke", "Driving Skill",
+    "Tyres Popped", "Score Subtotal", "Penalty Total", "Final Score", "Submitted At"
+]
+
+async def load_export_lookups():
+    """Competitor, round and class-name lookups shared by every exported row"""
+    competitors = await db.competitors.find({}, {"_id": 0}).to_list(None)
+    rounds = await db.rounds.find({}, {"_id": 0}).to_list(None)
+    classes = await db.classes.find({}, {"_id": 0, "id": 1, "name": 1}).to_list(None)
+    return (
+        {c["id"]: c for c in competitors},
+        {r["id"]: r for r in rounds},
+        {c["id"]: c["name"] for c in classes}
     )
 
+def all_data_row(score: dict, competitors_dict: dict, rounds_dict: dict, classes_dict: dict) -> list:
+    comp = competitors_dict.get(score["competitor_id"], {})
+    round_data = rounds_dict.get(score["round_id"], {})
+    class_name = classes_dict.get(comp.get("class_id", ""), "Unknown")
+    
+    was_edited = "Yes" if score.get("edited_at") else "No"
+    
+    return [
+        score["id"],
+        score.get("judge_name", ""),
+        round_data.get("name", "Unknown"),
+        round_data.get("date", ""),
+        comp.get("name", "Unknown"),
+        comp.get("car_number", ""),
+        comp.get("plate", ""),
+        comp.get("vehicle_info", ""),
+        class_name,
+        score.get("tip_in", 0),  # Handle old scores without tip_in
+        score.get("instant_smoke", 0),
+        score.get("constant_smoke", 0),
+        score.get("volume_of_smoke", 0),
+        score.get("driving_skill", 0),
+        score.get("tyres_popped", 0),
+        score.get("tyres_popped", 0) * 5,
+        score.get("penalty_reversing", 0),
+        score.get("penalty_stopping", 0),
+        score.get("penalty_contact_barrier", 0),
+        score.get("penalty_small_fire", 0),
+        score.get("penalty_failed_drive_off", 0),
+        score.get("penalty_large_fire", 0),
+        score.get("score_subtotal", 0),
+        score.get("penalty_total", 0),
+        score.get("final_score", 0),
+        score.get("submitted_at", ""),
+        score.get("edited_at", ""),
+        was_edited
+    ]
+
+def round_score_row(score: dict, competitors_dict: dict, rounds_dict: dict, classes_dict: dict) -> list:
+    comp = competitors_dict.get(score["competitor_id"], {})
+    class_name = classes_dict.get(comp.get("class_id", ""), "Unknown")
+    return [
+        comp.get("name", ""),
+        comp.get("car_number", ""),
+        comp.get("vehicle_info", ""),
+        class_name,
+        score.get("judge_name", ""),
+        score.get("tip_in", 0),  # Handle old scores without tip_in
+        score.get("instant_smoke", 0),
+        score.get("constant_smoke", 0),
+        score.get("volume_of_smoke", 0),
+        score.get("driving_skill", 0),
+        score.get("tyres_popped", 0),
+        score.get("score_subtotal", 0),
+        score.get("penalty_total", 0),
+        score.get("final_score", 0),
+        score.get("submitted_at", "")
+    ]
+
+async def export_rows(query: dict, row_builder):
+    """Yield one export row per score matching `query`, read from the cursor in batches"""
+    lookups = await load_export_lookups()
+    async for score in db.scores.find(query, {"_id": 0}, batch_size=EXPORT_BATCH_SIZE):
+        yield row_builder(score, *lookups)
+
+async def stream_csv(columns: List[str], rows):
+    """Encode an async iterable of rows as CSV text chunks, header first"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    
+    pending = 0
+    async for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending == EXPORT_BATCH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
+
+# Typed exports: the scores are loaded into one DataFrame and joined to competitors,
+# rounds and classes with merges; each format maps to (extension, media type, package).
+EXPORT_FORMATS = {
+    "parquet": ("parquet", "application/vnd.apache.parquet", "pyarrow"),
+    "feather": ("feather", "application/vnd.apache.arrow.file", "pyarrow"),
+    "xlsx": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "openpyxl"),
+    "jsonl": ("jsonl", "application/x-ndjson", None)
+}
+EXPORT_SCORE_FIELDS = [
+    "id", "judge_name", "round_id", "competitor_id",
+    "tip_in", "instant_smoke", "constant_smoke", "volume_of_smoke", "driving_skill", "tyres_popped",
+    "penalty_reversing", "penalty_stopping", "penalty_contact_barrier", "penalty_small_fire",
+    "penalty_failed_drive_off", "penalty_large_fire", "penalty_disqualified",
+    "score_subtotal", "penalty_total", "final_score", "submitted_at", "edited_at"
+]
+EXPORT_COUNT_FIELDS = ["tyres_popped", "penalty_reversing", "penalty_stopping", "penalty_contact_barrier",
+                       "penalty_small_fire", "penalty_failed_drive_off", "penalty_large_fire", "penalty_total"]
+EXPORT_POINT_FIELDS = ["tip_in", "instant_smoke", "constant_smoke", "volume_of_smoke", "driving_skill",
+                       "score_subtotal", "final_score"]
+
+def parse_export_dates(df: pd.DataFrame, column: str, **options) -> int:
+    """Convert a column to datetimes in place. Values that cannot be parsed become empty
+    cells; they are logged with their score ids and the count is returned."""
+    raw = df[column].replace("", None)
+    parsed = pd.to_datetime(raw, errors="coerce", **options)
+    coerced = raw.notna() & parsed.isna()
+    df[column] = parsed
+    count = int(coerced.sum())
+    if count:
+        samples = ", ".join(f"{score_id}={value!r}" for score_id, value in
+                            zip(df.loc[coerced, "score_id"].head(5), raw[coerced].head(5)))
+        logger.warning(f"Export: {count} {column} values could not be parsed and are exported empty ({samples})")
+    return count
+
+async def build_all_data_frame() -> pd.DataFrame:
+    """All scores with competitor, round and class details as typed columns. Unparseable
+    timestamps are exported empty and counted per column in df.attrs["coerced_dates"]."""
+    records = []
+    async for score in db.scores.find({}, {"_id": 0, **{f: 1 for f in EXPORT_SCORE_FIELDS}},
+                                      batch_size=EXPORT_BATCH_SIZE):
+        records.append(score)
+    scores = pd.DataFrame.from_records(records, columns=EXPORT_SCORE_FIELDS)
+    
+    competitors = pd.DataFrame.from_records(
+        await db.competitors.find({}, {"_id": 0}).to_list(None),
+        columns=["id", "name", "car_number", "plate", "vehicle_info", "class_id"]
+    ).rename(columns={"id": "competitor_id", "name": "competitor_name", "vehicle_info": "vehicle"})
+    rounds = pd.DataFrame.from_records(
+        await db.rounds.find({}, {"_id": 0}).to_list(None),
+        columns=["id", "name", "date", "is_minor"]
+    ).rename(columns={"id": "round_id", "name": "round_name", "date": "round_date", "is_minor": "round_is_minor"})
+    classes = pd.DataFrame.from_records(
+        await db.classes.find({}, {"_id": 0, "id": 1, "name": 1}).to_list(None),
+        columns=["id", "name"]
+    ).rename(columns={"id": "class_id", "name": "class_name"})
+    
+    df = (scores
+          .merge(competitors, on="competitor_id", how="left")
+          .merge(rounds, on="round_id", how="left")
+          .merge(classes, on="class_id", how="left"))
+    
+    df = df.rename(columns={"id": "score_id"})
+    df[EXPORT_POINT_FIELDS] = df[EXPORT_POINT_FIELDS].fillna(0).astype("float64")
+    df[EXPORT_COUNT_FIELDS] = df[EXPORT_COUNT_FIELDS].fillna(0).astype("int64")
+    df["tyres_points"] = df["tyres_popped"] * 5
+    df["penalty_disqualified"] = df["penalty_disqualified"].fillna(False).astype(bool)
+    df["round_is_minor"] = df["round_is_minor"].fillna(False).astype(bool)
+    was_edited = df["edited_at"].replace("", None).notna()
+    coerced_dates = {
+        # isoformat() drops the fraction when microseconds are 0, so one column mixes
+        # both shapes; without a format pandas would guess one from the first value
+        "submitted_at": parse_export_dates(df, "submitted_at", utc=True, format="ISO8601"),
+        "edited_at": parse_export_dates(df, "edited_at", utc=True, format="ISO8601"),
+        "round_date": parse_export_dates(df, "round_date", format="mixed")
+    }
+    df["was_edited"] = was_edited
+    df["competitor_name"] = df["competitor_name"].fillna("Unknown")
+    df["round_name"] = df["round_name"].fillna("Unknown")
+    df["class_name"] = df["class_name"].fillna("Unknown")
+    for column in ["judge_name", "round_name", "class_name"]:
+        df[column] = df[column].astype("category")
+    for column in ["score_id", "competitor_id", "round_id", "competitor_name", "car_number", "plate", "vehicle"]:
+        df[column] = df[column].astype("string")
+    
+    df = df[[
+        "score_id", "judge_name", "round_id", "round_name", "round_date", "round_is_minor",
+        "competitor_id", "competitor_name", "car_number", "plate", "vehicle", "class_name",
+        "tip_in", "instant_smoke", "constant_smoke", "volume_of_smoke", "driving_skill",
+        "tyres_popped", "tyres_points",
+        "penalty_reversing", "penalty_stopping", "penalty_contact_barrier", "penalty_small_fire",
+        "penalty_failed_drive_off", "penalty_large_fire", "penalty_disqualified",
+        "score_subtotal", "penalty_total", "final_score",
+        "submitted_at", "edited_at", "was_edited"
+    ]]
+    df.attrs["coerced_dates"] = {column: count for column, count in coerced_dates.items() if count}
+    return df
+
+def encode_data_frame(df: pd.DataFrame, export_format: str) -> bytes:
+    """Serialize the export frame (run in a worker thread - this is CPU bound)"""
+    buffer = io.BytesIO()
+    if export_format == "parquet":
+        df.to_parquet(buffer, index=False)
+    elif export_format == "feather":
+        df.to_feather(buffer)
+    elif export_format == "xlsx":
+        # Excel cannot store time zones; timestamps are written as UTC
+        df = df.assign(submitted_at=df["submitted_at"].dt.tz_localize(None),
+                       edited_at=df["edited_at"].dt.tz_localize(None))
+        df.to_excel(buffer, index=False, sheet_name="Scores")
+    else:
+        df.to_json(buffer, orient="records", lines=True, date_format="iso")
+    return buffer.getvalue()
+
+@api_router.get("/export/all-data")
+async def export_all_data(format: str = "csv", admin: User = Depends(require_admin)):
+    """Every score with its competitor, round and class details (no row limit).
+    format=csv streams; parquet, feather, xlsx and jsonl return typed columns."""
+    if format == "csv":
+        return StreamingResponse(
+            stream_csv(ALL_DATA_COLUMNS, export_rows({}, all_data_row)),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=burnout_scoring_all_data.csv"}
+        )
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Format must be one of: csv, {', '.join(EXPORT_FORMATS)}")
+    extension, media_type, package = EXPORT_FORMATS[format]
+    if package and importlib.util.find_spec(package) is None:
+        raise HTTPException(status_code=400, detail=f"{format} export needs the {package} package on the server")
+    
+    df = await build_all_data_frame()
+    content = await asyncio.to_thread(encode_data_frame, df, format)
+    headers = {"Content-Disposition": f"attachment; filename=burnout_scoring_all_data.{extension}"}
+    if df.attrs["coerced_dates"]:
+        # e.g. "submitted_at=2" - timestamps that were exported as empty cells
+        headers["X-Export-Unparsed-Dates"] = ",".join(f"{c}={n}" for c, n in df.attrs["coerced_dates"].items())
+    return Response(content=content, media_type=media_type, headers=headers)
+
 @api_router.get("/export/scores/{round_id}")
 async def export_scores(round_id: str, admin: User = Depends(require_admin)):
-    scores = await db.scores.find({"round_id": round_id}, {"_id": 0}).to_list(10000)
-    competitors = await db.competitors.find({}, {"_id": 0}).to_list(1000)
-    classes = await db.classes.find({}, {"_id": 0}).to_list(1000)
-    
-    competitors_dict = {c["id"]: c for c in competitors}
-    classes_dict = {c["id"]: c["name"] for c in classes}
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "Competitor Name", "Car Number", "Vehicle", "Class", "Judge",
-        "Tip In", "Instant Smoke", "Constant Smoke", "Volume Smoke", "Driving Skill",
-        "Tyres Popped", "Score Subtotal", "Penalty Total", "Final Score", "Submitted At"
-    ])
-    
-    for score in scores:
-        comp = competitors_dict.get(score["competitor_id"], {})
-        class_name = classes_dict.get(comp.get("class_id", ""), "Unknown")
-        writer.writerow([
-            comp.get("name", ""),
-            comp.get("car_number", ""),
-            comp.get("vehicle_info", ""),
-            class_name,
-            score.get("judge_name", ""),
-            score.get("tip_in", 0),  # Handle old scores without tip_in
-            score.get("instant_smoke", 0),
-            score.get("constant_smoke", 0),
-            score.get("volume_of_smoke", 0),
-            score.get("driving_skill", 0),
-            score.get("tyres_popped", 0),
-            score.get("score_subtotal", 0),
-            score.get("penalty_total", 0),
-            score.get("final_score", 0),
-            score.get("submitted_at", "")
-        ])
-    
-    output.seek(0)
+    """Scores for one round (no row limit)"""
     return StreamingResponse(
-        iter([output.getvalue()]),
+        stream_csv(ROUND_SCORES_COLUMNS, export_rows({"round_id": round_id}, round_score_row)),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename=scores_round_{round_id}.csv"}
     )
@@ -1351,6 +2708,10 @@ class ResetResponse(BaseModel):
 async def reset_scores(admin: User = Depends(require_admin)):
     """Reset all scores only"""
     result = await db.scores.delete_many({})
+    await db.leaderboard_summary.delete_many({})
+    await db.scoring_errors.delete_many({})
+    await db.round_completeness.delete_many({})
+    await bump_all_score_versions()
     return ResetResponse(
         message="All scores have been deleted",
         deleted_counts={"scores": result.deleted_count}
@@ -1360,9 +2721,14 @@ async def reset_scores(admin: User = Depends(require_admin)):
 async def reset_competition_data(admin: User = Depends(require_admin)):
     """Reset all competition data (scores, competitors, rounds, classes)"""
     scores_result = await db.scores.delete_many({})
+    await db.leaderboard_summary.delete_many({})
+    await db.scoring_errors.delete_many({})
+    await db.round_completeness.delete_many({})
     competitors_result = await db.competitors.delete_many({})
     rounds_result = await db.rounds.delete_many({})
     classes_result = await db.classes.delete_many({})
+    await bump_all_score_versions()
+    await bump_versions("competitors", "rounds", "classes")
     
     return ResetResponse(
         message="All competition data has been deleted",
@@ -1382,11 +2748,18 @@ async def reset_full(admin: User = Depends(require_admin)):
     admin_id = current_admin["id"] if current_admin else None
     
     scores_result = await db.scores.delete_many({})
+    await db.leaderboard_summary.delete_many({})
+    await db.scoring_errors.delete_many({})
+    await db.round_completeness.delete_many({})
     competitors_result = await db.competitors.delete_many({})
     rounds_result = await db.rounds.delete_many({})
     classes_result = await db.classes.delete_many({})
     # Delete all judges but keep admin
     judges_result = await db.users.delete_many({"role": "judge"})
+    user_cache.clear()
+    await token_epochs.refresh()
+    await bump_all_score_versions()
+    await bump_versions("competitors", "rounds", "classes")
     
     return ResetResponse(
         message="Full reset completed (admin account preserved)",
@@ -1399,6 +2772,53 @@ async def reset_full(admin: User = Depends(require_admin)):
         }
     )
 
+# Logo cache
+# Every report email attaches the organisation logo. The settings document stores it
+# base64-encoded, so it is decoded once and kept in memory. Each get() first reads
+# just the document's updated_at (a small projected find_one) and reuses the decoded
+# copy while it matches, so an upload or delete made through any worker shows up in
+# the next report this one renders.
+class LogoCache:
+    def __init__(self):
+        self.entry: Optional[tuple] = None  # (version, logo dict or None)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def version(settings: Optional[dict]) -> tuple:
+        # No document at all is a version too (the logo was deleted or never set)
+        return (settings is not None, settings.get("updated_at") if settings else None)
+
+    async def get(self) -> Optional[dict]:
+        """The logo as {"data": bytes, "content_type", "filename"}, or None if none is set"""
+        current = await db.settings.find_one({"key": "logo"}, {"_id": 0, "updated_at": 1})
+        if self.entry and self.entry[0] == self.version(current):
+            self.hits += 1
+            return self.entry[1]
+        self.misses += 1
+        settings = await db.settings.find_one({"key": "logo"}, {"_id": 0})
+        logo = None
+        if settings and settings.get("data"):
+            logo = {
+                "data": base64.b64decode(settings["data"]),
+                "content_type": settings.get("content_type", "image/png"),
+                "filename": settings.get("filename")
+            }
+        # Versioned by the document actually read, in case it changed since the check
+        self.entry = (self.version(settings), logo)
+        return logo
+
+    def stats(self) -> dict:
+        logo = self.entry[1] if self.entry else None
+        return {
+            "cached": self.entry is not None,
+            "size_bytes": len(logo["data"]) if logo else 0,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+logo_cache = LogoCache()
+
 # Settings/Logo endpoints
 @api_router.post("/admin/settings/logo")
 async def upload_logo(file: UploadFile = File(...), current_user: User = Depends(get_current_user)):
@@ -1486,6 +2906,288 @@ async def update_website_settings(
     )
     return {"message": "Settings updated successfully"}
 
+# Mail transport
+# smtplib blocks, and an unreachable server holds each call for the full socket
+# timeout, so every SMTP call site goes through mail_transport: each step (connect,
+# login, send, quit) runs in a small dedicated thread pool and the event loop keeps
+# serving judges. Steps are also bounded by an overall deadline. When it expires, or
+# the awaiting task is cancelled (e.g. POST /admin/jobs/{id}/cancel), the session's
+# socket is shut down so the blocked worker thread fails fast instead of waiting it out.
+# Every message passes through one token bucket (smtp_rate_limit messages per second,
+# 0 = unlimited) so concurrent senders stay under the provider's limit together.
+SMTP_TIMEOUT_SECONDS = float(os.environ.get('SMTP_TIMEOUT_SECONDS', '30'))
+SMTP_OPERATION_TIMEOUT_SECONDS = float(os.environ.get('SMTP_OPERATION_TIMEOUT_SECONDS', '120'))
+SMTP_DEFAULT_MAX_CONNECTIONS = 3
+# How long a bulk sender waits for a pooled session before failing its message
+SMTP_CHECKOUT_TIMEOUT_SECONDS = float(os.environ.get('SMTP_CHECKOUT_TIMEOUT_SECONDS', '120'))
+
+class TokenBucket:
+    """Average `rate` acquisitions per second with bursts of up to max(1, rate); rate 0 = unlimited"""
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.rate = 0.0
+        self.capacity = 1.0
+        self.tokens = 1.0
+        self.updated_at = time.monotonic()
+
+    def configure(self, rate: float):
+        if rate == self.rate:
+            return
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    async def acquire(self) -> float:
+        """Take a token, sleeping until one is available; returns the seconds waited"""
+        if self.rate <= 0:
+            return 0.0
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            if wait:
+                await asyncio.sleep(wait)
+            return wait
+
+class MailSession:
+    """A connected, logged-in SMTP session; use MailTransport.connect/session to get one"""
+    def __init__(self, transport, smtp_settings: dict):
+        self.transport = transport
+        self.settings = smtp_settings
+        self.port = smtp_settings.get("smtp_port", 587)
+        # For port 465 (or TLS switched off) use SSL directly; otherwise STARTTLS
+        self.implicit_tls = self.port == 465 or not smtp_settings.get("smtp_use_tls", True)
+        self.server = None
+
+    def _connect(self):
+        smtp_class = smtplib.SMTP_SSL if self.implicit_tls else smtplib.SMTP
+        self.server = smtp_class(self.settings["smtp_server"], self.port, timeout=SMTP_TIMEOUT_SECONDS)
+        if not self.implicit_tls:
+            self.server.ehlo()
+            self.server.starttls()
+            self.server.ehlo()
+
+    async def open(self):
+        await self.transport.run("connect", self, self._connect)
+        await self.transport.run("login", self, self.server.login,
+                                 self.settings["smtp_email"], self.settings["smtp_password"])
+
+    async def send(self, recipient_email: str, message: str):
+        self.transport.throttled_s += await self.transport.throttle.acquire()
+        await self.transport.run("send", self, self.server.sendmail,
+                                 self.settings["smtp_email"], recipient_email, message)
+
+    async def close(self):
+        if self.server is None or self.server.sock is None:
+            return
+        try:
+            await self.transport.run("quit", self, self.server.quit)
+        except Exception:
+            self.server.close()
+
+    def abort(self):
+        """Break off whatever the worker thread is doing on this session's socket. A
+        connect still in progress has no socket yet; it ends at the socket timeout."""
+        if self.server is None:
+            return
+        sock = self.server.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.server.close()
+
+class MailTransport:
+    STEPS = ("connect", "login", "send", "quit")
+
+    def __init__(self, workers: int, operation_timeout: float):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="smtp")
+        self.workers = workers
+        self.operation_timeout = operation_timeout
+        self.throttle = TokenBucket()
+        self.open_sessions = 0
+        self.in_flight = 0
+        self.aborted = 0
+        self.reconnects = 0
+        self.throttled_s = 0.0
+        self.calls = {k: 0 for k in self.STEPS}
+        self.failures = {k: 0 for k in self.STEPS}
+        self.total_ms = {k: 0.0 for k in self.STEPS}
+        self.max_ms = {k: 0.0 for k in self.STEPS}
+
+    async def run(self, step: str, session: MailSession, func, *args):
+        started_at = time.perf_counter()
+        self.in_flight += 1
+        try:
+            work = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+            return await asyncio.wait_for(work, self.operation_timeout)
+        except asyncio.CancelledError:
+            self.failures[step] += 1
+            self.aborted += 1
+            session.abort()
+            raise
+        except asyncio.TimeoutError:
+            self.failures[step] += 1
+            self.aborted += 1
+            session.abort()
+            raise TimeoutError(f"SMTP {step} did not finish within {self.operation_timeout:g}s")
+        except Exception:
+            self.failures[step] += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            elapsed_ms = (time.perf_counter() - started_at) * 1000
+            self.calls[step] += 1
+            self.total_ms[step] += elapsed_ms
+            self.max_ms[step] = max(self.max_ms[step], elapsed_ms)
+
+    async def connect(self, smtp_settings: dict) -> MailSession:
+        """Open and log in to a session; the caller must release() it"""
+        self.throttle.configure(float(smtp_settings.get("smtp_rate_limit") or 0))
+        session = MailSession(self, smtp_settings)
+        try:
+            await session.open()
+        except BaseException:
+            session.abort()
+            raise
+        self.open_sessions += 1
+        return session
+
+    async def release(self, session: MailSession):
+        self.open_sessions -= 1
+        await session.close()
+
+    @asynccontextmanager
+    async def session(self, smtp_settings: dict):
+        session = await self.connect(smtp_settings)
+        try:
+            yield session
+        finally:
+            await self.release(session)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "operation_timeout_s": self.operation_timeout,
+            "open_sessions": self.open_sessions,
+            "in_flight": self.in_flight,
+            "aborted": self.aborted,
+            "reconnects": self.reconnects,
+            "rate_limit": self.throttle.rate,
+            "throttled_s": round(self.throttled_s, 2),
+            "calls": dict(self.calls),
+            "failures": dict(self.failures),
+            "avg_ms": {k: round(self.total_ms[k] / self.calls[k], 2) if self.calls[k] else 0.0 for k in self.calls},
+            "max_ms": {k: round(v, 2) for k, v in self.max_ms.items()}
+        }
+
+mail_transport = MailTransport(
+    workers=int(os.environ.get('MAIL_WORKERS', '8')),
+    operation_timeout=SMTP_OPERATION_TIMEOUT_SECONDS
+)
+
+class MailSessionPool:
+    """Up to `size` logged-in sessions shared by concurrent senders. Sessions open on
+    demand; one the server has dropped is replaced and the message sent again."""
+    def __init__(self, transport: MailTransport, smtp_settings: dict):
+        self.transport = transport
+        self.settings = smtp_settings
+        max_connections = smtp_settings.get("smtp_max_connections") or SMTP_DEFAULT_MAX_CONNECTIONS
+        # Each concurrent step needs a transport thread
+        self.size = max(1, min(max_connections, transport.workers))
+        self.idle: List[MailSession] = []
+        # Signalled when a session goes back to idle, or the last one is lost
+        self.available = asyncio.Condition()
+        self.sessions = 0
+
+    async def start(self):
+        """Open the first session, so bad settings fail the whole run up front"""
+        self.idle.append(await self._open())
+
+    async def _open(self) -> MailSession:
+        self.sessions += 1
+        try:
+            return await self.transport.connect(self.settings)
+        except BaseException:
+            self.sessions -= 1
+            await self._lost()
+            raise
+
+    async def _discard(self, session: MailSession):
+        self.sessions -= 1
+        await self._lost()
+        await self.transport.release(session)
+
+    async def _lost(self):
+        # With no sessions left nobody will return one to idle: wake the waiters so
+        # they open their own (and fail if the server won't take them)
+        if self.sessions == 0:
+            async with self.available:
+                self.available.notify_all()
+
+    async def _release(self, session: MailSession):
+        async with self.available:
+            self.idle.append(session)
+            self.available.notify()
+
+    async def _checkout(self) -> MailSession:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SMTP_CHECKOUT_TIMEOUT_SECONDS
+        while True:
+            async with self.available:
+                while not self.idle and self.sessions >= self.size:
+                    try:
+                        await asyncio.wait_for(self.available.wait(), max(0, deadline - loop.time()))
+                    except asyncio.TimeoutError:
+                        raise RuntimeError(
+                            f"No SMTP session came free within {SMTP_CHECKOUT_TIMEOUT_SECONDS:g}s") from None
+                if self.idle:
+                    return self.idle.pop()
+            try:
+                return await self._open()
+            except Exception:
+                if self.sessions == 0:
+                    raise
+                # The server won't take another connection; share the ones we have
+                self.size = self.sessions
+
+    async def send(self, recipient_email: str, message: str):
+        session = await self._checkout()
+        for attempt in range(2):
+            try:
+                await session.send(recipient_email, message)
+            except smtplib.SMTPServerDisconnected:
+                # Dropped by the server (idle timeout, per-connection message cap...)
+                if attempt:
+                    await self._discard(session)
+                    raise
+                # Reopen in the same slot, so no waiter takes it in between
+                try:
+                    await self.transport.release(session)
+                finally:
+                    self.sessions -= 1
+                self.transport.reconnects += 1
+                session = await self._open()
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+                # This message was refused; the session itself is still usable
+                await self._release(session)
+                raise
+            except BaseException:
+                await self._discard(session)
+                raise
+            else:
+                await self._release(session)
+                return
+
+    async def close(self):
+        while self.idle:
+            await self._discard(self.idle.pop())
+
 # SMTP Settings
 class SMTPSettings(BaseModel):
     smtp_server: str = ""
@@ -1493,20 +3195,25 @@ class SMTPSettings(BaseModel):
     smtp_email: str = ""
     smtp_password: str = ""
     smtp_use_tls: bool = True
+    smtp_max_connections: int = Field(default=SMTP_DEFAULT_MAX_CONNECTIONS, ge=1, le=20)
+    smtp_rate_limit: float = Field(default=0, ge=0)  # Messages per second, 0 = unlimited
 
 @api_router.get("/admin/settings/smtp")
 async def get_smtp_settings(admin: User = Depends(require_admin)):
     """Get SMTP settings (password masked)"""
     settings = await db.settings.find_one({"key": "smtp"}, {"_id": 0})
     if not settings:
-        return {"smtp_server": "", "smtp_port": 587, "smtp_email": "", "smtp_password": "", "smtp_use_tls": True}
+        return {"smtp_server": "", "smtp_port": 587, "smtp_email": "", "smtp_password": "", "smtp_use_tls": True,
+                "smtp_max_connections": SMTP_DEFAULT_MAX_CONNECTIONS, "smtp_rate_limit": 0}
     # Mask password for security
     return {
         "smtp_server": settings.get("smtp_server", ""),
         "smtp_port": settings.get("smtp_port", 587),
         "smtp_email": settings.get("smtp_email", ""),
         "smtp_password": "********" if settings.get("smtp_password") else "",
-        "smtp_use_tls": settings.get("smtp_use_tls", True)
+        "smtp_use_tls": settings.get("smtp_use_tls", True),
+        "smtp_max_connections": settings.get("smtp_max_connections", SMTP_DEFAULT_MAX_CONNECTIONS),
+        "smtp_rate_limit": settings.get("smtp_rate_limit", 0)
     }
 
 @api_router.put("/admin/settings/smtp")
@@ -1518,6 +3225,8 @@ async def update_smtp_settings(settings: SMTPSettings, admin: User = Depends(req
         "smtp_port": settings.smtp_port,
         "smtp_email": settings.smtp_email,
         "smtp_use_tls": settings.smtp_use_tls,
+        "smtp_max_connections": settings.smtp_max_connections,
+        "smtp_rate_limit": settings.smtp_rate_limit,
         "updated_at": datetime.now(timezone.utc).isoformat()
     }
     # Only update password if it's not masked
@@ -1544,21 +3253,8 @@ async def test_smtp_connection(admin: User = Depends(require_admin)):
         raise HTTPException(status_code=400, detail="SMTP not configured")
     
     try:
-        port = settings.get("smtp_port", 587)
-        use_tls = settings.get("smtp_use_tls", True)
-        
-        # For port 465, use SSL directly; for 587, use STARTTLS
-        if port == 465 or not use_tls:
-            server = smtplib.SMTP_SSL(settings["smtp_server"], port, timeout=30)
-        else:
-            server = smtplib.SMTP(settings["smtp_server"], port, timeout=30)
-            server.ehlo()
-            if use_tls:
-                server.starttls()
-                server.ehlo()
-        
-        server.login(settings["smtp_email"], settings["smtp_password"])
-        server.quit()
+        async with mail_transport.session(settings):
+            pass
         return {"message": "SMTP connection successful"}
     except smtplib.SMTPAuthenticationError as e:
         raise HTTPException(status_code=400, detail=f"Authentication failed: Check email/password. {str(e)}")
@@ -1587,280 +3283,21 @@ async def send_competitor_report(request: EmailRequest, admin: User = Depends(re
     if not smtp_settings or not smtp_settings.get("smtp_server"):
         raise HTTPException(status_code=400, detail="SMTP not configured")
     
-    # Get competitor info
-    competitor = await db.competitors.find_one({"id": request.competitor_id}, {"_id": 0})
-    if not competitor:
+    try:
+        email_data = await generate_competitor_email_html(request.competitor_id, round_id=request.round_id)
+    except ReportCompetitorNotFound:
         raise HTTPException(status_code=404, detail="Competitor not found")
-    
-    # Get class info
-    comp_class = await db.classes.find_one({"id": competitor.get("class_id")}, {"_id": 0})
-    class_name = comp_class.get("name", "Unknown") if comp_class else "Unknown"
-    
-    # Get event info
-    event = await db.events.find_one({"is_active": {"$ne": False}}, {"_id": 0})
-    event_name = event.get("name", "Burnout Competition") if event else "Burnout Competition"
-    event_date = event.get("date", "") if event else ""
-    
-    # Format date as DD/MM/YYYY
-    if event_date:
-        try:
-            date_obj = datetime.fromisoformat(event_date.replace('Z', '+00:00')) if 'T' in event_date else datetime.strptime(event_date, '%Y-%m-%d')
-            event_date = date_obj.strftime('%d/%m/%Y')
-        except:
-            pass
-    
-    # Get website settings
-    website_settings = await db.settings.find_one({"key": "website"}, {"_id": 0})
-    website_url = website_settings.get("website_url", "") if website_settings else ""
-    org_name = website_settings.get("organization_name", "") if website_settings else ""
-    
-    # Get logo
-    logo_settings = await db.settings.find_one({"key": "logo"}, {"_id": 0})
-    logo_data = None
-    if logo_settings and logo_settings.get("data"):
-        logo_data = f"data:{logo_settings['content_type']};base64,{logo_settings['data']}"
-    
-    # Get scores for this competitor
-    score_filter = {"competitor_id": request.competitor_id}
-    if request.round_id:
-        score_filter["round_id"] = request.round_id
-    
-    scores = await db.scores.find(score_filter, {"_id": 0}).to_list(1000)
-    if not scores:
+    except ReportUnavailable:
         raise HTTPException(status_code=404, detail="No scores found for this competitor")
     
-    # Get rounds info
-    rounds = await db.rounds.find({}, {"_id": 0}).to_list(100)
-    rounds_dict = {r["id"]: r for r in rounds}
-    
-    # Get judges info
-    judges = await db.users.find({"role": "judge"}, {"_id": 0}).to_list(100)
-    judges_dict = {j["id"]: j for j in judges}
-    
-    # Group scores by round
-    scores_by_round = {}
-    for score in scores:
-        round_id = score["round_id"]
-        if round_id not in scores_by_round:
-            scores_by_round[round_id] = []
-        scores_by_round[round_id].append(score)
-    
-    # Build HTML email
-    html_content = f"""
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }}
-            .header {{ text-align: center; border-bottom: 2px solid #f97316; padding-bottom: 15px; margin-bottom: 20px; }}
-            .header img {{ max-height: 60px; margin-bottom: 10px; }}
-            .event-name {{ font-size: 20px; font-weight: bold; margin-bottom: 5px; }}
-            .event-date {{ font-size: 14px; color: #666; }}
-            .competitor-info {{ background: #f5f5f5; padding: 15px; border-radius: 8px; margin-bottom: 20px; }}
-            .competitor-number {{ font-size: 24px; font-weight: bold; color: #f97316; }}
-            .round-section {{ margin-bottom: 25px; border: 1px solid #ddd; border-radius: 8px; overflow: hidden; }}
-            .round-header {{ background: #f97316; color: white; padding: 10px 15px; font-weight: bold; }}
-            .score-table {{ width: 100%; border-collapse: collapse; }}
-            .score-table th, .score-table td {{ padding: 8px 12px; text-align: left; border-bottom: 1px solid #eee; }}
-            .score-table th {{ background: #f9f9f9; font-size: 12px; color: #666; }}
-            .category-row td {{ font-weight: 500; }}
-            .penalty-row td {{ color: #dc2626; }}
-            .total-row {{ background: #f0fdf4; }}
-            .total-row td {{ font-weight: bold; font-size: 16px; }}
-            .dq-row {{ background: #fef2f2; }}
-            .dq-row td {{ color: #dc2626; font-weight: bold; }}
-            .judge-name {{ font-size: 12px; color: #666; }}
-            .footer {{ text-align: center; margin-top: 30px; padding-top: 15px; border-top: 1px solid #ddd; font-size: 12px; color: #999; }}
-            .summary-box {{ background: #fff7ed; border: 2px solid #f97316; border-radius: 8px; padding: 15px; margin-top: 20px; text-align: center; }}
-            .summary-score {{ font-size: 32px; font-weight: bold; color: #f97316; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            {f'<img src="{logo_data}" alt="Logo" /><br/>' if logo_data else ''}
-            <div class="event-name">{event_name}</div>
-            {f'<div class="event-date">{event_date}</div>' if event_date else ''}
-        </div>
-        
-        <div class="competitor-info">
-            <span class="competitor-number">#{competitor.get('car_number', '?')}</span>
-            <strong>{competitor.get('name', 'Unknown')}</strong><br/>
-            <span style="color: #666;">Vehicle: {competitor.get('vehicle_info', 'N/A')} | Class: {class_name}</span>
-        </div>
-    """
-    
-    total_scores = []
-    minor_round_scores = []  # Only scores from minor rounds for grand total
-    
-    for round_id, round_scores in scores_by_round.items():
-        round_info = rounds_dict.get(round_id, {})
-        round_name = round_info.get("name", "Unknown Round")
-        is_minor = round_info.get("is_minor", False)
-        
-        html_content += f"""
-        <div class="round-section">
-            <div class="round-header">{round_name}{" (Minor Round)" if is_minor else ""}</div>
-            <table class="score-table">
-                <thead>
-                    <tr>
-                        <th>Category</th>
-        """
-        
-        # Add judge columns - number them as Judge 1, Judge 2, etc.
-        for idx, score in enumerate(round_scores, start=1):
-            html_content += f'<th class="judge-name">Judge {idx}</th>'
-        
-        html_content += """
-                    </tr>
-                </thead>
-                <tbody>
-        """
-        
-        # Score categories
-        categories = [
-            ("Tip In", "tip_in", "0-10"),
-            ("Instant Smoke", "instant_smoke", "0-10"),
-            ("Constant Smoke", "constant_smoke", "0-20"),
-            ("Volume of Smoke", "volume_of_smoke", "0-20"),
-            ("Driving Skill", "driving_skill", "0-40"),
-            ("Tyres Popped", "tyres_popped", "×5 pts")
-        ]
-        
-        for cat_name, cat_key, cat_range in categories:
-            html_content += f'<tr class="category-row"><td>{cat_name} <span style="color:#999;font-size:11px;">({cat_range})</span></td>'
-            for score in round_scores:
-                val = score.get(cat_key, 0)
-                if cat_key == "tyres_popped":
-                    html_content += f'<td>{val} ({val * 5} pts)</td>'
-                else:
-                    html_content += f'<td>{val}</td>'
-            html_content += '</tr>'
-        
-        # Subtotal row
-        html_content += '<tr style="background:#f9f9f9;"><td><strong>Score Subtotal</strong></td>'
-        for score in round_scores:
-            html_content += f'<td><strong>{score.get("score_subtotal", 0)}</strong></td>'
-        html_content += '</tr>'
-        
-        # Penalties
-        penalties = [
-            ("Reversing", "penalty_reversing", -5),
-            ("Stopping", "penalty_stopping", -5),
-            ("Contact with Barrier", "penalty_contact_barrier", -5),
-            ("Small Fire", "penalty_small_fire", -5),
-            ("Failed to Drive Off", "penalty_failed_drive_off", -10),
-            ("Large Fire", "penalty_large_fire", -10)
-        ]
-        
-        html_content += '<tr><td colspan="100%" style="background:#fef2f2;padding:5px 12px;font-weight:bold;color:#dc2626;">Penalties</td></tr>'
-        
-        for pen_name, pen_key, pen_pts in penalties:
-            has_penalty = any(score.get(pen_key, 0) > 0 for score in round_scores)
-            if has_penalty:
-                html_content += f'<tr class="penalty-row"><td>{pen_name} ({pen_pts} pts)</td>'
-                for score in round_scores:
-                    val = score.get(pen_key, 0)
-                    if val > 0:
-                        html_content += f'<td>-{val * abs(pen_pts)}</td>'
-                    else:
-                        html_content += '<td>-</td>'
-                html_content += '</tr>'
-        
-        # Penalty total
-        html_content += '<tr style="background:#fef2f2;"><td><strong>Penalty Total</strong></td>'
-        for score in round_scores:
-            penalty_total = score.get("penalty_total", 0)
-            html_content += f'<td><strong>-{penalty_total}</strong></td>'
-        html_content += '</tr>'
-        
-        # Final score row
-        for score in round_scores:
-            is_dq = score.get("penalty_disqualified", False)
-            if is_dq:
-                html_content += '<tr class="dq-row"><td><strong>DISQUALIFIED</strong></td>'
-                for s in round_scores:
-                    if s.get("penalty_disqualified", False):
-                        html_content += '<td>0 (DQ)</td>'
-                    else:
-                        html_content += f'<td>{s.get("final_score", 0)}</td>'
-                html_content += '</tr>'
-                break
-        
-        html_content += '<tr class="total-row"><td>Final Score</td>'
-        for score in round_scores:
-            final = score.get("final_score", 0)
-            total_scores.append(final)
-            # Track minor round scores separately for grand total
-            if is_minor:
-                minor_round_scores.append(final)
-            if score.get("penalty_disqualified", False):
-                html_content += '<td style="color:#dc2626;">0 (DQ)</td>'
-            else:
-                html_content += f'<td>{final}</td>'
-        html_content += '</tr>'
-        
-        html_content += """
-                </tbody>
-            </table>
-        </div>
-        """
-    
-    # Count minor rounds for the summary
-    minor_round_count = sum(1 for rid in scores_by_round.keys() if rounds_dict.get(rid, {}).get("is_minor", False))
-    
-    # Summary - show minor rounds total/average if available
-    if minor_round_scores:
-        avg_score = sum(minor_round_scores) / len(minor_round_scores)
-        total_score = sum(minor_round_scores)
-        html_content += f"""
-        <div class="summary-box">
-            <div>Minor Rounds Total: <span class="summary-score">{total_score:.1f}</span></div>
-            <div style="color:#666;margin-top:5px;">Minor Rounds Average: {avg_score:.2f} (from {minor_round_count} minor round(s))</div>
-        </div>
-        """
-    
-    html_content += f"""
-        <div class="footer">
-            Generated on {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}<br/>
-            {website_url}
-        </div>
-    </body>
-    </html>
-    """
-    
     # Send email
     try:
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = f"Burnout Scores - #{competitor.get('car_number', '?')} {competitor.get('name', '')} - {event_name}"
-        msg['From'] = smtp_settings["smtp_email"]
-        msg['To'] = request.recipient_email
-        
-        # Use base64 encoding to avoid line length issues
-        html_part = MIMEText(html_content, 'html', 'utf-8')
-        html_part.replace_header('Content-Transfer-Encoding', 'base64')
-        msg.attach(html_part)
-        
-        port = smtp_settings.get("smtp_port", 587)
-        use_tls = smtp_settings.get("smtp_use_tls", True)
-        
-        # For port 465, use SSL directly; for 587, use STARTTLS
-        if port == 465 or not use_tls:
-            server = smtplib.SMTP_SSL(smtp_settings["smtp_server"], port, timeout=30)
-        else:
-            server = smtplib.SMTP(smtp_settings["smtp_server"], port, timeout=30)
-            server.ehlo()
-            if use_tls:
-                server.starttls()
-                server.ehlo()
-        
-        server.login(smtp_settings["smtp_email"], smtp_settings["smtp_password"])
-        server.sendmail(smtp_settings["smtp_email"], request.recipient_email, msg.as_string())
-        server.quit()
+        msg = build_report_message(email_data, smtp_settings["smtp_email"], request.recipient_email)
+        async with mail_transport.session(smtp_settings) as session:
+            await session.send(request.recipient_email, msg.as_string())
         
         # Mark scores as emailed
-        await db.scores.update_many(
-            {"competitor_id": request.competitor_id} if not request.round_id else {"competitor_id": request.competitor_id, "round_id": request.round_id},
-            {"$set": {"email_sent": True}}
-        )
+        await mark_rounds_emailed(request.competitor_id, request.round_id)
         
         return {"message": f"Email sent successfully to {request.recipient_email}"}
     except smtplib.SMTPAuthenticationError as e:
@@ -1868,57 +3305,23 @@ async def send_competitor_report(request: EmailRequest, admin: User = Depends(re
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
 
-# Helper function to create email HTML content
-async def get_completed_rounds_for_competitor(competitor_id: str):
-    """Get all round IDs where this competitor has complete scoring from all active judges"""
-    # Get active judges
-    active_judges = await db.users.find(
-        {"role": "judge", "is_active": {"$ne": False}},
-        {"_id": 0, "id": 1}
-    ).to_list(100)
-    active_judge_ids = [j["id"] for j in active_judges]
-    active_judge_count = len(active_judge_ids)
-    
-    if active_judge_count == 0:
-        return []
-    
-    # Get all scores for this competitor
-    scores = await db.scores.find({"competitor_id": competitor_id}, {"_id": 0}).to_list(1000)
-    
-    # Group by round and check if all active judges have scored
-    scores_by_round = {}
-    for score in scores:
-        rid = score["round_id"]
-        if rid not in scores_by_round:
-            scores_by_round[rid] = set()
-        if score["judge_id"] in active_judge_ids:
-            scores_by_round[rid].add(score["judge_id"])
-    
-    # Return round IDs where all active judges have scored
-    completed_rounds = [rid for rid, judges in scores_by_round.items() 
-                        if len(judges) >= active_judge_count]
-    return completed_rounds
+class ReportUnavailable(Exception):
+    """A competitor has no report to send; the message says why"""
 
+class ReportCompetitorNotFound(ReportUnavailable):
+    def __init__(self):
+        super().__init__("Competitor not found")
 
-async def generate_competitor_email_html(competitor_id: str, round_id: Optional[str] = None, include_all_completed: bool = False):
-    """Generate HTML email content for a competitor's scores
-    
-    Args:
-        competitor_id: The competitor's ID
-        round_id: Specific round to include (if None and include_all_completed=False, includes all)
-        include_all_completed: If True, include all rounds where all active judges have scored
-    """
-    # Get competitor info
-    competitor = await db.competitors.find_one({"id": competitor_id}, {"_id": 0})
-    if not competitor:
-        return None, "Competitor not found"
-    
-    # Get class info
-    comp_class = await db.classes.find_one({"id": competitor.get("class_id")}, {"_id": 0})
-    class_name = comp_class.get("name", "Unknown") if comp_class else "Unknown"
-    
-    # Get event info
-    event = await db.events.find_one({"is_active": {"$ne": False}}, {"_id": 0})
+# Helper function to create email HTML content
+async def load_report_context() -> dict:
+    """Data shared by every competitor's report: active event, website URL, logo, rounds and classes"""
+    event, website_settings, logo, rounds, classes = await asyncio.gather(
+        db.events.find_one({"is_active": {"$ne": False}}, {"_id": 0}),
+        db.settings.find_one({"key": "website"}, {"_id": 0}),
+        logo_cache.get(),
+        db.rounds.find({}, {"_id": 0}).to_list(100),
+        db.classes.find({}, {"_id": 0}).to_list(None)
+    )
     event_name = event.get("name", "Burnout Competition") if event else "Burnout Competition"
     event_date = event.get("date", "") if event else ""
     
@@ -1930,260 +3333,513 @@ async def generate_competitor_email_html(competitor_id: str, round_id: Optional[
         except:
             pass
     
-    # Get website settings
-    website_settings = await db.settings.find_one({"key": "website"}, {"_id": 0})
-    website_url = website_settings.get("website_url", "") if website_settings else ""
-    
-    # Get logo
-    logo_settings = await db.settings.find_one({"key": "logo"}, {"_id": 0})
-    logo_data = None
-    if logo_settings and logo_settings.get("data"):
-        logo_data = f"data:{logo_settings['content_type']};base64,{logo_settings['data']}"
+    return {
+        "event_name": event_name,
+        "website_url": website_settings.get("website_url", "") if website_settings else "",
+        "logo": logo,
+        "header_html": render_report_header(f"cid:{REPORT_LOGO_CID}" if logo else None, event_name, event_date),
+        "rounds_dict": {r["id"]: r for r in rounds},
+        "classes_dict": {c["id"]: c for c in classes}
+    }
+
+class ReportBatch:
+    """Everything needed to render many competitors' all-completed-rounds reports,
+    fetched up front: the shared context once, then the competitors, their completed
+    rounds and their scores in one $in query each. render() then works from memory."""
+    def __init__(self, context: dict, competitors: dict, completed_rounds: dict, scores: dict):
+        self.context = context
+        self.competitors = competitors
+        self.completed_rounds = completed_rounds
+        self.scores = scores
+
+    @classmethod
+    async def load(cls, competitor_ids: List[str]) -> "ReportBatch":
+        competitor_ids = list(set(competitor_ids))
+        context, competitors, entries = await asyncio.gather(
+            load_report_context(),
+            db.competitors.find({"id": {"$in": competitor_ids}}, {"_id": 0}).to_list(None),
+            db.round_completeness.find(
+                {"competitor_id": {"$in": competitor_ids}, "complete": True},
+                {"_id": 0, "competitor_id": 1, "round_id": 1}
+            ).to_list(None)
+        )
+        completed_rounds = {}
+        for entry in entries:
+            completed_rounds.setdefault(entry["competitor_id"], set()).add(entry["round_id"])
+        
+        scores = {}
+        if completed_rounds:
+            round_ids = list(set().union(*completed_rounds.values()))
+            async for score in db.scores.find(
+                {"competitor_id": {"$in": list(completed_rounds)}, "round_id": {"$in": round_ids}}, {"_id": 0}
+            ):
+                # The $in pair can match rounds another competitor completed; keep only this competitor's
+                if score["round_id"] in completed_rounds[score["competitor_id"]]:
+                    scores.setdefault(score["competitor_id"], []).append(score)
+        
+        return cls(context, {c["id"]: c for c in competitors}, completed_rounds, scores)
+
+    def render(self, competitor_id: str) -> dict:
+        """Report for one competitor; raises ReportUnavailable if there is nothing to send"""
+        competitor = self.competitors.get(competitor_id)
+        if not competitor:
+            raise ReportCompetitorNotFound()
+        if not self.completed_rounds.get(competitor_id):
+            raise ReportUnavailable("No completed rounds found")
+        scores = self.scores.get(competitor_id)
+        if not scores:
+            raise ReportUnavailable("No scores found")
+        return render_competitor_report(self.context, competitor, scores)
+
+async def generate_competitor_email_html(competitor_id: str, round_id: Optional[str] = None, include_all_completed: bool = False) -> dict:
+    """Generate HTML email content for a competitor's scores. Raises ReportUnavailable
+    (ReportCompetitorNotFound for an unknown competitor) when there is nothing to send.
     
-    # Determine which rounds to include
+    Args:
+        competitor_id: The competitor's ID
+        round_id: Specific round to include (if None and include_all_completed=False, includes all)
+        include_all_completed: If True, include all rounds where all active judges have scored
+    """
     if include_all_completed:
-        # Get all completed rounds for this competitor
-        completed_round_ids = await get_completed_rounds_for_competitor(competitor_id)
-        if not completed_round_ids:
-            return None, "No completed rounds found"
-        # Get scores for all completed rounds
-        scores = await db.scores.find(
-            {"competitor_id": competitor_id, "round_id": {"$in": completed_round_ids}}, 
-            {"_id": 0}
-        ).to_list(1000)
-    else:
-        # Original behavior - specific round or all
-        score_filter = {"competitor_id": competitor_id}
-        if round_id:
-            score_filter["round_id"] = round_id
-        scores = await db.scores.find(score_filter, {"_id": 0}).to_list(1000)
+        batch = await ReportBatch.load([competitor_id])
+        return batch.render(competitor_id)
     
-    if not scores:
-        return None, "No scores found"
+    # Get competitor info
+    competitor = await db.competitors.find_one({"id": competitor_id}, {"_id": 0})
+    if not competitor:
+        raise ReportCompetitorNotFound()
     
-    # Get rounds and judges info
-    rounds = await db.rounds.find({}, {"_id": 0}).to_list(100)
-    rounds_dict = {r["id"]: r for r in rounds}
-    judges = await db.users.find({"role": "judge"}, {"_id": 0}).to_list(100)
-    judges_dict = {j["id"]: j for j in judges}
+    # Specific round or all
+    score_filter = {"competitor_id": competitor_id}
+    if round_id:
+        score_filter["round_id"] = round_id
+    scores = await db.scores.find(score_filter, {"_id": 0}).to_list(1000)
+    if not scores:
+        raise ReportUnavailable("No scores found")
+    
+    return render_competitor_report(await load_report_context(), competitor, scores)
+
+# Score report rendering
+# One renderer builds the report for both the single send and bulk email. Everything
+# that doesn't depend on the competitor is prepared ahead of time: the document head
+# and stylesheet are a module constant, row labels are pre-built HTML fragments, and
+# the event header (logo, name, date) is rendered once per ReportBatch by
+# load_report_context. Per competitor only the score cells are formatted, into a list
+# joined once at the end. Text from the database is HTML-escaped.
+REPORT_HEAD = """<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
+        .header { text-align: center; border-bottom: 2px solid #f97316; padding-bottom: 15px; margin-bottom: 20px; }
+        .header img { max-height: 60px; margin-bottom: 10px; }
+        .event-name { font-size: 20px; font-weight: bold; margin-bottom: 5px; }
+        .event-date { font-size: 14px; color: #666; }
+        .competitor-info { background: #f5f5f5; padding: 15px; border-radius: 8px; margin-bottom: 20px; }
+        .competitor-number { font-size: 24px; font-weight: bold; color: #f97316; }
+        .round-section { margin-bottom: 25px; border: 1px solid #ddd; border-radius: 8px; overflow: hidden; }
+        .round-header { background: #f97316; color: white; padding: 10px 15px; font-weight: bold; }
+        .score-table { width: 100%; border-collapse: collapse; }
+        .score-table th, .score-table td { padding: 8px 12px; text-align: left; border-bottom: 1px solid #eee; }
+        .score-table th { background: #f9f9f9; font-size: 12px; color: #666; }
+        .category-row td { font-weight: 500; }
+        .penalty-row td { color: #dc2626; }
+        .total-row { background: #f0fdf4; }
+        .total-row td { font-weight: bold; font-size: 16px; }
+        .dq-row { background: #fef2f2; }
+        .dq-row td { color: #dc2626; font-weight: bold; }
+        .judge-name { font-size: 12px; color: #666; }
+        .round-summary { background: #f0fdf4; padding: 10px; text-align: right; border-top: 2px solid #22c55e; }
+        .footer { text-align: center; margin-top: 30px; padding-top: 15px; border-top: 1px solid #ddd; font-size: 12px; color: #999; }
+        .summary-box { background: #fff7ed; border: 2px solid #f97316; border-radius: 8px; padding: 15px; margin-top: 20px; text-align: center; }
+        .summary-score { font-size: 32px; font-weight: bold; color: #f97316; }
+    </style>
+</head>
+<body>
+"""
+
+# (label, score field, points)
+REPORT_CATEGORIES = [
+    ("Tip In", "tip_in", "0-10"),
+    ("Instant Smoke", "instant_smoke", "0-10"),
+    ("Constant Smoke", "constant_smoke", "0-20"),
+    ("Volume of Smoke", "volume_of_smoke", "0-20"),
+    ("Driving Skill", "driving_skill", "0-40")
+]
+# (label, score field, points per occurrence)
+REPORT_PENALTIES = [
+    ("Reversing", "penalty_reversing", 5),
+    ("Stopping", "penalty_stopping", 5),
+    ("Contact with Barrier", "penalty_contact_barrier", 5),
+    ("Small Fire", "penalty_small_fire", 5),
+    ("Failed to Drive Off", "penalty_failed_drive_off", 10),
+    ("Large Fire", "penalty_large_fire", 10)
+]
+# Every score field a report reads, in the order read_report_fields returns them
+REPORT_SCORE_DEFAULTS = {
+    **{key: 0 for _, key, _ in REPORT_CATEGORIES},
+    "tyres_popped": 0, "score_subtotal": 0, "penalty_total": 0, "final_score": 0, "penalty_disqualified": False,
+    **{key: 0 for _, key, _ in REPORT_PENALTIES}
+}
+read_report_fields = itemgetter(*REPORT_SCORE_DEFAULTS)
+
+# The logo travels as an inline MIME part (see build_report_message) rather than a
+# data: URI in the HTML, which many mail clients strip
+REPORT_LOGO_CID = "logo@burnout-scoring"
+
+def render_report_header(logo_src: Optional[str], event_name: str, event_date: str) -> str:
+    """The event header shared by every report in a batch"""
+    logo = f'<img src="{html_lib.escape(logo_src)}" alt="Logo" /><br/>' if logo_src else ''
+    date = f'<div class="event-date">{html_lib.escape(event_date)}</div>' if event_date else ''
+    return f'<div class="header">{logo}<div class="event-name">{html_lib.escape(event_name)}</div>{date}</div>\n'
+
+@lru_cache(maxsize=None)
+def report_round_template(judges: int, penalty_rows: tuple, disqualified: bool) -> str:
+    """str.format template for one round's section: the static markup for this many
+    judges, with a {} per value. Only the penalty rows in use (indexes into
+    REPORT_PENALTIES) and the DISQUALIFIED row when needed are included."""
+    cells = "<td>{}</td>" * judges
+    parts = ['<div class="round-section"><div class="round-header">{}{}</div><table class="score-table"><thead><tr><th>Category</th>',
+             "".join(f'<th class="judge-name">Judge {number}</th>' for number in range(1, judges + 1)),
+             '</tr></thead><tbody>']
+    for name, _, points in REPORT_CATEGORIES:
+        parts.append(f'<tr class="category-row"><td>{name} <span style="color:#999;font-size:11px;">({points})</span></td>{cells}</tr>')
+    parts.append('<tr class="category-row"><td>Tyres Popped <span style="color:#999;font-size:11px;">(×5 pts)</span></td>' +
+                 "<td>{} ({} pts)</td>" * judges + '</tr>')
+    parts.append('<tr style="background:#f9f9f9;"><td><strong>Score Subtotal</strong></td>' +
+                 "<td><strong>{}</strong></td>" * judges + '</tr>')
+    parts.append('<tr><td colspan="100%" style="background:#fef2f2;padding:5px 12px;font-weight:bold;color:#dc2626;">Penalties</td></tr>')
+    for index in penalty_rows:
+        name, _, points = REPORT_PENALTIES[index]
+        parts.append(f'<tr class="penalty-row"><td>{name} (-{points} pts)</td>{cells}</tr>')
+    if disqualified:
+        parts.append(f'<tr class="dq-row"><td>DISQUALIFIED</td>{cells}</tr>')
+    parts.append('<tr style="background:#fef2f2;"><td><strong>Penalty Total</strong></td>' +
+                 "<td><strong>-{}</strong></td>" * judges + '</tr>')
+    # Final score cells come pre-built (a DQ cell is styled differently)
+    parts.append('<tr class="total-row"><td>Final Score</td>' + "{}" * judges)
+    parts.append('</tr></tbody></table><div class="round-summary"><strong>Round Total: {:.1f}</strong> '
+                 '&nbsp;|&nbsp; Average: {:.2f}</div></div>\n')
+    return "".join(parts)
+
+def render_competitor_report(context: dict, competitor: dict, scores: List[dict]) -> dict:
+    """Build the report HTML from prefetched data (no database access)"""
+    escape = html_lib.escape
+    rounds_dict = context["rounds_dict"]
+    comp_class = context["classes_dict"].get(competitor.get("class_id"))
+    class_name = comp_class.get("name", "Unknown") if comp_class else "Unknown"
     
     # Group scores by round
     scores_by_round = {}
     for score in scores:
-        rid = score["round_id"]
-        if rid not in scores_by_round:
-            scores_by_round[rid] = []
-        scores_by_round[rid].append(score)
-    
-    # Build HTML (simplified version for bulk)
-    html = f"""<html><head><style>
-        body {{ font-family: Arial, sans-serif; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }}
-        .header {{ text-align: center; border-bottom: 2px solid #f97316; padding-bottom: 15px; margin-bottom: 20px; }}
-        .event-name {{ font-size: 20px; font-weight: bold; }}
-        .event-date {{ font-size: 14px; color: #666; }}
-        .competitor-info {{ background: #f5f5f5; padding: 15px; border-radius: 8px; margin-bottom: 20px; }}
-        .competitor-number {{ font-size: 24px; font-weight: bold; color: #f97316; }}
-        .round-section {{ margin-bottom: 20px; border: 1px solid #ddd; border-radius: 8px; overflow: hidden; }}
-        .round-header {{ background: #f97316; color: white; padding: 10px 15px; font-weight: bold; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th, td {{ padding: 8px; text-align: left; border-bottom: 1px solid #eee; }}
-        th {{ background: #f9f9f9; font-size: 12px; }}
-        .total-row {{ background: #f0fdf4; font-weight: bold; }}
-        .summary-box {{ background: #fff7ed; border: 2px solid #f97316; border-radius: 8px; padding: 15px; margin-top: 20px; text-align: center; }}
-        .summary-score {{ font-size: 32px; font-weight: bold; color: #f97316; }}
-        .footer {{ text-align: center; margin-top: 30px; font-size: 12px; color: #999; }}
-    </style></head><body>
-    <div class="header">
-        {f'<img src="{logo_data}" style="max-height:60px;margin-bottom:10px;" /><br/>' if logo_data else ''}
-        <div class="event-name">{event_name}</div>
-        {f'<div class="event-date">{event_date}</div>' if event_date else ''}
-    </div>
-    <div class="competitor-info">
-        <span class="competitor-number">#{competitor.get('car_number', '?')}</span>
-        <strong>{competitor.get('name', 'Unknown')}</strong><br/>
-        <span style="color:#666;">Vehicle: {competitor.get('vehicle_info', 'N/A')} | Class: {class_name}</span>
-    </div>"""
-    
-    total_scores = []
-    minor_round_scores = []  # Only scores from minor rounds for grand total
+        scores_by_round.setdefault(score["round_id"], []).append(score)
+    
+    parts = [
+        REPORT_HEAD,
+        context["header_html"],
+        f'<div class="competitor-info"><span class="competitor-number">#{escape(str(competitor.get("car_number", "?")))}</span> '
+        f'<strong>{escape(competitor.get("name", "Unknown"))}</strong><br/>'
+        f'<span style="color: #666;">Vehicle: {escape(competitor.get("vehicle_info") or "N/A")} | Class: {escape(class_name)}</span></div>\n'
+    ]
+    minor_scores = []  # Only scores from minor rounds for grand total
+    minor_round_count = 0
+    category_count = len(REPORT_CATEGORIES)
     
     for rid, round_scores in scores_by_round.items():
         round_info = rounds_dict.get(rid, {})
-        round_name = round_info.get("name", "Unknown Round")
         is_minor = round_info.get("is_minor", False)
-        
-        html += f'<div class="round-section"><div class="round-header">{round_name}{" (Minor Round)" if is_minor else ""}</div><table><tr><th>Category</th>'
-        # Number judges as Judge 1, Judge 2, etc.
-        for idx, score in enumerate(round_scores, start=1):
-            html += f'<th style="font-size:11px;">Judge {idx}</th>'
-        html += '</tr>'
-        
-        categories = [("Tip In", "tip_in"), ("Instant Smoke", "instant_smoke"), ("Constant Smoke", "constant_smoke"),
-                      ("Volume of Smoke", "volume_of_smoke"), ("Driving Skill", "driving_skill"), ("Tyres Popped", "tyres_popped")]
-        for cat_name, cat_key in categories:
-            html += f'<tr><td>{cat_name}</td>'
-            for score in round_scores:
-                html += f'<td>{score.get(cat_key, 0)}</td>'
-            html += '</tr>'
-        
-        # Penalty breakdown - show individual penalties
-        penalty_types = [
-            ("Reversing (-5)", "penalty_reversing"),
-            ("Stopping (-5)", "penalty_stopping"),
-            ("Contact Barrier (-5)", "penalty_contact_barrier"),
-            ("Small Fire (-5)", "penalty_small_fire"),
-            ("Failed Drive Off (-10)", "penalty_failed_drive_off"),
-            ("Large Fire (-10)", "penalty_large_fire")
-        ]
-        
-        html += '<tr style="background:#fef2f2;"><td colspan="100%" style="font-weight:bold;color:#dc2626;padding-top:10px;">Penalties</td></tr>'
-        
-        for penalty_name, penalty_key in penalty_types:
-            # Check if any judge applied this penalty
-            has_penalty = any(score.get(penalty_key, 0) > 0 for score in round_scores)
-            if has_penalty:
-                html += f'<tr style="background:#fef2f2;"><td style="padding-left:20px;color:#991b1b;">{penalty_name}</td>'
-                for score in round_scores:
-                    penalty_val = score.get(penalty_key, 0)
-                    if penalty_val > 0:
-                        html += f'<td style="color:#dc2626;">-{penalty_val}</td>'
-                    else:
-                        html += '<td style="color:#999;">-</td>'
-                html += '</tr>'
-        
-        # Show disqualified status if any
-        has_dq = any(score.get("penalty_disqualified", False) for score in round_scores)
-        if has_dq:
-            html += '<tr style="background:#fef2f2;"><td style="padding-left:20px;color:#991b1b;font-weight:bold;">DISQUALIFIED</td>'
-            for score in round_scores:
-                if score.get("penalty_disqualified", False):
-                    html += '<td style="color:#dc2626;font-weight:bold;">YES</td>'
-                else:
-                    html += '<td style="color:#999;">-</td>'
-            html += '</tr>'
-        
-        # Penalty total row
-        html += '<tr style="background:#fef2f2;border-top:1px solid #fca5a5;"><td style="font-weight:bold;">Total Penalties</td>'
-        for score in round_scores:
-            html += f'<td style="color:#dc2626;font-weight:bold;">-{score.get("penalty_total", 0)}</td>'
-        html += '</tr>'
-        
-        html += '<tr class="total-row"><td>Final Score</td>'
-        for score in round_scores:
-            final = score.get("final_score", 0)
-            total_scores.append(final)
-            # Track minor round scores separately for grand total
-            if is_minor:
-                minor_round_scores.append(final)
-            if score.get("penalty_disqualified"):
-                html += '<td style="color:#dc2626;">0 (DQ)</td>'
-            else:
-                html += f'<td>{final}</td>'
-        html += '</tr></table>'
-        
-        # Add round summary (total and average for this round)
-        round_total = sum(total_scores[-len(round_scores):])  # Only scores from this round
-        round_avg = round_total / len(round_scores) if round_scores else 0
-        html += f'''<div style="background:#f0fdf4;padding:10px;text-align:right;border-top:2px solid #22c55e;">
-            <strong>Round Total: {round_total:.1f}</strong> &nbsp;|&nbsp; Average: {round_avg:.2f}
-        </div></div>'''
-    
-    # Count minor rounds for the summary
-    minor_round_count = sum(1 for rid in scores_by_round.keys() if rounds_dict.get(rid, {}).get("is_minor", False))
+        # One column of values per score field, one entry per judge
+        columns = list(zip(*[read_report_fields({**REPORT_SCORE_DEFAULTS, **score}) for score in round_scores]))
+        tyres, subtotals, penalty_totals, finals, dq = columns[category_count:category_count + 5]
+        penalties = columns[category_count + 5:]
+        if is_minor:
+            minor_scores.extend(finals)
+            minor_round_count += 1
+        
+        # Only penalties some judge applied get a row (most rounds have none at all)
+        penalty_rows = tuple(index for index, counts in enumerate(penalties)
+                             if any(count > 0 for count in counts)) if any(penalty_totals) else ()
+        disqualified = any(dq)
+        
+        values = [escape(round_info.get("name", "Unknown Round")), " (Minor Round)" if is_minor else ""]
+        for column in columns[:category_count]:
+            values.extend(column)
+        values.extend(value for count in tyres for value in (count, count * 5))
+        values.extend(subtotals)
+        for index in penalty_rows:
+            points = REPORT_PENALTIES[index][2]
+            values.extend(-count * points if count > 0 else '-' for count in penalties[index])
+        if disqualified:
+            values.extend('YES' if is_dq else '-' for is_dq in dq)
+        values.extend(penalty_totals)
+        values.extend('<td style="color:#dc2626;">0 (DQ)</td>' if is_dq else f'<td>{final}</td>' for final, is_dq in zip(finals, dq))
+        round_total = sum(finals)
+        values.append(round_total)
+        values.append(round_total / len(finals))
+        parts.append(report_round_template(len(round_scores), penalty_rows, disqualified).format(*values))
     
     # Only show overall summary if there are minor round scores
-    if minor_round_scores:
-        html += f'''<div class="summary-box">
-            <div>Minor Rounds Total: <span class="summary-score">{sum(minor_round_scores):.1f}</span></div>
-            <div style="color:#666;margin-top:5px;">Minor Rounds Average: {sum(minor_round_scores)/len(minor_round_scores):.2f} (from {minor_round_count} minor round(s))</div>
-        </div>'''
+    if minor_scores:
+        parts.append(f'<div class="summary-box"><div>Minor Rounds Total: <span class="summary-score">{sum(minor_scores):.1f}</span></div>'
+                     f'<div style="color:#666;margin-top:5px;">Minor Rounds Average: {sum(minor_scores) / len(minor_scores):.2f} '
+                     f'(from {minor_round_count} minor round(s))</div></div>\n')
+    
+    parts.append(f'<div class="footer">Generated on {datetime.now().strftime("%d/%m/%Y %H:%M:%S")}<br/>'
+                 f'{escape(context["website_url"])}</div>\n</body>\n</html>\n')
+    return {"html": "".join(parts), "competitor": competitor, "event_name": context["event_name"],
+            "logo": context["logo"]}
+
+def build_report_message(email_data: dict, sender: str, recipient_email: str) -> MIMEMultipart:
+    """Wrap a rendered report in the MIME message both send paths use. With a logo the
+    message is multipart/related: the HTML plus the logo as an inline part that the
+    header's cid: reference points at."""
+    competitor = email_data["competitor"]
+    msg = MIMEMultipart('alternative')
+    
+    # Use base64 encoding to avoid line length issues
+    html_part = MIMEText(email_data["html"], 'html', 'utf-8')
+    html_part.replace_header('Content-Transfer-Encoding', 'base64')
+    msg.attach(html_part)
+    
+    logo = email_data.get("logo")
+    if logo:
+        body = msg
+        msg = MIMEMultipart('related', type='multipart/alternative')
+        msg.attach(body)
+        subtype = logo["content_type"].split("/")[-1].replace("jpg", "jpeg")
+        logo_part = MIMEImage(logo["data"], _subtype=subtype)
+        logo_part.add_header('Content-ID', f"<{REPORT_LOGO_CID}>")
+        logo_part.add_header('Content-Disposition', 'inline', filename=logo.get("filename") or f"logo.{subtype}")
+        msg.attach(logo_part)
+    
+    msg['Subject'] = f"Burnout Scores - #{competitor.get('car_number', '?')} {competitor.get('name', '')} - {email_data['event_name']}"
+    msg['From'] = sender
+    msg['To'] = recipient_email
+    return msg
+
+# Bulk email runs as a background job so SMTP work never holds up the request. A job
+# sends concurrently over a MailSessionPool, one worker per pooled session. Bulk jobs
+# share email_job_lock: queued sends go out one after another rather than competing
+# for the provider's connection and rate limits.
+email_job_lock = asyncio.Lock()
+
+async def send_bulk_email_item(pool: MailSessionPool, reports: ReportBatch, smtp_settings: dict, item: dict):
+    """Send one competitor's report. Returns ("sent" | "failed", result entry)"""
+    competitor_id = item.get("competitor_id")
+    recipient_email = item.get("recipient_email")
+    round_id = item.get("round_id")  # The newly completed round that triggered this email
+    
+    if not competitor_id or not recipient_email:
+        return "failed", {"competitor_id": competitor_id, "error": "Missing data"}
     
-    html += f'<div class="footer">Generated on {datetime.now().strftime("%d/%m/%Y %H:%M:%S")}<br/>{website_url}</div></body></html>'
+    try:
+        # Email content includes ALL completed rounds for this competitor
+        email_data = reports.render(competitor_id)
+        competitor = email_data["competitor"]
+        msg = build_report_message(email_data, smtp_settings["smtp_email"], recipient_email)
+        await pool.send(recipient_email, msg.as_string())
+        
+        # Mark only the newly completed round as emailed (not all rounds)
+        # This allows future completed rounds to trigger new emails
+        if round_id:
+            await mark_rounds_emailed(competitor_id, round_id)
+        
+        return "sent", {"competitor_id": competitor_id, "email": recipient_email, "name": competitor.get("name")}
+    except Exception as e:
+        return "failed", {"competitor_id": competitor_id, "error": str(e)}
+
+async def run_bulk_email_job(job_id: str, competitor_emails: List[dict], smtp_settings: dict) -> dict:
+    """Render every report from one prefetched ReportBatch and send them over pooled
+    SMTP sessions, recording progress on the job"""
+    results = {"sent": [], "failed": []}
+    reports = await ReportBatch.load([item["competitor_id"] for item in competitor_emails if item.get("competitor_id")])
+    pool = MailSessionPool(mail_transport, smtp_settings)
+    try:
+        await pool.start()
+    except Exception as e:
+        raise RuntimeError(f"SMTP connection failed: {str(e)}")
+    
+    pending = iter(competitor_emails)  # Shared, so each item is taken by exactly one worker
+    
+    async def worker():
+        for item in pending:
+            outcome, entry = await send_bulk_email_item(pool, reports, smtp_settings, item)
+            results[outcome].append(entry)
+            processed = len(results["sent"]) + len(results["failed"])
+            await update_job(
+                job_id,
+                processed=processed,
+                progress=round(processed / len(competitor_emails), 3),
+                sent=results["sent"],
+                failed=results["failed"]
+            )
+    
+    try:
+        await asyncio.gather(*(worker() for _ in range(pool.size)))
+    finally:
+        await pool.close()
     
-    return {"html": html, "competitor": competitor, "event_name": event_name}, None
+    return {
+        "message": f"Sent {len(results['sent'])} emails, {len(results['failed'])} failed",
+        "sent": results["sent"],
+        "failed": results["failed"]
+    }
 
-@api_router.post("/admin/send-bulk-emails")
+@api_router.post("/admin/send-bulk-emails", status_code=202)
 async def send_bulk_emails(request: BulkEmailRequest, admin: User = Depends(require_admin)):
-    """Send score report emails to multiple competitors"""
+    """Queue score report emails to multiple competitors. Returns a job_id; poll
+    /admin/jobs/{job_id} for progress and the sent/failed lists."""
     # Get SMTP settings
     smtp_settings = await db.settings.find_one({"key": "smtp"}, {"_id": 0})
     if not smtp_settings or not smtp_settings.get("smtp_server"):
         raise HTTPException(status_code=400, detail="SMTP not configured")
     
-    results = {"sent": [], "failed": []}
-    
-    # Connect to SMTP server once for all emails
+    total = len(request.competitor_emails)
+    job_id = await create_job("bulk_email", total=total, processed=0, sent=[], failed=[])
+    start_job(job_id, run_bulk_email_job(job_id, request.competitor_emails, smtp_settings), lock=email_job_lock)
+    return {"message": f"Queued {total} emails", "job_id": job_id}
+
+# Database indexes
+# Declared index set: (collection, keys, options). Created on startup and
+# checked by /admin/db/indexes so a missing index shows up before it hurts.
+REQUIRED_INDEXES = [
+    ("users", [("id", 1)], {"unique": True}),
+    ("users", [("username", 1)], {"unique": True}),
+    ("classes", [("id", 1)], {"unique": True}),
+    ("competitors", [("id", 1)], {"unique": True}),
+    ("competitors", [("car_number", 1)], {}),
+    ("events", [("id", 1)], {"unique": True}),
+    ("rounds", [("id", 1)], {"unique": True}),
+    ("rounds", [("is_minor", 1)], {}),
+    ("scores", [("id", 1)], {"unique": True}),
+    ("scores", [("round_id", 1), ("competitor_id", 1), ("judge_id", 1)], {"unique": True}),
+    ("scores", [("competitor_id", 1)], {}),
+    ("scores", [("judge_id", 1)], {}),
+    ("settings", [("key", 1)], {"unique": True}),
+    ("leaderboard_summary", [("round_id", 1), ("competitor_id", 1)], {"unique": True}),
+    ("change_versions", [("key", 1)], {"unique": True}),
+    ("scoring_errors", [("round_id", 1), ("competitor_id", 1)], {"unique": True}),
+    ("scoring_errors", [("competitor_id", 1)], {}),
+    ("round_completeness", [("competitor_id", 1), ("round_id", 1)], {"unique": True}),
+    ("round_completeness", [("complete", 1), ("email_sent", 1)], {}),
+    ("jobs", [("id", 1)], {"unique": True}),
+    ("jobs", [("finished_at", 1)], {"expireAfterSeconds": JOB_RETENTION_SECONDS}),
+]
+
+def index_name(keys) -> str:
+    """Same naming scheme MongoDB uses by default (e.g. round_id_1_judge_id_1)"""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+INDEX_CONFLICT_CODES = {85, 86}  # IndexOptionsConflict, IndexKeySpecsConflict
+INDEX_NOT_FOUND_CODE = 27
+INDEX_CHECKED_OPTIONS = {"unique": False, "expireAfterSeconds": None}  # option -> value when unset
+
+async def ensure_index(collection: str, keys, options: dict):
+    """Create one declared index, rebuilding a same-named index with other options.
+    Several workers start at once, so another one may drop or rebuild the same index
+    between these steps; each step tolerates that."""
+    name = index_name(keys)
     try:
-        port = smtp_settings.get("smtp_port", 587)
-        use_tls = smtp_settings.get("smtp_use_tls", True)
-        
-        if port == 465 or not use_tls:
-            server = smtplib.SMTP_SSL(smtp_settings["smtp_server"], port, timeout=30)
-        else:
-            server = smtplib.SMTP(smtp_settings["smtp_server"], port, timeout=30)
-            server.ehlo()
-            if use_tls:
-                server.starttls()
-                server.ehlo()
-        
-        server.login(smtp_settings["smtp_email"], smtp_settings["smtp_password"])
-        
-        for item in request.competitor_emails:
-            competitor_id = item.get("competitor_id")
-            recipient_email = item.get("recipient_email")
-            round_id = item.get("round_id")  # The newly completed round that triggered this email
-            
-            if not competitor_id or not recipient_email:
-                results["failed"].append({"competitor_id": competitor_id, "error": "Missing data"})
-                continue
-            
-            try:
-                # Generate email content including ALL completed rounds for this competitor
-                email_data, error = await generate_competitor_email_html(
-                    competitor_id, 
-                    round_id=None,  # Don't filter by specific round
-                    include_all_completed=True  # Include all rounds where all judges have scored
-                )
-                if error:
-                    results["failed"].append({"competitor_id": competitor_id, "error": error})
-                    continue
-                
-                competitor = email_data["competitor"]
-                event_name = email_data["event_name"]
-                
-                msg = MIMEMultipart('alternative')
-                msg['Subject'] = f"Burnout Scores - #{competitor.get('car_number', '?')} {competitor.get('name', '')} - {event_name}"
-                msg['From'] = smtp_settings["smtp_email"]
-                msg['To'] = recipient_email
-                
-                # Use base64 encoding to avoid line length issues
-                html_part = MIMEText(email_data["html"], 'html', 'utf-8')
-                html_part.replace_header('Content-Transfer-Encoding', 'base64')
-                msg.attach(html_part)
-                
-                server.sendmail(smtp_settings["smtp_email"], recipient_email, msg.as_string())
-                
-                # Mark only the newly completed round as emailed (not all rounds)
-                # This allows future completed rounds to trigger new emails
-                if round_id:
-                    await db.scores.update_many(
-                        {"competitor_id": competitor_id, "round_id": round_id},
-                        {"$set": {"email_sent": True}}
-                    )
-                
-                results["sent"].append({"competitor_id": competitor_id, "email": recipient_email, "name": competitor.get("name")})
-            except Exception as e:
-                results["failed"].append({"competitor_id": competitor_id, "error": str(e)})
-        
-        server.quit()
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SMTP connection failed: {str(e)}")
-    
+        await db[collection].create_index(keys, name=name, **options)
+        return
+    except OperationFailure as e:
+        if e.code not in INDEX_CONFLICT_CODES:
+            logger.warning(f"Could not create index {collection}.{name}: {e}")
+            return
+    try:
+        await db[collection].drop_index(name)
+    except OperationFailure as e:
+        if e.code != INDEX_NOT_FOUND_CODE:
+            logger.warning(f"Could not drop index {collection}.{name} to rebuild it: {e}")
+            return
+    try:
+        await db[collection].create_index(keys, name=name, **options)
+        logger.info(f"Rebuilt index {collection}.{name} with {options}")
+        return
+    except OperationFailure as e:
+        rebuild_error = e
+    # Old data prevents the new options (e.g. duplicates under a unique index):
+    # restore the plain index so queries stay fast, and say so loudly
+    try:
+        await db[collection].create_index(keys, name=name)
+    except OperationFailure as e:
+        if e.code not in INDEX_CONFLICT_CODES:  # Otherwise another worker already rebuilt it
+            logger.error(f"Could not restore index {collection}.{name}: {e}")
+        return
+    logger.error(f"Index {collection}.{name} could not be built with {options} and was restored without them "
+                 f"({rebuild_error}); it is reported as degraded until the data is fixed and the server restarted")
+
+async def ensure_indexes():
+    """Create every declared index. An existing index with the same name but other
+    options (e.g. not yet unique) is rebuilt; if old data prevents that (duplicates
+    under a new unique index) the previous index is restored. Failures are logged,
+    never fatal, so a duplicate in old data cannot stop the server from starting."""
+    for collection, keys, options in REQUIRED_INDEXES:
+        try:
+            await ensure_index(collection, keys, options)
+        except Exception as e:
+            logger.error(f"Index setup failed for {collection}.{index_name(keys)}: {e}")
+
+async def get_index_report():
+    """Compare declared indexes with what exists and how often each was used. An index
+    that exists without its declared options (e.g. not unique) is listed as degraded."""
+    report = {"missing": [], "degraded": [], "unused": [], "indexes": []}
+    by_collection = {}
+    for collection, keys, options in REQUIRED_INDEXES:
+        by_collection.setdefault(collection, []).append((keys, options))
+
+    for collection, declared in by_collection.items():
+        existing = {idx["name"]: idx async for idx in db[collection].list_indexes()}
+        usage = {}
+        try:
+            async for stat in db[collection].aggregate([{"$indexStats": {}}]):
+                usage[stat["name"]] = stat.get("accesses", {})
+        except OperationFailure:
+            pass  # $indexStats not permitted for this user - usage stays unknown
+
+        for keys, options in declared:
+            name = index_name(keys)
+            entry = {
+                "collection": collection,
+                "name": name,
+                "unique": options.get("unique", False),
+                "exists": name in existing,
+                "degraded": False,
+                "ops": None,
+                "since": None
+            }
+            if name in usage:
+                entry["ops"] = usage[name].get("ops", 0)
+                since = usage[name].get("since")
+                entry["since"] = since.isoformat() if isinstance(since, datetime) else since
+            if entry["exists"]:
+                entry["degraded"] = any(existing[name].get(option, unset) != options.get(option, unset)
+                                        for option, unset in INDEX_CHECKED_OPTIONS.items())
+
+            report["indexes"].append(entry)
+            if not entry["exists"]:
+                report["missing"].append(f"{collection}.{name}")
+            elif entry["degraded"]:
+                report["degraded"].append(f"{collection}.{name}")
+            elif entry["ops"] == 0:
+                report["unused"].append(f"{collection}.{name}")
+
+    return report
+
+@api_router.get("/admin/db/indexes")
+async def get_indexes_status(admin: User = Depends(require_admin)):
+    """Report declared indexes that are missing or unused since the last MongoDB restart"""
+    return await get_index_report()
+
+# Metrics
+@api_router.get("/admin/metrics")
+async def get_metrics(admin: User = Depends(require_admin)):
+    """In-process counters for the hot paths (reset when the server restarts)"""
     return {
-        "message": f"Sent {len(results['sent'])} emails, {len(results['failed'])} failed",
-        "sent": results["sent"],
-        "failed": results["failed"]
+        "user_cache": user_cache.stats(),
+        "password_hashing": password_hasher.stats(),
+        "token_epochs": token_epochs.stats(),
+        "mail": mail_transport.stats(),
+        "logo_cache": logo_cache.stats()
     }
 
 app.include_router(api_router)
@@ -2204,6 +3860,13 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("startup")
 async def startup_db():
+    # Load (or measure once) the bcrypt cost for this host before anything is hashed
+    bcrypt_settings = await db.settings.find_one({"key": "bcrypt"}, {"_id": 0})
+    if not bcrypt_settings:
+        bcrypt_settings = await save_bcrypt_calibration(BCRYPT_TARGET_MS)
+        logger.info(f"bcrypt calibrated: cost {bcrypt_settings['rounds']} (~{bcrypt_settings['estimated_ms']} ms per hash)")
+    password_hasher.set_rounds(bcrypt_settings["rounds"])
+
     # Create default admin if not exists
     admin = await db.users.find_one({"username": "admin"})
     if not admin:
@@ -2213,11 +3876,46 @@ async def startup_db():
             role="admin"
         )
         doc = default_admin.model_dump()
-        doc["password_hash"] = bcrypt.hash("admin123")
+        doc["password_hash"] = await password_hasher.hash("admin123")
         doc['created_at'] = doc['created_at'].isoformat()
         await db.users.insert_one(doc)
         logger.info("Default admin created: username=admin, password=admin123")
 
+    # Seed the collection-wide change counters; per-round ones start with their round
+    # (or the next reset/rebuild), and until then that round's reads are not cached
+    for scope in ("classes", "competitors", "events", "rounds", "scores"):
+        await db.change_versions.update_one({"key": scope}, {"$setOnInsert": {"version": 0}}, upsert=True)
+
+    # Load token epochs, then keep following revocations made by other workers
+    await token_epochs.refresh()
+    app.state.token_epoch_refresh = asyncio.create_task(token_epochs.refresh_forever())
+
+    # Push leaderboard changes to this worker's SSE subscribers, whichever worker wrote them
+    app.state.leaderboard_watch = asyncio.create_task(leaderboard_broadcaster.watch_forever())
+
+    # Build the materialized leaderboard for databases that predate it
+    if await db.leaderboard_summary.estimated_document_count() == 0 and await db.scores.estimated_document_count() > 0:
+        row_count = await rebuild_leaderboard_summary()
+        logger.info(f"Leaderboard summary built from existing scores ({row_count} rows)")
+
+    # Same for the scoring error registry
+    if await db.scoring_errors.estimated_document_count() == 0 and await db.scores.estimated_document_count() > 0:
+        entry_count = await refresh_scoring_errors()
+        logger.info(f"Scoring error registry built from existing scores ({entry_count} entries)")
+
+    # And the round completeness index
+    if await db.round_completeness.estimated_document_count() == 0 and await db.scores.estimated_document_count() > 0:
+        pair_count = await refresh_round_completeness()
+        logger.info(f"Round completeness index built from existing scores ({pair_count} pairs)")
+
+    # Create declared indexes and report any that could not be built
+    await ensure_indexes()
+    report = await get_index_report()
+    if report["missing"]:
+        logger.warning(f"Missing database indexes: {', '.join(report['missing'])}")
+    if report["degraded"]:
+        logger.error(f"Database indexes without their declared options: {', '.join(report['degraded'])}")
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
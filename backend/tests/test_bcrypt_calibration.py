@@ -0,0 +1,84 @@
+"""
+Test bcrypt Cost Calibration
+- GET /api/admin/settings/bcrypt - returns the calibrated cost within 10..14
+- POST /api/admin/settings/bcrypt/calibrate?target_ms= - picks a cost for the target latency
+- POST /api/auth/login - a hash with a different cost is rehashed once, then left alone
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestBcryptCalibration:
+    """Test bcrypt calibration and transparent rehash on login"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login and get token, restore the default calibration afterwards"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        self.judge_ids = []
+
+        yield
+
+        for judge_id in self.judge_ids:
+            requests.delete(f"{BASE_URL}/api/admin/judges/{judge_id}", headers=self.headers)
+        requests.post(f"{BASE_URL}/api/admin/settings/bcrypt/calibrate", headers=self.headers)
+
+    def calibrate(self, target_ms):
+        response = requests.post(
+            f"{BASE_URL}/api/admin/settings/bcrypt/calibrate?target_ms={target_ms}", headers=self.headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    def hash_calls(self):
+        response = requests.get(f"{BASE_URL}/api/admin/metrics", headers=self.headers)
+        return response.json()["password_hashing"]["calls"]["hash"]
+
+    def test_get_bcrypt_settings(self):
+        """Test the stored calibration is within the allowed cost range"""
+        response = requests.get(f"{BASE_URL}/api/admin/settings/bcrypt", headers=self.headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert 10 <= data["rounds"] <= 14
+        print(f"bcrypt settings: {data}")
+
+    def test_calibrate_respects_floor_and_rejects_bad_target(self):
+        """Test a tiny target clamps to the floor cost and a non-positive target is rejected"""
+        assert self.calibrate(1)["rounds"] == 10
+
+        response = requests.post(f"{BASE_URL}/api/admin/settings/bcrypt/calibrate?target_ms=0", headers=self.headers)
+        assert response.status_code == 400
+        print("Calibration floor and validation verified")
+
+    def test_login_rehashes_to_new_cost(self):
+        """Test login rehashes a password stored at an old cost exactly once"""
+        floor = self.calibrate(1)
+        username = f"TEST_bcrypt_judge_{uuid.uuid4().hex[:8]}"
+        response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": username,
+            "password": "test123",
+            "name": "TEST bcrypt Judge",
+            "role": "judge"
+        })
+        assert response.status_code == 200
+        self.judge_ids.append(response.json()["id"])
+
+        # Roughly three times the floor timing lands one cost step higher
+        assert self.calibrate(floor["estimated_ms"] * 3)["rounds"] > 10
+
+        hashes_before = self.hash_calls()
+        login = {"username": username, "password": "test123"}
+        assert requests.post(f"{BASE_URL}/api/auth/login", json=login).status_code == 200
+        assert self.hash_calls() == hashes_before + 1, "First login should rehash"
+
+        assert requests.post(f"{BASE_URL}/api/auth/login", json=login).status_code == 200
+        assert self.hash_calls() == hashes_before + 1, "Second login should not rehash again"
+        print("Login rehashed the stored password once")
@@ -597,9 +597,9 @@ class TestBulkEmailPayloadStructure:
             ]
         })
         
-        # Should fail with SMTP error, not validation error
-        # Accept various error codes (400 for SMTP not configured, 500 for SMTP error, 520 for cloudflare)
-        assert response.status_code in [400, 500, 520], f"Unexpected status: {response.status_code}"
+        # Should not be a validation error. 400 for SMTP not configured, 520 for cloudflare;
+        # with SMTP configured the send is queued as a job (202) and SMTP errors land on the job
+        assert response.status_code in [202, 400, 500, 520], f"Unexpected status: {response.status_code}"
         
         error_detail = response.json().get("detail", "") if response.status_code != 520 else ""
         # Should not be a validation error about the payload structure
@@ -619,8 +619,8 @@ class TestBulkEmailPayloadStructure:
             ]
         })
         
-        # Should fail with SMTP error, not validation error
-        assert response.status_code in [400, 500, 520]
+        # Should fail with SMTP error or be queued as a job, not a validation error
+        assert response.status_code in [202, 400, 500, 520]
         print(f"PASS: Bulk email endpoint works without round_id (backward compatible)")
 
 
@@ -0,0 +1,93 @@
+"""
+Test Bulk Email Background Jobs
+- POST /api/admin/send-bulk-emails - returns 202 with a job_id instead of sending inline
+- GET /api/admin/jobs/{job_id} - reports total/processed and ends failed when SMTP is unreachable
+- Missing SMTP configuration is still rejected up front with 400
+- Several bulk sends queue behind each other and all finish
+"""
+
+import pytest
+import requests
+import os
+import time
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Nothing listens on port 1, so the connection is refused straight away
+UNREACHABLE_SMTP = {
+    "smtp_server": "127.0.0.1",
+    "smtp_port": 1,
+    "smtp_email": "TEST_jobs@example.com",
+    "smtp_password": "test123",
+    "smtp_use_tls": True
+}
+
+class TestBulkEmailJobs:
+    """Test bulk email sending as a queued background job"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login and remember the SMTP settings so they can be restored"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        self.original_smtp = requests.get(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers).json()
+
+        yield
+
+        # A masked password keeps the stored one
+        requests.put(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers, json=self.original_smtp)
+
+    def configure_smtp(self, **settings):
+        response = requests.put(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers, json=settings)
+        assert response.status_code == 200
+
+    def send(self, count=1):
+        return requests.post(f"{BASE_URL}/api/admin/send-bulk-emails", headers=self.headers, json={
+            "competitor_emails": [
+                {"competitor_id": f"TEST_jobs_{i}", "recipient_email": f"test{i}@example.com"}
+                for i in range(count)
+            ]
+        })
+
+    def wait_for(self, job_id):
+        for _ in range(60):
+            job = requests.get(f"{BASE_URL}/api/admin/jobs/{job_id}", headers=self.headers).json()
+            if job["status"] in ("completed", "failed"):
+                return job
+            time.sleep(0.5)
+        pytest.fail(f"Job {job_id} did not finish: {job}")
+
+    def test_send_returns_job(self):
+        """Test the send is queued and the job records the SMTP failure"""
+        self.configure_smtp(**UNREACHABLE_SMTP)
+        response = self.send(count=3)
+        assert response.status_code == 202, response.text
+        data = response.json()
+        assert "job_id" in data
+        assert "3" in data["message"]
+
+        job = self.wait_for(data["job_id"])
+        assert job["type"] == "bulk_email"
+        assert job["total"] == 3
+        assert job["status"] == "failed"
+        assert job["error"].startswith("SMTP connection failed")
+        print(f"Job error: {job['error']}")
+
+    def test_unconfigured_smtp_rejected_immediately(self):
+        """Test no job is created when SMTP is not configured"""
+        self.configure_smtp(**{**UNREACHABLE_SMTP, "smtp_server": ""})
+        response = self.send()
+        assert response.status_code == 400
+        assert response.json()["detail"] == "SMTP not configured"
+
+    def test_queued_jobs_all_finish(self):
+        """Test back-to-back sends queue behind each other and each reaches a final state"""
+        self.configure_smtp(**UNREACHABLE_SMTP)
+        job_ids = [self.send().json()["job_id"] for _ in range(3)]
+        assert len(set(job_ids)) == 3
+        jobs = [self.wait_for(job_id) for job_id in job_ids]
+        assert all(job["status"] == "failed" for job in jobs)
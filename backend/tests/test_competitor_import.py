@@ -0,0 +1,137 @@
+"""
+Test Competitor CSV Import
+- POST /api/admin/competitors/bulk?dry_run=true - row-level validation report, nothing written
+- POST /api/admin/competitors/bulk?upsert=true - re-importing updates by car_number instead of duplicating;
+  blank fields in the new file keep the stored values
+- Large uploads run as a background job - GET /api/admin/jobs/{job_id} reports progress and the result,
+  and finished jobs carry finished_at for the TTL index
+"""
+
+import pytest
+import requests
+import os
+import time
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+HEADER = "name,car_number,vehicle_info,plate,class_name,email"
+
+class TestCompetitorImport:
+    """Test streaming CSV import with upsert, dry run and background jobs"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login and create a class"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        self.prefix = f"CI{uuid.uuid4().hex[:6]}"
+        self.class_name = f"TEST_CI_Class_{self.prefix}"
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": self.class_name
+        }).json()["id"]
+
+        yield
+
+        for competitor in self.imported():
+            requests.delete(f"{BASE_URL}/api/admin/competitors/{competitor['id']}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def csv_rows(self, count, vehicle="Test Vehicle"):
+        return [f"TEST CI Driver {i},{self.prefix}-{i},{vehicle},CI{i},{self.class_name},"
+                for i in range(count)]
+
+    def import_csv(self, lines, **params):
+        query = "&".join(f"{k}={str(v).lower()}" for k, v in params.items())
+        return requests.post(f"{BASE_URL}/api/admin/competitors/bulk?{query}",
+                             headers={**self.headers, "Content-Type": "text/plain"},
+                             data="\n".join([HEADER] + lines))
+
+    def imported(self):
+        response = requests.get(f"{BASE_URL}/api/admin/competitors", headers=self.headers)
+        return [c for c in response.json() if c["car_number"].startswith(f"{self.prefix}-")]
+
+    def test_dry_run_reports_rows_without_writing(self):
+        """Test a dry run reports bad rows by number and writes nothing"""
+        lines = self.csv_rows(3) + [
+            f"TEST CI Bad Class,{self.prefix}-x,Car,CIX,No Such Class,",
+            f",{self.prefix}-y,Car,CIY,{self.class_name},"
+        ]
+        response = self.import_csv(lines, dry_run=True)
+        assert response.status_code == 200, response.text
+        report = response.json()
+        assert report["dry_run"] is True
+        assert report["rows"] == 5
+        assert report["inserted"] == 3
+        assert report["error_count"] == 2
+        assert [e["row"] for e in report["errors"]] == [5, 6]
+        assert "Unknown class" in report["errors"][0]["error"]
+        assert self.imported() == []
+        print(f"Dry run: {report['message']}")
+
+    def test_upsert_updates_by_car_number(self):
+        """Test re-importing with upsert=true updates rows instead of adding duplicates"""
+        response = self.import_csv(self.csv_rows(3), upsert=True)
+        assert response.status_code == 200, response.text
+        assert response.json()["inserted"] == 3
+        ids = {c["car_number"]: c["id"] for c in self.imported()}
+
+        response = self.import_csv(self.csv_rows(4, vehicle="Updated Vehicle"), upsert=True)
+        report = response.json()
+        assert report["updated"] == 3
+        assert report["inserted"] == 1
+
+        competitors = self.imported()
+        assert len(competitors) == 4
+        assert all(c["vehicle_info"] == "Updated Vehicle" for c in competitors)
+        assert all(ids[c["car_number"]] == c["id"] for c in competitors if c["car_number"] in ids)
+        print(f"Upsert: {report['message']}")
+
+    def test_upsert_keeps_values_for_blank_fields(self):
+        """Test blank class and email cells do not overwrite the stored values"""
+        lines = [f"TEST CI Driver {i},{self.prefix}-{i},Test Vehicle,CI{i},{self.class_name},driver{i}@example.com"
+                 for i in range(2)]
+        assert self.import_csv(lines, upsert=True).json()["inserted"] == 2
+
+        lines = [f"TEST CI Driver {i},{self.prefix}-{i},Updated Vehicle,CI{i},," for i in range(2)]
+        assert self.import_csv(lines, upsert=True).json()["updated"] == 2
+
+        competitors = sorted(self.imported(), key=lambda c: c["car_number"])
+        assert [c["vehicle_info"] for c in competitors] == ["Updated Vehicle"] * 2
+        assert [c["class_id"] for c in competitors] == [self.class_id] * 2
+        assert [c["email"] for c in competitors] == ["driver0@example.com", "driver1@example.com"]
+
+    def test_duplicate_car_number_in_upsert_file(self):
+        """Test a car number repeated within one upsert file is reported, not applied twice"""
+        lines = self.csv_rows(2) + [self.csv_rows(1)[0]]
+        report = self.import_csv(lines, upsert=True, dry_run=True).json()
+        assert report["error_count"] == 1
+        assert "first on row 2" in report["errors"][0]["error"]
+        print(f"Duplicate reported: {report['errors'][0]}")
+
+    def test_large_file_runs_as_job(self):
+        """Test a large upload returns 202 with a job that finishes with the report"""
+        response = self.import_csv(self.csv_rows(4000), dry_run=True)
+        assert response.status_code == 202, response.text
+        job_id = response.json()["job_id"]
+
+        for _ in range(60):
+            job = requests.get(f"{BASE_URL}/api/admin/jobs/{job_id}", headers=self.headers).json()
+            if job["status"] in ("completed", "failed"):
+                break
+            time.sleep(0.5)
+        assert job["status"] == "completed", job
+        assert job["progress"] == 1.0
+        assert job["result"]["rows"] == 4000
+        assert job["result"]["inserted"] == 4000
+        assert job["finished_at"]
+        print(f"Job result: {job['result']['message']}")
+
+    def test_unknown_job(self):
+        """Test GET /api/admin/jobs/{id} returns 404 for an unknown job"""
+        response = requests.get(f"{BASE_URL}/api/admin/jobs/{uuid.uuid4()}", headers=self.headers)
+        assert response.status_code == 404
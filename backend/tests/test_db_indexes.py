@@ -0,0 +1,95 @@
+"""
+Test Database Index Provisioning
+- GET /api/admin/db/indexes - reports declared indexes, missing and unused lists
+- Verify every declared index exists after startup
+- Verify unique indexes are reported as unique and none are degraded (built without their options)
+- Verify non-admin users cannot read the report
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestDatabaseIndexes:
+    """Test startup index provisioning and the index report"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login and get token"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.token = response.json()["token"]
+        self.headers = {"Authorization": f"Bearer {self.token}"}
+
+    def test_index_report_structure(self):
+        """Test GET /api/admin/db/indexes returns missing, unused and indexes"""
+        response = requests.get(f"{BASE_URL}/api/admin/db/indexes", headers=self.headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "missing" in data
+        assert "degraded" in data
+        assert "unused" in data
+        assert "indexes" in data
+        for entry in data["indexes"]:
+            for field in ["collection", "name", "unique", "exists", "degraded", "ops", "since"]:
+                assert field in entry, f"Missing field: {field}"
+        print(f"Index report: {len(data['indexes'])} declared, missing={data['missing']}, unused={data['unused']}")
+
+    def test_declared_indexes_exist(self):
+        """Test that startup created every declared index"""
+        response = requests.get(f"{BASE_URL}/api/admin/db/indexes", headers=self.headers)
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["missing"] == [], f"Indexes missing after startup: {data['missing']}"
+        assert data["degraded"] == [], f"Indexes without their declared options: {data['degraded']}"
+        names = {(i["collection"], i["name"]) for i in data["indexes"]}
+        assert ("scores", "round_id_1_competitor_id_1_judge_id_1") in names
+        assert ("scores", "competitor_id_1") in names
+        assert ("scores", "judge_id_1") in names
+        assert ("users", "username_1") in names
+        assert ("rounds", "is_minor_1") in names
+        print("All declared indexes exist")
+
+    def test_id_indexes_are_unique(self):
+        """Test that every id index and users.username are unique"""
+        response = requests.get(f"{BASE_URL}/api/admin/db/indexes", headers=self.headers)
+        assert response.status_code == 200
+
+        for entry in response.json()["indexes"]:
+            if entry["name"] in ("id_1", "username_1"):
+                assert entry["unique"] is True, f"{entry['collection']}.{entry['name']} should be unique"
+        print("id and username indexes are unique")
+
+    def test_index_report_requires_admin(self):
+        """Test that a judge cannot read the index report"""
+        judge_username = f"TEST_idx_judge_{uuid.uuid4().hex[:8]}"
+        response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": judge_username,
+            "password": "test123",
+            "name": "TEST Index Judge",
+            "role": "judge"
+        })
+        assert response.status_code == 200
+        judge_id = response.json()["id"]
+
+        try:
+            login = requests.post(f"{BASE_URL}/api/auth/login", json={
+                "username": judge_username,
+                "password": "test123"
+            })
+            assert login.status_code == 200
+            judge_headers = {"Authorization": f"Bearer {login.json()['token']}"}
+
+            response = requests.get(f"{BASE_URL}/api/admin/db/indexes", headers=judge_headers)
+            assert response.status_code == 403
+            print("Judge correctly denied access to index report")
+        finally:
+            requests.delete(f"{BASE_URL}/api/admin/judges/{judge_id}", headers=self.headers)
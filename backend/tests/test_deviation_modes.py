@@ -0,0 +1,120 @@
+"""
+Test Score Deviation Modes
+- GET /api/admin/settings/score-deviation - returns threshold, mode and available modes
+- PUT /api/admin/settings/score-deviation?threshold=&mode= - rejects unknown modes
+- Mean mode flags every judge when one outlier drags the average; median flags only the outlier
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestDeviationModes:
+    """Test selectable deviation comparison modes"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create a class, competitor, round and three judges"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        suffix = uuid.uuid4().hex[:8]
+
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_DM_Class_{suffix}"
+        }).json()["id"]
+        self.competitor_id = requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+            "name": "TEST_DM_Competitor",
+            "car_number": f"DM{suffix[:4]}",
+            "vehicle_info": "Test Vehicle",
+            "plate": "DM000",
+            "class_id": self.class_id
+        }).json()["id"]
+        self.round_id = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_DM_Round_{suffix}"
+        }).json()["id"]
+
+        self.judge_ids = []
+        self.judge_headers = []
+        for idx in range(3):
+            username = f"TEST_dm_judge_{idx}_{suffix}"
+            response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+                "username": username,
+                "password": "test123",
+                "name": f"TEST DM Judge {idx}",
+                "role": "judge"
+            })
+            self.judge_ids.append(response.json()["id"])
+            response = requests.post(f"{BASE_URL}/api/auth/login", json={
+                "username": username,
+                "password": "test123"
+            })
+            self.judge_headers.append({"Authorization": f"Bearer {response.json()['token']}"})
+        self.score_ids = []
+
+        yield
+
+        requests.put(f"{BASE_URL}/api/admin/settings/score-deviation?threshold=5&mode=mean", headers=self.headers)
+        for score_id in self.score_ids:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        for judge_id in self.judge_ids:
+            requests.delete(f"{BASE_URL}/api/admin/judges/{judge_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/competitors/{self.competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def submit(self, judge_idx, driving_skill):
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers[judge_idx], json={
+            "competitor_id": self.competitor_id,
+            "round_id": self.round_id,
+            "driving_skill": driving_skill
+        })
+        assert response.status_code == 200, f"Score submit failed: {response.text}"
+        self.score_ids.append(response.json()["id"])
+
+    def set_mode(self, mode):
+        response = requests.put(f"{BASE_URL}/api/admin/settings/score-deviation?threshold=5&mode={mode}",
+                                headers=self.headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    def flagged_score_ids(self):
+        response = requests.get(f"{BASE_URL}/api/admin/scoring-errors", headers=self.headers)
+        assert response.status_code == 200
+        return {e["score_id"] for e in response.json()
+                if e["round_id"] == self.round_id and e["error_type"] == "score_deviation"}
+
+    def test_get_settings_lists_modes(self):
+        """Test the settings include the current mode and the available modes"""
+        response = requests.get(f"{BASE_URL}/api/admin/settings/score-deviation", headers=self.headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["mode"] in data["modes"]
+        assert {"mean", "median", "mad", "per_category"} <= set(data["modes"])
+        print(f"Deviation settings: {data}")
+
+    def test_invalid_mode_rejected(self):
+        """Test an unknown mode returns 400"""
+        response = requests.put(f"{BASE_URL}/api/admin/settings/score-deviation?threshold=5&mode=bogus",
+                                headers=self.headers)
+        assert response.status_code == 400
+        print("Unknown mode rejected")
+
+    def test_median_flags_only_outlier(self):
+        """Test one outlier among three judges flags everyone in mean mode but only itself in median mode"""
+        self.submit(0, 10)
+        self.submit(1, 12)
+        self.submit(2, 40)
+
+        assert self.set_mode("mean")["mode"] == "mean"
+        assert self.flagged_score_ids() == set(self.score_ids)
+
+        assert self.set_mode("median")["mode"] == "median"
+        assert self.flagged_score_ids() == {self.score_ids[2]}
+        print("Median mode flagged only the outlying score")
@@ -0,0 +1,119 @@
+"""
+Test Conditional GETs (ETag / If-None-Match)
+- GET /api/admin/classes, /api/admin/competitors, /api/admin/rounds, /api/admin/events - return a weak ETag
+- Repeating the request with If-None-Match returns 304 with no body
+- A write to the collection changes the ETag
+- GET /api/leaderboard/{round_id} - ETag changes after a score submit, and differs per class_id
+- POST /api/admin/leaderboard/rebuild - invalidates every round's leaderboard ETag
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestETagVersions:
+    """Test ETag validation on the polled read endpoints"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create a class, competitor and round"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        self.suffix = uuid.uuid4().hex[:8]
+        self.score_ids = []
+
+        response = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_ETag_Class_{self.suffix}"
+        })
+        self.class_id = response.json()["id"]
+        response = requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+            "name": "TEST_ETag_Competitor",
+            "car_number": f"ET{self.suffix[:4]}",
+            "vehicle_info": "Test Vehicle",
+            "plate": "ET000",
+            "class_id": self.class_id
+        })
+        self.competitor_id = response.json()["id"]
+        response = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_ETag_Round_{self.suffix}"
+        })
+        self.round_id = response.json()["id"]
+
+        yield
+
+        for score_id in self.score_ids:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/competitors/{self.competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def conditional_get(self, path, etag):
+        return requests.get(f"{BASE_URL}{path}", headers={**self.headers, "If-None-Match": etag})
+
+    @pytest.mark.parametrize("path", ["/api/admin/classes", "/api/admin/competitors", "/api/admin/rounds", "/api/admin/events"])
+    def test_unchanged_list_returns_304(self, path):
+        """Test a repeat GET with the current ETag returns 304"""
+        response = requests.get(f"{BASE_URL}{path}", headers=self.headers)
+        assert response.status_code == 200
+        etag = response.headers.get("ETag")
+        assert etag and etag.startswith('W/"')
+
+        response = self.conditional_get(path, etag)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers.get("ETag") == etag
+        print(f"{path} returned 304 for {etag}")
+
+    def test_write_changes_etag(self):
+        """Test updating a class changes the classes and competitors ETags"""
+        classes_etag = requests.get(f"{BASE_URL}/api/admin/classes", headers=self.headers).headers["ETag"]
+        competitors_etag = requests.get(f"{BASE_URL}/api/admin/competitors", headers=self.headers).headers["ETag"]
+
+        response = requests.put(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers, json={
+            "name": f"TEST_ETag_Class_Renamed_{self.suffix}"
+        })
+        assert response.status_code == 200
+
+        response = self.conditional_get("/api/admin/classes", classes_etag)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != classes_etag
+        assert self.conditional_get("/api/admin/competitors", competitors_etag).status_code == 200
+        print("Class update invalidated classes and competitors ETags")
+
+    def test_leaderboard_etag_follows_scores(self):
+        """Test the round leaderboard ETag changes after a score submit"""
+        path = f"/api/leaderboard/{self.round_id}"
+        etag = requests.get(f"{BASE_URL}{path}", headers=self.headers).headers["ETag"]
+        assert self.conditional_get(path, etag).status_code == 304
+
+        class_etag = requests.get(f"{BASE_URL}{path}?class_id={self.class_id}", headers=self.headers).headers["ETag"]
+        assert class_etag != etag, "class_id filter should have its own ETag"
+
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.headers, json={
+            "competitor_id": self.competitor_id,
+            "round_id": self.round_id,
+            "driving_skill": 25
+        })
+        assert response.status_code == 200
+        self.score_ids.append(response.json()["id"])
+
+        response = self.conditional_get(path, etag)
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert response.headers["ETag"] != etag
+        print("Leaderboard ETag changed after score submit")
+
+    def test_rebuild_invalidates_round_etags(self):
+        """Test a leaderboard rebuild changes the ETag of a round with no scores"""
+        path = f"/api/leaderboard/{self.round_id}"
+        etag = requests.get(f"{BASE_URL}{path}", headers=self.headers).headers["ETag"]
+        response = requests.post(f"{BASE_URL}/api/admin/leaderboard/rebuild", headers=self.headers)
+        assert response.status_code == 200
+        assert self.conditional_get(path, etag).status_code == 200
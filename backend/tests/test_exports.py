@@ -0,0 +1,168 @@
+"""
+Test Streaming CSV Exports
+- GET /api/export/scores/{round_id} - header plus one row per score in the round
+- GET /api/export/all-data - includes every score (no row cap), with round and class names
+- GET /api/export/all-data?format=jsonl|parquet|feather|xlsx - typed columns (parquet/feather/xlsx
+  skip when the server lacks pyarrow/openpyxl)
+- Timestamps with and without fractional seconds both survive the typed export (writes
+  them straight to the backend's database; skips unless MONGO_URL/DB_NAME point at it)
+- Unknown formats are rejected
+"""
+
+import pytest
+import requests
+import os
+import csv
+import io
+import json
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestExports:
+    """Test the streamed CSV and typed data exports"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create a class, a round, 40 competitors and a judge with one score each"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        suffix = uuid.uuid4().hex[:8]
+
+        self.class_name = f"TEST_EX_Class_{suffix}"
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": self.class_name
+        }).json()["id"]
+        self.round_name = f"TEST_EX_Round_{suffix}"
+        self.round_id = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": self.round_name
+        }).json()["id"]
+        requests.post(f"{BASE_URL}/api/admin/competitors/bulk",
+                      headers={**self.headers, "Content-Type": "text/plain"},
+                      data="\n".join(["name,car_number,class_id"] +
+                                     [f"TEST EX Driver {i},EX{suffix}-{i},{self.class_id}" for i in range(40)]))
+        competitors = requests.get(f"{BASE_URL}/api/admin/competitors", headers=self.headers).json()
+        self.competitor_ids = [c["id"] for c in competitors if c["car_number"].startswith(f"EX{suffix}-")]
+
+        username = f"TEST_ex_judge_{suffix}"
+        response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": username,
+            "password": "test123",
+            "name": "TEST EX Judge",
+            "role": "judge"
+        })
+        self.judge_id = response.json()["id"]
+        token = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": username,
+            "password": "test123"
+        }).json()["token"]
+        response = requests.post(f"{BASE_URL}/api/judge/scores/batch", headers={"Authorization": f"Bearer {token}"},
+                                 json={"scores": [{"competitor_id": cid, "round_id": self.round_id, "driving_skill": 20}
+                                                  for cid in self.competitor_ids]})
+        self.score_ids = [r["score"]["id"] for r in response.json()["results"]]
+
+        yield
+
+        for score_id in self.score_ids:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+        for competitor_id in self.competitor_ids:
+            requests.delete(f"{BASE_URL}/api/admin/competitors/{competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def download(self, path):
+        response = requests.get(f"{BASE_URL}/api/export/{path}", headers=self.headers, stream=True)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        text = b"".join(response.iter_content(chunk_size=None)).decode("utf-8")
+        return list(csv.DictReader(io.StringIO(text)))
+
+    def test_round_export(self):
+        """Test the round export has one row per score with class names"""
+        rows = self.download(f"scores/{self.round_id}")
+        assert len(rows) == len(self.score_ids) == 40
+        assert {r["Class"] for r in rows} == {self.class_name}
+        assert all(r["Judge"] == "TEST EX Judge" and r["Final Score"] == "20.0" for r in rows)
+        print(f"Round export: {len(rows)} rows")
+
+    def test_all_data_export(self):
+        """Test the all-data export includes every score id"""
+        rows = self.download("all-data")
+        exported = {r["Score ID"]: r for r in rows}
+        assert set(self.score_ids) <= set(exported)
+        row = exported[self.score_ids[0]]
+        assert row["Round Name"] == self.round_name
+        assert row["Was Edited"] == "No"
+        print(f"All-data export: {len(rows)} rows")
+
+    def download_typed(self, export_format):
+        response = requests.get(f"{BASE_URL}/api/export/all-data?format={export_format}", headers=self.headers)
+        if response.status_code == 400 and "package" in response.json().get("detail", ""):
+            pytest.skip(response.json()["detail"])
+        assert response.status_code == 200, response.text
+        assert f"burnout_scoring_all_data.{export_format}" in response.headers["content-disposition"]
+        return response.content
+
+    def test_jsonl_export_is_typed(self):
+        """Test JSON lines export keeps numbers, booleans and timestamps typed"""
+        rows = [json.loads(line) for line in self.download_typed("jsonl").decode("utf-8").splitlines()]
+        ours = [r for r in rows if r["score_id"] in set(self.score_ids)]
+        assert len(ours) == 40
+        row = ours[0]
+        assert row["final_score"] == 20.0
+        assert row["tyres_popped"] == 0
+        assert row["was_edited"] is False
+        assert row["class_name"] == self.class_name
+        assert row["submitted_at"].startswith("20")
+        print(f"JSONL columns: {sorted(row)}")
+
+    def test_jsonl_export_keeps_whole_second_timestamps(self):
+        """Test a whole-second submitted_at next to a fractional one is not exported empty"""
+        if not os.environ.get("MONGO_URL") or not os.environ.get("DB_NAME"):
+            pytest.skip("MONGO_URL/DB_NAME of the backend under test are not set")
+        pymongo = pytest.importorskip("pymongo")
+        # isoformat() output: the fraction is left out when microseconds are 0
+        stamps = {self.score_ids[0]: "2024-01-01T10:00:00.123456+00:00",
+                  self.score_ids[1]: "2024-01-01T10:00:00+00:00"}
+        with pymongo.MongoClient(os.environ["MONGO_URL"]) as client:
+            for score_id, stamp in stamps.items():
+                client[os.environ["DB_NAME"]].scores.update_one({"id": score_id}, {"$set": {"submitted_at": stamp}})
+        response = requests.get(f"{BASE_URL}/api/export/all-data?format=jsonl", headers=self.headers)
+        assert response.status_code == 200, response.text
+        assert "X-Export-Unparsed-Dates" not in response.headers
+        rows = {r["score_id"]: r for r in map(json.loads, response.text.splitlines()) if r["score_id"] in stamps}
+        assert rows[self.score_ids[0]]["submitted_at"].startswith("2024-01-01T10:00:00.123")
+        assert rows[self.score_ids[1]]["submitted_at"].startswith("2024-01-01T10:00:00.000")
+
+    def test_parquet_export_round_trips(self):
+        """Test the parquet export loads into pandas with typed columns"""
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        df = pd.read_parquet(io.BytesIO(self.download_typed("parquet")))
+        ours = df[df["score_id"].isin(self.score_ids)]
+        assert len(ours) == 40
+        assert str(ours["final_score"].dtype) == "float64"
+        assert str(ours["tyres_popped"].dtype) == "int64"
+        assert str(ours["submitted_at"].dtype).startswith("datetime64")
+        print(f"Parquet dtypes: {dict(df.dtypes.astype(str))}")
+
+    def test_feather_and_xlsx_exports(self):
+        """Test feather and xlsx exports contain every score"""
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("openpyxl")
+        feather = pd.read_feather(io.BytesIO(self.download_typed("feather")))
+        xlsx = pd.read_excel(io.BytesIO(self.download_typed("xlsx")))
+        assert set(self.score_ids) <= set(feather["score_id"])
+        assert set(self.score_ids) <= set(xlsx["score_id"])
+
+    def test_unknown_format_rejected(self):
+        """Test an unsupported format returns 400"""
+        response = requests.get(f"{BASE_URL}/api/export/all-data?format=docx", headers=self.headers)
+        assert response.status_code == 400
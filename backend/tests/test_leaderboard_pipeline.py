@@ -0,0 +1,210 @@
+"""
+Test Aggregation-Pipeline Leaderboards
+- GET /api/leaderboard/{round_id} - totals, averages and counts per competitor, sorted by average
+- GET /api/leaderboard/{round_id}?class_id= - class filter only returns competitors in that class
+- GET /api/leaderboard/minor-rounds/cumulative - cumulative totals and rounds_competed, sorted by total
+- Score edits and deletes update the materialized leaderboard immediately
+- POST /api/admin/leaderboard/rebuild - rebuilds the summary with identical results
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestLeaderboardPipeline:
+    """Test leaderboard results computed by the MongoDB pipeline"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create classes, competitors, minor rounds and two judges"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        self.created = {"classes": [], "competitors": [], "rounds": [], "scores": [], "judges": []}
+        suffix = uuid.uuid4().hex[:8]
+
+        for name in ["A", "B"]:
+            response = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+                "name": f"TEST_LB_Class_{name}_{suffix}"
+            })
+            assert response.status_code == 200
+            self.created["classes"].append(response.json()["id"])
+
+        for idx, class_id in enumerate([self.created["classes"][0], self.created["classes"][1]]):
+            response = requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+                "name": f"TEST_LB_Competitor_{idx}",
+                "car_number": f"LB{idx}{suffix[:3]}",
+                "vehicle_info": "Test Vehicle",
+                "plate": "LB000",
+                "class_id": class_id
+            })
+            assert response.status_code == 200
+            self.created["competitors"].append(response.json()["id"])
+
+        for idx in range(2):
+            response = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+                "name": f"TEST_LB_Minor_{idx}_{suffix}",
+                "is_minor": True
+            })
+            assert response.status_code == 200
+            self.created["rounds"].append(response.json()["id"])
+
+        self.judge_headers = []
+        for idx in range(2):
+            judge_username = f"TEST_lb_judge_{idx}_{suffix}"
+            response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+                "username": judge_username,
+                "password": "test123",
+                "name": f"TEST LB Judge {idx}",
+                "role": "judge"
+            })
+            assert response.status_code == 200
+            self.created["judges"].append(response.json()["id"])
+            response = requests.post(f"{BASE_URL}/api/auth/login", json={
+                "username": judge_username,
+                "password": "test123"
+            })
+            assert response.status_code == 200
+            self.judge_headers.append({"Authorization": f"Bearer {response.json()['token']}"})
+
+        yield
+
+        for score_id in self.created["scores"]:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        for competitor_id in self.created["competitors"]:
+            requests.delete(f"{BASE_URL}/api/admin/competitors/{competitor_id}", headers=self.headers)
+        for round_id in self.created["rounds"]:
+            requests.delete(f"{BASE_URL}/api/admin/rounds/{round_id}", headers=self.headers)
+        for class_id in self.created["classes"]:
+            requests.delete(f"{BASE_URL}/api/admin/classes/{class_id}", headers=self.headers)
+        for judge_id in self.created["judges"]:
+            requests.delete(f"{BASE_URL}/api/admin/judges/{judge_id}", headers=self.headers)
+
+    def submit(self, competitor_id, round_id, driving_skill, judge_idx=0):
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers[judge_idx], json={
+            "competitor_id": competitor_id,
+            "round_id": round_id,
+            "driving_skill": driving_skill
+        })
+        assert response.status_code == 200, f"Score submit failed: {response.text}"
+        self.created["scores"].append(response.json()["id"])
+        return response.json()["id"]
+
+    def test_round_leaderboard_totals_and_order(self):
+        """Test round leaderboard totals, averages, counts and sort order"""
+        round_id = self.created["rounds"][0]
+        comp_a, comp_b = self.created["competitors"]
+        self.submit(comp_a, round_id, 20)
+        self.submit(comp_a, round_id, 30, judge_idx=1)
+        self.submit(comp_b, round_id, 35)
+
+        response = requests.get(f"{BASE_URL}/api/leaderboard/{round_id}", headers=self.headers)
+        assert response.status_code == 200
+        rows = {r["competitor_id"]: r for r in response.json()}
+
+        assert rows[comp_a]["total_score"] == 50
+        assert rows[comp_a]["average_score"] == 25
+        assert rows[comp_a]["score_count"] == 2
+        assert rows[comp_b]["total_score"] == 35
+        assert rows[comp_b]["score_count"] == 1
+
+        averages = [r["average_score"] for r in response.json()]
+        assert averages == sorted(averages, reverse=True), "Leaderboard should be sorted by average"
+        print("Round leaderboard totals and ordering verified")
+
+    def test_round_leaderboard_class_filter(self):
+        """Test class_id filter only returns competitors in the class"""
+        round_id = self.created["rounds"][0]
+        comp_a, comp_b = self.created["competitors"]
+        self.submit(comp_a, round_id, 20)
+        self.submit(comp_b, round_id, 30)
+
+        response = requests.get(
+            f"{BASE_URL}/api/leaderboard/{round_id}?class_id={self.created['classes'][0]}",
+            headers=self.headers
+        )
+        assert response.status_code == 200
+        ids = [r["competitor_id"] for r in response.json()]
+        assert comp_a in ids
+        assert comp_b not in ids
+        print("Class filter verified")
+
+    def test_minor_rounds_cumulative(self):
+        """Test cumulative minor rounds totals and rounds_competed"""
+        comp_a, comp_b = self.created["competitors"]
+        self.submit(comp_a, self.created["rounds"][0], 20)
+        self.submit(comp_a, self.created["rounds"][1], 25)
+        self.submit(comp_b, self.created["rounds"][0], 10)
+
+        response = requests.get(f"{BASE_URL}/api/leaderboard/minor-rounds/cumulative", headers=self.headers)
+        assert response.status_code == 200
+        rows = {r["competitor_id"]: r for r in response.json()}
+
+        assert rows[comp_a]["total_score"] == 45
+        assert rows[comp_a]["rounds_competed"] == 2
+        assert rows[comp_a]["score_count"] == 2
+        assert rows[comp_b]["rounds_competed"] == 1
+
+        totals = [r["total_score"] for r in response.json()]
+        assert totals == sorted(totals, reverse=True), "Cumulative leaderboard should be sorted by total"
+        print("Minor rounds cumulative leaderboard verified")
+
+    def test_edit_and_delete_update_leaderboard(self):
+        """Test admin edit and delete are reflected in the leaderboard"""
+        round_id = self.created["rounds"][0]
+        comp_a = self.created["competitors"][0]
+        first = self.submit(comp_a, round_id, 20)
+        second = self.submit(comp_a, round_id, 30, judge_idx=1)
+
+        response = requests.put(f"{BASE_URL}/api/admin/scores/{first}", headers=self.headers, json={
+            "driving_skill": 40
+        })
+        assert response.status_code == 200
+
+        rows = {r["competitor_id"]: r for r in requests.get(
+            f"{BASE_URL}/api/leaderboard/{round_id}", headers=self.headers).json()}
+        assert rows[comp_a]["total_score"] == 70
+        assert rows[comp_a]["average_score"] == 35
+
+        response = requests.delete(f"{BASE_URL}/api/admin/scores/{second}", headers=self.headers)
+        assert response.status_code == 200
+        self.created["scores"].remove(second)
+
+        rows = {r["competitor_id"]: r for r in requests.get(
+            f"{BASE_URL}/api/leaderboard/{round_id}", headers=self.headers).json()}
+        assert rows[comp_a]["total_score"] == 40
+        assert rows[comp_a]["score_count"] == 1
+
+        # Removing the last score drops the row from both leaderboards
+        response = requests.delete(f"{BASE_URL}/api/admin/scores/{first}", headers=self.headers)
+        assert response.status_code == 200
+        self.created["scores"].remove(first)
+        rows = requests.get(f"{BASE_URL}/api/leaderboard/{round_id}", headers=self.headers).json()
+        assert comp_a not in {r["competitor_id"] for r in rows}
+        response = requests.get(f"{BASE_URL}/api/leaderboard/minor-rounds/cumulative", headers=self.headers)
+        assert response.status_code == 200
+        assert comp_a not in {r["competitor_id"] for r in response.json()}
+        print("Edit and delete reflected in leaderboard")
+
+    def test_rebuild_matches_incremental_leaderboard(self):
+        """Test POST /api/admin/leaderboard/rebuild gives the same leaderboard"""
+        round_id = self.created["rounds"][0]
+        comp_a, comp_b = self.created["competitors"]
+        self.submit(comp_a, round_id, 12.5)
+        self.submit(comp_b, round_id, 27)
+
+        before = requests.get(f"{BASE_URL}/api/leaderboard/{round_id}", headers=self.headers).json()
+
+        response = requests.post(f"{BASE_URL}/api/admin/leaderboard/rebuild", headers=self.headers)
+        assert response.status_code == 200
+        assert "rows" in response.json()
+
+        after = requests.get(f"{BASE_URL}/api/leaderboard/{round_id}", headers=self.headers).json()
+        assert before == after
+        print(f"Rebuild verified: {response.json()['message']}")
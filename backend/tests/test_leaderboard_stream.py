@@ -0,0 +1,131 @@
+"""
+Test Live Leaderboard Stream (Server-Sent Events)
+- GET /api/leaderboard/{round_id}/stream?token= - rejects missing/invalid tokens
+- First event is a snapshot of the current rankings with an id
+- Submitting a score pushes a new "leaderboard" event with a new id
+- Reconnecting with Last-Event-ID of the current version skips the snapshot
+"""
+
+import pytest
+import requests
+import os
+import json
+import threading
+import time
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+def read_event(lines):
+    """Read the next SSE event (skipping heartbeats) from a response's line iterator
+    and return (id, event, data). Use one iterator per response - requests does not
+    support calling iter_lines() twice on a live stream."""
+    event_id, event_type, data = None, None, None
+    for line in lines:
+        if line.startswith("id: "):
+            event_id = line[4:]
+        elif line.startswith("event: "):
+            event_type = line[7:]
+        elif line.startswith("data: "):
+            data = json.loads(line[6:])
+        elif line == "" and data is not None:
+            return event_id, event_type, data
+    return event_id, event_type, data
+
+class TestLeaderboardStream:
+    """Test the SSE leaderboard stream"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create a class, competitor and round"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.token = response.json()["token"]
+        self.headers = {"Authorization": f"Bearer {self.token}"}
+        suffix = uuid.uuid4().hex[:8]
+        self.score_ids = []
+
+        response = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_SSE_Class_{suffix}"
+        })
+        self.class_id = response.json()["id"]
+        response = requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+            "name": "TEST_SSE_Competitor",
+            "car_number": f"SSE{suffix[:4]}",
+            "vehicle_info": "Test Vehicle",
+            "plate": "SSE000",
+            "class_id": self.class_id
+        })
+        self.competitor_id = response.json()["id"]
+        response = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_SSE_Round_{suffix}"
+        })
+        self.round_id = response.json()["id"]
+
+        yield
+
+        for score_id in self.score_ids:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/competitors/{self.competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def stream_url(self):
+        return f"{BASE_URL}/api/leaderboard/{self.round_id}/stream?token={self.token}"
+
+    def test_stream_rejects_invalid_token(self):
+        """Test stream returns 401 for an invalid token and 422 without one"""
+        response = requests.get(f"{BASE_URL}/api/leaderboard/{self.round_id}/stream?token=invalid")
+        assert response.status_code == 401
+
+        response = requests.get(f"{BASE_URL}/api/leaderboard/{self.round_id}/stream")
+        assert response.status_code == 422
+        print("Stream auth verified")
+
+    def test_stream_sends_snapshot_then_update(self):
+        """Test initial snapshot and a pushed update after a score submit"""
+        response = requests.get(self.stream_url(), stream=True, timeout=30)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        lines = response.iter_lines(decode_unicode=True)
+
+        first_id, event_type, data = read_event(lines)
+        assert event_type == "leaderboard"
+        assert first_id
+        assert data == []
+
+        def submit_later():
+            time.sleep(1)
+            result = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.headers, json={
+                "competitor_id": self.competitor_id,
+                "round_id": self.round_id,
+                "driving_skill": 30
+            })
+            self.score_ids.append(result.json()["id"])
+
+        threading.Thread(target=submit_later).start()
+        second_id, event_type, data = read_event(lines)
+        response.close()
+
+        assert second_id != first_id
+        assert len(data) == 1
+        assert data[0]["competitor_id"] == self.competitor_id
+        assert data[0]["total_score"] == 30
+        print(f"Snapshot {first_id} followed by update {second_id}")
+
+    def test_stream_resume_skips_snapshot(self):
+        """Test Last-Event-ID with the current version does not resend the snapshot"""
+        response = requests.get(self.stream_url(), stream=True, timeout=30)
+        current_id, _, _ = read_event(response.iter_lines(decode_unicode=True))
+        response.close()
+
+        response = requests.get(self.stream_url(), stream=True, timeout=3, headers={"Last-Event-ID": current_id})
+        assert response.status_code == 200
+        with pytest.raises(requests.exceptions.ConnectionError):
+            # Nothing changed, so nothing arrives before the read timeout
+            read_event(response.iter_lines(decode_unicode=True))
+        response.close()
+        print("Resume with current Last-Event-ID skipped the snapshot")
@@ -0,0 +1,443 @@
+"""
+Test Mail Transport against a local aiosmtpd stand-in
+- POST /api/admin/settings/smtp/test - connects and logs in through the shared transport
+- POST /api/admin/send-competitor-report - the report reaches the SMTP server
+- GET /api/admin/metrics - mail connect/login/send timings are recorded
+- POST /api/admin/jobs/{job_id}/cancel - a bulk send stuck on a slow server is cancelled
+- POST /api/admin/send-bulk-emails - sends over a pool of sessions, replaces dropped
+  connections and keeps to smtp_rate_limit; each prefetched report reaches its own driver;
+  a server that goes away mid-run fails the rest instead of stalling the job
+- POST/DELETE /api/admin/settings/logo - the logo goes out as one inline cid: part, and
+  a new upload or delete shows up in the next report
+
+The stand-in listens on this machine, so these tests skip unless the backend under
+test runs locally too (and aiosmtpd/cryptography are installed).
+"""
+
+import pytest
+import requests
+import asyncio
+import os
+import socket
+import base64
+import ssl
+import time
+import uuid
+import datetime
+from email import message_from_bytes
+from urllib.parse import urlparse
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+aiosmtpd_smtp = pytest.importorskip("aiosmtpd.smtp")
+x509 = pytest.importorskip("cryptography.x509")
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+pytestmark = pytest.mark.skipif(
+    urlparse(BASE_URL).hostname not in ("127.0.0.1", "localhost"),
+    reason="SMTP stand-in must be reachable from the backend"
+)
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def self_signed_context(directory):
+    """TLS context for the stand-in (the backend does not verify SMTP certificates)"""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(x509.oid.NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (x509.CertificateBuilder().subject_name(name).issuer_name(name)
+            .public_key(key.public_key()).serial_number(x509.random_serial_number())
+            .not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1))
+            .sign(key, hashes.SHA256()))
+    cert_path, key_path = directory / "cert.pem", directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                           serialization.NoEncryption()))
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+class StandInHandler:
+    def __init__(self):
+        self.messages = []
+        self.login_delay = 0
+        self.data_delay = 0
+        self.drop_every = 0  # Hang up after every Nth message
+        self.close_after = 0  # Stop accepting connections after this many messages
+        self.controller = None
+        self.active = 0
+        self.peak = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.data_delay)
+        self.active -= 1
+        self.messages.append(envelope)
+        if self.close_after and len(self.messages) == self.close_after:
+            self.controller.server.close()
+        if self.drop_every and len(self.messages) % self.drop_every == 0:
+            # Runs after the reply below has been queued, as a server enforcing a
+            # per-connection message cap would
+            asyncio.get_running_loop().call_soon(server.transport.close)
+        return "250 Message accepted"
+
+    def authenticate(self, server, session, envelope, mechanism, auth_data):
+        time.sleep(self.login_delay)
+        return aiosmtpd_smtp.AuthResult(success=True)
+
+def start_standin(handler, directory):
+    controller = aiosmtpd_controller.Controller(
+        handler, hostname="127.0.0.1", port=free_port(),
+        ssl_context=self_signed_context(directory),
+        authenticator=handler.authenticate,
+        auth_require_tls=False  # aiosmtpd only counts STARTTLS; the connection is already TLS
+    )
+    controller.start()
+    handler.controller = controller
+    return controller
+
+# Smallest valid PNG
+PNG_LOGO = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+)
+
+def report_html(message):
+    """The HTML body of a report, whether or not it carries an inline logo"""
+    part = next(p for p in message.walk() if p.get_content_type() == "text/html")
+    return part.get_payload(decode=True).decode("utf-8")
+
+def configure_standin(headers, port, **settings):
+    # Port 465-style implicit TLS is what smtp_use_tls=False selects
+    response = requests.put(f"{BASE_URL}/api/admin/settings/smtp", headers=headers, json={
+        "smtp_server": "127.0.0.1",
+        "smtp_port": port,
+        "smtp_email": "TEST_mail@example.com",
+        "smtp_password": "test123",
+        "smtp_use_tls": False,
+        **settings
+    })
+    assert response.status_code == 200, response.text
+
+class TestMailTransport:
+    """Test the thread-offloaded SMTP transport end to end"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup - start the stand-in, point SMTP settings at it, create a scored competitor"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        self.original_smtp = requests.get(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers).json()
+
+        self.handler = StandInHandler()
+        self.controller = start_standin(self.handler, tmp_path)
+        configure_standin(self.headers, self.controller.port)
+
+        suffix = uuid.uuid4().hex[:8]
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_MT_Class_{suffix}"
+        }).json()["id"]
+        self.competitor_id = requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+            "name": "TEST_MT_Competitor",
+            "car_number": f"MT{suffix[:4]}",
+            "vehicle_info": "Test Vehicle",
+            "plate": "MT000",
+            "class_id": self.class_id
+        }).json()["id"]
+        self.round_id = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_MT_Round_{suffix}"
+        }).json()["id"]
+        username = f"TEST_mt_judge_{suffix}"
+        self.judge_id = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": username,
+            "password": "test123",
+            "name": "TEST MT Judge",
+            "role": "judge"
+        }).json()["id"]
+        token = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": username,
+            "password": "test123"
+        }).json()["token"]
+        self.score_id = requests.post(f"{BASE_URL}/api/judge/scores", headers={"Authorization": f"Bearer {token}"}, json={
+            "competitor_id": self.competitor_id,
+            "round_id": self.round_id,
+            "driving_skill": 20
+        }).json()["id"]
+
+        yield
+
+        self.controller.stop()
+        requests.put(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers, json=self.original_smtp)
+        requests.delete(f"{BASE_URL}/api/admin/scores/{self.score_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/competitors/{self.competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def mail_metrics(self):
+        return requests.get(f"{BASE_URL}/api/admin/metrics", headers=self.headers).json()["mail"]
+
+    def test_connection_test_uses_transport(self):
+        """Test the SMTP connection test logs in to the stand-in and records timings"""
+        before = self.mail_metrics()
+        response = requests.post(f"{BASE_URL}/api/admin/settings/smtp/test", headers=self.headers)
+        assert response.status_code == 200, response.text
+        after = self.mail_metrics()
+        assert after["calls"]["connect"] == before["calls"]["connect"] + 1
+        assert after["calls"]["login"] == before["calls"]["login"] + 1
+        assert after["open_sessions"] == 0
+        print(f"Mail metrics: {after}")
+
+    def test_single_report_is_delivered(self):
+        """Test send-competitor-report delivers one message to the recipient"""
+        response = requests.post(f"{BASE_URL}/api/admin/send-competitor-report", headers=self.headers, json={
+            "competitor_id": self.competitor_id,
+            "round_id": self.round_id,
+            "recipient_email": "driver@example.com"
+        })
+        assert response.status_code == 200, response.text
+        assert len(self.handler.messages) == 1
+        envelope = self.handler.messages[0]
+        assert envelope.rcpt_tos == ["driver@example.com"]
+        assert envelope.mail_from == "TEST_mail@example.com"
+        assert b"TEST_MT_Competitor" in envelope.original_content
+
+    def send_report(self):
+        response = requests.post(f"{BASE_URL}/api/admin/send-competitor-report", headers=self.headers, json={
+            "competitor_id": self.competitor_id,
+            "round_id": self.round_id,
+            "recipient_email": "driver@example.com"
+        })
+        assert response.status_code == 200, response.text
+        return message_from_bytes(self.handler.messages[-1].original_content)
+
+    def upload_logo(self, data, filename, content_type):
+        response = requests.post(f"{BASE_URL}/api/admin/settings/logo", headers=self.headers,
+                                 files={"file": (filename, data, content_type)})
+        assert response.status_code == 200, response.text
+
+    def test_logo_sent_as_inline_part(self):
+        """Test the logo is attached once with a Content-ID and refreshed after upload/delete"""
+        self.upload_logo(PNG_LOGO, "TEST_logo.png", "image/png")
+        message = self.send_report()
+        assert message.get_content_type() == "multipart/related"
+        images = [p for p in message.walk() if p.get_content_maintype() == "image"]
+        assert len(images) == 1
+        assert images[0]["Content-ID"] == "<logo@burnout-scoring>"
+        assert images[0].get_payload(decode=True) == PNG_LOGO
+        html = report_html(message)
+        assert 'src="cid:logo@burnout-scoring"' in html
+        assert "data:image" not in html
+
+        # A repeat send (possibly from another worker's cache) still carries the same logo
+        images = [p for p in self.send_report().walk() if p.get_content_maintype() == "image"]
+        assert len(images) == 1
+        assert images[0].get_payload(decode=True) == PNG_LOGO
+
+        # A new upload replaces the cached logo straight away
+        self.upload_logo(b"TEST_jpeg_bytes", "TEST_logo.jpg", "image/jpeg")
+        image = next(p for p in self.send_report().walk() if p.get_content_maintype() == "image")
+        assert image.get_content_type() == "image/jpeg"
+        assert image.get_payload(decode=True) == b"TEST_jpeg_bytes"
+
+        requests.delete(f"{BASE_URL}/api/admin/settings/logo", headers=self.headers)
+        message = self.send_report()
+        assert message.get_content_type() == "multipart/alternative"
+        assert "cid:" not in report_html(message)
+
+        # Counters are per worker process, so only their shape is checked
+        metrics = requests.get(f"{BASE_URL}/api/admin/metrics", headers=self.headers).json()["logo_cache"]
+        assert {"cached", "size_bytes", "hits", "misses"} <= set(metrics)
+        print(f"Logo cache: {metrics}")
+
+    def test_cancel_bulk_job_on_slow_server(self):
+        """Test cancelling a bulk send stuck in login ends the job promptly"""
+        self.handler.login_delay = 5
+        response = requests.post(f"{BASE_URL}/api/admin/send-bulk-emails", headers=self.headers, json={
+            "competitor_emails": [{"competitor_id": self.competitor_id, "recipient_email": "driver@example.com"}]
+        })
+        assert response.status_code == 202, response.text
+        job_id = response.json()["job_id"]
+        time.sleep(1)
+
+        started = time.perf_counter()
+        response = requests.post(f"{BASE_URL}/api/admin/jobs/{job_id}/cancel", headers=self.headers)
+        assert response.status_code == 200, response.text
+        for _ in range(20):
+            job = requests.get(f"{BASE_URL}/api/admin/jobs/{job_id}", headers=self.headers).json()
+            if job["status"] not in ("queued", "running"):
+                break
+            time.sleep(0.1)
+        assert job["status"] == "cancelled"
+        assert time.perf_counter() - started < 3
+        assert self.handler.messages == []
+
+        response = requests.post(f"{BASE_URL}/api/admin/jobs/{job_id}/cancel", headers=self.headers)
+        assert response.status_code == 400
+        print(f"Cancelled after {time.perf_counter() - started:.2f}s")
+
+
+class TestPooledBulkEmail:
+    """Test bulk sends over pooled sessions with reconnects and throttling"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup - start the stand-in, deactivate other judges, create 12 competitors scored by one judge"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        self.original_smtp = requests.get(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers).json()
+        self.handler = StandInHandler()
+        self.controller = start_standin(self.handler, tmp_path)
+
+        # Reports only cover rounds every active judge has scored
+        self.deactivated_judges = []
+        for judge in requests.get(f"{BASE_URL}/api/admin/judges", headers=self.headers).json():
+            if judge.get("is_active", True):
+                requests.put(f"{BASE_URL}/api/admin/judges/{judge['id']}/toggle-active", headers=self.headers)
+                self.deactivated_judges.append(judge["id"])
+
+        suffix = uuid.uuid4().hex[:8]
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_MP_Class_{suffix}"
+        }).json()["id"]
+        self.round_id = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_MP_Round_{suffix}"
+        }).json()["id"]
+        requests.post(f"{BASE_URL}/api/admin/competitors/bulk",
+                      headers={**self.headers, "Content-Type": "text/plain"},
+                      data="\n".join(["name,car_number,class_id"] +
+                                     [f"TEST MP Driver {i},MP{suffix}-{i},{self.class_id}" for i in range(12)]))
+        competitors = requests.get(f"{BASE_URL}/api/admin/competitors", headers=self.headers).json()
+        self.competitor_ids = [c["id"] for c in competitors if c["car_number"].startswith(f"MP{suffix}-")]
+
+        username = f"TEST_mp_judge_{suffix}"
+        self.judge_id = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": username,
+            "password": "test123",
+            "name": "TEST MP Judge",
+            "role": "judge"
+        }).json()["id"]
+        token = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": username,
+            "password": "test123"
+        }).json()["token"]
+        response = requests.post(f"{BASE_URL}/api/judge/scores/batch", headers={"Authorization": f"Bearer {token}"},
+                                 json={"scores": [{"competitor_id": cid, "round_id": self.round_id, "driving_skill": 20}
+                                                  for cid in self.competitor_ids]})
+        self.score_ids = [r["score"]["id"] for r in response.json()["results"]]
+
+        yield
+
+        self.controller.stop()
+        requests.put(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers, json=self.original_smtp)
+        for score_id in self.score_ids:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+        for competitor_id in self.competitor_ids:
+            requests.delete(f"{BASE_URL}/api/admin/competitors/{competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+        for judge_id in self.deactivated_judges:
+            requests.put(f"{BASE_URL}/api/admin/judges/{judge_id}/toggle-active", headers=self.headers)
+
+    def send_all(self, count=12):
+        """Queue reports for the first `count` competitors; returns (finished job, seconds taken)"""
+        started = time.perf_counter()
+        response = requests.post(f"{BASE_URL}/api/admin/send-bulk-emails", headers=self.headers, json={
+            "competitor_emails": [{"competitor_id": cid, "recipient_email": f"driver{i}@example.com", "round_id": self.round_id}
+                                  for i, cid in enumerate(self.competitor_ids[:count])]
+        })
+        assert response.status_code == 202, response.text
+        job_id = response.json()["job_id"]
+        for _ in range(300):
+            job = requests.get(f"{BASE_URL}/api/admin/jobs/{job_id}", headers=self.headers).json()
+            if job["status"] in ("completed", "failed"):
+                break
+            time.sleep(0.1)
+        assert job["status"] == "completed", job
+        return job, time.perf_counter() - started
+
+    def test_pool_sends_concurrently(self):
+        """Test a slow server is fed over several sessions at once, never more than configured"""
+        configure_standin(self.headers, self.controller.port, smtp_max_connections=4)
+        self.handler.data_delay = 0.3
+        job, elapsed = self.send_all()
+        assert len(job["result"]["sent"]) == 12, job["result"]["failed"]
+        assert len(self.handler.messages) == 12
+        assert 1 < self.handler.peak <= 4
+        assert elapsed < 12 * 0.3
+        print(f"12 reports in {elapsed:.2f}s, peak {self.handler.peak} sessions")
+
+    def test_dropped_connection_is_replaced(self):
+        """Test a session the server hangs up on is reopened and the message still sent"""
+        configure_standin(self.headers, self.controller.port, smtp_max_connections=1)
+        self.handler.drop_every = 2
+        before = requests.get(f"{BASE_URL}/api/admin/metrics", headers=self.headers).json()["mail"]
+        job, _ = self.send_all(count=6)
+        after = requests.get(f"{BASE_URL}/api/admin/metrics", headers=self.headers).json()["mail"]
+        assert len(job["result"]["sent"]) == 6, job["result"]["failed"]
+        assert len(self.handler.messages) == 6
+        assert after["reconnects"] > before["reconnects"]
+        print(f"Reconnects: {after['reconnects'] - before['reconnects']}")
+
+    def test_server_lost_mid_run_fails_rest(self):
+        """Test senders waiting for a session are released when the pool loses its last one"""
+        configure_standin(self.headers, self.controller.port, smtp_max_connections=4)
+        self.handler.data_delay = 0.2
+        self.handler.drop_every = 1
+        self.handler.close_after = 2
+        job, elapsed = self.send_all()
+        sent, failed = job["result"]["sent"], job["result"]["failed"]
+        assert len(sent) + len(failed) == 12
+        assert len(sent) == len(self.handler.messages)
+        assert failed
+        print(f"{len(sent)} sent, {len(failed)} failed in {elapsed:.2f}s")
+
+    def test_rate_limit_spaces_messages(self):
+        """Test smtp_rate_limit holds a bulk run to the configured messages per second"""
+        configure_standin(self.headers, self.controller.port, smtp_max_connections=4, smtp_rate_limit=5)
+        job, elapsed = self.send_all(count=10)
+        assert len(job["result"]["sent"]) == 10, job["result"]["failed"]
+        # A burst of 5, then one message every 0.2s
+        assert elapsed >= 0.8
+        print(f"10 reports at 5/s took {elapsed:.2f}s")
+
+    def test_reports_match_recipients(self):
+        """Test each batch-rendered report carries its own competitor's details and scores"""
+        configure_standin(self.headers, self.controller.port, smtp_max_connections=4)
+        job, _ = self.send_all()
+        assert len(job["result"]["sent"]) == 12, job["result"]["failed"]
+        for envelope in self.handler.messages:
+            index = int(envelope.rcpt_tos[0].removeprefix("driver").split("@")[0])
+            message = message_from_bytes(envelope.original_content)
+            html = report_html(message)
+            assert f"TEST MP Driver {index}</strong>" in html
+            assert "TEST_MP_Round_" in html
+            assert "<td>20.0</td>" in html
+
+        # The completed round was marked emailed for every competitor
+        pending = requests.get(f"{BASE_URL}/api/admin/pending-emails", headers=self.headers).json()
+        assert not [p for p in pending["competitors_list"] if p["round_id"] == self.round_id]
+
+    def test_settings_round_trip(self):
+        """Test the pool size and rate limit are saved with the SMTP settings"""
+        configure_standin(self.headers, self.controller.port, smtp_max_connections=6, smtp_rate_limit=2.5)
+        settings = requests.get(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers).json()
+        assert settings["smtp_max_connections"] == 6
+        assert settings["smtp_rate_limit"] == 2.5
+        response = requests.put(f"{BASE_URL}/api/admin/settings/smtp", headers=self.headers,
+                                json={**settings, "smtp_max_connections": 0})
+        assert response.status_code == 422
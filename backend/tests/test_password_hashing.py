@@ -0,0 +1,56 @@
+"""
+Test Off-Loop Password Hashing
+- GET /api/admin/metrics - reports password_hashing pool size, call counts and timings
+- POST /api/auth/login - verification runs in the pool (verify count increases)
+- POST /api/auth/login - wrong password still returns 401
+"""
+
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestPasswordHashing:
+    """Test password hashing metrics and login behaviour"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login and get token"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    def hashing_stats(self):
+        response = requests.get(f"{BASE_URL}/api/admin/metrics", headers=self.headers)
+        assert response.status_code == 200
+        return response.json()["password_hashing"]
+
+    def test_login_uses_password_pool(self):
+        """Test a login adds a verify call to the pool metrics"""
+        before = self.hashing_stats()
+        for field in ["workers", "max_concurrency", "in_flight", "calls", "avg_ms", "max_ms", "avg_wait_ms"]:
+            assert field in before, f"Missing field: {field}"
+
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200
+
+        after = self.hashing_stats()
+        assert after["calls"]["verify"] == before["calls"]["verify"] + 1
+        assert after["avg_ms"]["verify"] > 0
+        print(f"Password hashing: {after}")
+
+    def test_wrong_password_rejected(self):
+        """Test a wrong password is still rejected"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "wrong-password"
+        })
+        assert response.status_code == 401
+        print("Wrong password rejected")
@@ -0,0 +1,72 @@
+"""
+Test Per-User Rate Limiting
+- POST /api/judge/scores - limited to 10/minute per authenticated user, not per IP
+- A judge over the limit gets 429 while another judge on the same address is unaffected
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestRateLimitKeys:
+    """Test that rate limits are keyed by user id"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login as admin and create two judges"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        self.judge_ids = []
+        self.judge_headers = []
+        self.score_ids = []
+
+        for idx in range(2):
+            username = f"TEST_rl_judge_{idx}_{uuid.uuid4().hex[:8]}"
+            response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+                "username": username,
+                "password": "test123",
+                "name": f"TEST RL Judge {idx}",
+                "role": "judge"
+            })
+            assert response.status_code == 200
+            self.judge_ids.append(response.json()["id"])
+            response = requests.post(f"{BASE_URL}/api/auth/login", json={
+                "username": username,
+                "password": "test123"
+            })
+            self.judge_headers.append({"Authorization": f"Bearer {response.json()['token']}"})
+
+        yield
+
+        for score_id in self.score_ids:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        for judge_id in self.judge_ids:
+            requests.delete(f"{BASE_URL}/api/admin/judges/{judge_id}", headers=self.headers)
+
+    def submit(self, headers):
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=headers, json={
+            "competitor_id": f"TEST_RL_Competitor_{uuid.uuid4().hex[:8]}",
+            "round_id": "TEST_RL_Round",
+            "driving_skill": 10
+        })
+        if response.status_code == 200:
+            self.score_ids.append(response.json()["id"])
+        return response.status_code
+
+    def test_limit_is_per_judge(self):
+        """Test one judge exhausting the limit does not throttle another judge"""
+        statuses = [self.submit(self.judge_headers[0]) for _ in range(11)]
+        if 429 not in statuses:
+            pytest.skip("Rate limiting is disabled on this server")
+        assert statuses[:10] == [200] * 10
+        assert statuses[10] == 429
+
+        assert self.submit(self.judge_headers[1]) == 200
+        print("Second judge on the same address was not throttled")
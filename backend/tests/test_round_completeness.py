@@ -0,0 +1,155 @@
+"""
+Test Round Completeness Index
+- GET /api/admin/pending-emails - a pair appears once every active judge has scored it
+- Deactivating a judge who has not scored completes the pair without a new score
+- POST /api/admin/mark-emailed/{competitor_id}/{round_id} - removes the pair from pending
+- DELETE /api/admin/scores/{id} - an incomplete pair leaves the pending list
+- POST /api/admin/round-completeness/rebuild - rebuilt index gives the same pending list
+- Rebuilds running alongside score submits do not drop the pairs those submits wrote
+"""
+
+import pytest
+import requests
+import os
+import threading
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestRoundCompleteness:
+    """Test the maintained (competitor, round) completeness index"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create a class, competitor, round and two judges"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        suffix = uuid.uuid4().hex[:8]
+
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_RC_Class_{suffix}"
+        }).json()["id"]
+        self.competitor_id = requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+            "name": "TEST_RC_Competitor",
+            "car_number": f"RC{suffix[:4]}",
+            "vehicle_info": "Test Vehicle",
+            "plate": "RC000",
+            "class_id": self.class_id
+        }).json()["id"]
+        self.round_id = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_RC_Round_{suffix}"
+        }).json()["id"]
+
+        self.judge_ids = []
+        self.judge_headers = []
+        for idx in range(2):
+            username = f"TEST_rc_judge_{idx}_{suffix}"
+            response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+                "username": username,
+                "password": "test123",
+                "name": f"TEST RC Judge {idx}",
+                "role": "judge"
+            })
+            self.judge_ids.append(response.json()["id"])
+            response = requests.post(f"{BASE_URL}/api/auth/login", json={
+                "username": username,
+                "password": "test123"
+            })
+            self.judge_headers.append({"Authorization": f"Bearer {response.json()['token']}"})
+        self.score_ids = []
+
+        yield
+
+        for score_id in self.score_ids:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        for judge_id in self.judge_ids:
+            requests.delete(f"{BASE_URL}/api/admin/judges/{judge_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/competitors/{self.competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def submit(self, judge_idx):
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers[judge_idx], json={
+            "competitor_id": self.competitor_id,
+            "round_id": self.round_id,
+            "driving_skill": 15
+        })
+        assert response.status_code == 200, f"Score submit failed: {response.text}"
+        self.score_ids.append(response.json()["id"])
+
+    def pending(self):
+        response = requests.get(f"{BASE_URL}/api/admin/pending-emails", headers=self.headers)
+        assert response.status_code == 200
+        return [p for p in response.json()["competitors_list"] if p["round_id"] == self.round_id]
+
+    def test_complete_pair_is_pending_until_emailed(self):
+        """Test the pair is pending once both judges score and drops out when marked emailed"""
+        self.submit(0)
+        assert self.pending() == []
+
+        self.submit(1)
+        pending = self.pending()
+        assert len(pending) == 1
+        assert pending[0]["competitor_id"] == self.competitor_id
+        assert pending[0]["score_count"] == 2
+
+        response = requests.post(f"{BASE_URL}/api/admin/mark-emailed/{self.competitor_id}/{self.round_id}",
+                                 headers=self.headers)
+        assert response.status_code == 200
+        assert self.pending() == []
+        print("Pending list follows completion and the emailed flag")
+
+    def test_deactivating_unscored_judge_completes_pair(self):
+        """Test the index follows changes to the active judge set"""
+        self.submit(0)
+        assert self.pending() == []
+
+        response = requests.put(f"{BASE_URL}/api/admin/judges/{self.judge_ids[1]}/toggle-active", headers=self.headers)
+        assert response.status_code == 200
+        assert len(self.pending()) == 1
+        print("Deactivating the missing judge completed the pair")
+
+    def test_deleting_score_makes_pair_incomplete(self):
+        """Test deleting a score removes the pair from pending"""
+        self.submit(0)
+        self.submit(1)
+        assert len(self.pending()) == 1
+
+        response = requests.delete(f"{BASE_URL}/api/admin/scores/{self.score_ids.pop()}", headers=self.headers)
+        assert response.status_code == 200
+        assert self.pending() == []
+        print("Deleted score made the pair incomplete")
+
+    def test_rebuild_matches_incremental_index(self):
+        """Test POST /api/admin/round-completeness/rebuild leaves the pending list unchanged"""
+        self.submit(0)
+        self.submit(1)
+        before = requests.get(f"{BASE_URL}/api/admin/pending-emails", headers=self.headers).json()
+
+        response = requests.post(f"{BASE_URL}/api/admin/round-completeness/rebuild", headers=self.headers)
+        assert response.status_code == 200
+        assert "pairs" in response.json()
+
+        after = requests.get(f"{BASE_URL}/api/admin/pending-emails", headers=self.headers).json()
+        assert before["total_competitors_scored"] == after["total_competitors_scored"]
+        key = lambda p: (p["competitor_id"], p["round_id"])
+        assert sorted(before["competitors_list"], key=key) == sorted(after["competitors_list"], key=key)
+        print(f"Rebuild verified: {response.json()['message']}")
+
+    def test_rebuild_alongside_submits_keeps_pairs(self):
+        """Test full refreshes racing score writes leave the written pair in place"""
+        rebuilds = [threading.Thread(target=requests.post, args=(f"{BASE_URL}/api/admin/round-completeness/rebuild",),
+                                     kwargs={"headers": self.headers}) for _ in range(3)]
+        for thread in rebuilds:
+            thread.start()
+        self.submit(0)
+        self.submit(1)
+        for thread in rebuilds:
+            thread.join()
+        pending = self.pending()
+        assert len(pending) == 1
+        assert pending[0]["score_count"] == 2
@@ -0,0 +1,121 @@
+"""
+Test Batch Score Submission
+- POST /api/judge/scores/batch - creates valid items with the same totals as POST /api/judge/scores
+- Invalid, unknown and duplicate items are reported per item without failing the batch
+- More than 50 items is rejected
+- A 50-score backlog syncs in one request
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestScoreBatch:
+    """Test POST /api/judge/scores/batch"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create a class, a round, competitors and a judge"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        suffix = uuid.uuid4().hex[:8]
+
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_SB_Class_{suffix}"
+        }).json()["id"]
+        self.round_id = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_SB_Round_{suffix}"
+        }).json()["id"]
+        response = requests.post(f"{BASE_URL}/api/admin/competitors/bulk",
+                                 headers={**self.headers, "Content-Type": "text/plain"},
+                                 data="\n".join(["name,car_number,class_id"] +
+                                                [f"TEST SB Driver {i},SB{suffix}-{i},{self.class_id}" for i in range(50)]))
+        assert response.status_code == 200, response.text
+        competitors = requests.get(f"{BASE_URL}/api/admin/competitors", headers=self.headers).json()
+        self.competitor_ids = [c["id"] for c in competitors if c["car_number"].startswith(f"SB{suffix}-")]
+
+        username = f"TEST_sb_judge_{suffix}"
+        response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": username,
+            "password": "test123",
+            "name": "TEST SB Judge",
+            "role": "judge"
+        })
+        self.judge_id = response.json()["id"]
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": username,
+            "password": "test123"
+        })
+        self.judge_headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+        yield
+
+        for score in requests.get(f"{BASE_URL}/api/admin/scores?round_id={self.round_id}", headers=self.headers).json():
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score['id']}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+        for competitor_id in self.competitor_ids:
+            requests.delete(f"{BASE_URL}/api/admin/competitors/{competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def item(self, competitor_id, **fields):
+        return {"competitor_id": competitor_id, "round_id": self.round_id, **fields}
+
+    def submit_batch(self, items):
+        return requests.post(f"{BASE_URL}/api/judge/scores/batch", headers=self.judge_headers, json={"scores": items})
+
+    def test_batch_totals_match_single_formula(self):
+        """Test batch scores use the same subtotal, penalty and DQ rules"""
+        response = self.submit_batch([
+            self.item(self.competitor_ids[0], tip_in=5, driving_skill=30, tyres_popped=2, penalty_large_fire=1),
+            self.item(self.competitor_ids[1], driving_skill=30, penalty_disqualified=True)
+        ])
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["created"] == 2 and data["failed"] == 0
+        first, second = (r["score"] for r in data["results"])
+        assert first["score_subtotal"] == 45
+        assert first["penalty_total"] == 10
+        assert first["final_score"] == 35
+        assert second["final_score"] == 0
+        print(f"Batch totals: {first['final_score']}, {second['final_score']}")
+
+    def test_per_item_errors(self):
+        """Test bad items are reported by index while good items are created"""
+        response = self.submit_batch([
+            self.item(self.competitor_ids[0], driving_skill=20),
+            self.item(self.competitor_ids[1], driving_skill="lots"),
+            self.item("TEST_SB_Unknown_Competitor", driving_skill=20),
+            self.item(self.competitor_ids[0], driving_skill=25)
+        ])
+        assert response.status_code == 200, response.text
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == ["created", "error", "error", "error"]
+        assert "driving_skill" in results[1]["error"]
+        assert results[2]["error"] == "Competitor not found"
+        assert results[3]["error"] == "Duplicate of item 0"
+        print(f"Item errors: {[r.get('error') for r in results]}")
+
+    def test_fifty_scores_in_one_request(self):
+        """Test a 50-score backlog syncs in one request and reaches the leaderboard"""
+        response = self.submit_batch([self.item(cid, driving_skill=10) for cid in self.competitor_ids])
+        assert response.status_code == 200, response.text
+        assert response.json()["created"] == 50
+
+        response = requests.get(f"{BASE_URL}/api/leaderboard/{self.round_id}", headers=self.headers)
+        assert response.status_code == 200
+        assert len(response.json()) == 50
+        assert all(e["total_score"] == 10 and e["average_score"] == 10 for e in response.json())
+        print("50 queued scores synced in one round trip")
+
+    def test_oversized_batch_rejected(self):
+        """Test more than 50 items is rejected"""
+        response = self.submit_batch([self.item(self.competitor_ids[0])] * 51)
+        assert response.status_code == 400
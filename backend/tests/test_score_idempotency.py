@@ -0,0 +1,144 @@
+"""
+Test Idempotent Score Submission
+- POST /api/judge/scores with a client_key - a replay returns the stored score without writing again
+- Idempotency-Key header works the same as client_key
+- A second score for the same (judge, competitor, round) with another key is rejected with 409
+- POST /api/judge/scores/batch - replayed items come back as "existing", also when the
+  replay races the original sync
+- GET /api/admin/db/indexes - the (round_id, competitor_id, judge_id) index is unique
+"""
+
+import pytest
+import requests
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestScoreIdempotency:
+    """Test client keys and the one-score-per-judge guard"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create a class, competitor, round and judge"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        suffix = uuid.uuid4().hex[:8]
+
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_ID_Class_{suffix}"
+        }).json()["id"]
+        self.competitor_id = requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+            "name": "TEST_ID_Competitor",
+            "car_number": f"ID{suffix[:4]}",
+            "vehicle_info": "Test Vehicle",
+            "plate": "ID000",
+            "class_id": self.class_id
+        }).json()["id"]
+        self.round_id = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_ID_Round_{suffix}"
+        }).json()["id"]
+
+        username = f"TEST_id_judge_{suffix}"
+        response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": username,
+            "password": "test123",
+            "name": "TEST ID Judge",
+            "role": "judge"
+        })
+        self.judge_id = response.json()["id"]
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": username,
+            "password": "test123"
+        })
+        self.judge_headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+        yield
+
+        for score in self.round_scores():
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score['id']}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/competitors/{self.competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def payload(self, **fields):
+        return {"competitor_id": self.competitor_id, "round_id": self.round_id, "driving_skill": 25, **fields}
+
+    def round_scores(self):
+        response = requests.get(f"{BASE_URL}/api/admin/scores?round_id={self.round_id}", headers=self.headers)
+        return response.json()
+
+    def test_replay_returns_stored_score(self):
+        """Test a retried submission with the same client_key returns the first score"""
+        first = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers,
+                              json=self.payload(client_key="retry-key-1"))
+        assert first.status_code == 200, first.text
+        replay = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers,
+                               json=self.payload(client_key="retry-key-1"))
+        assert replay.status_code == 200, replay.text
+        assert replay.json()["id"] == first.json()["id"]
+        assert len(self.round_scores()) == 1
+        print("Replay returned the stored score")
+
+    def test_idempotency_key_header(self):
+        """Test the Idempotency-Key header is accepted in place of client_key"""
+        headers = {**self.judge_headers, "Idempotency-Key": "header-key-1"}
+        first = requests.post(f"{BASE_URL}/api/judge/scores", headers=headers, json=self.payload())
+        replay = requests.post(f"{BASE_URL}/api/judge/scores", headers=headers, json=self.payload())
+        assert first.status_code == replay.status_code == 200
+        assert replay.json()["id"] == first.json()["id"]
+        print("Idempotency-Key header honoured")
+
+    def test_second_score_for_pair_rejected(self):
+        """Test a new score for an already scored pair is rejected with 409"""
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers,
+                                 json=self.payload(client_key="first"))
+        assert response.status_code == 200
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers,
+                                 json=self.payload(client_key="second", driving_skill=30))
+        assert response.status_code == 409
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers, json=self.payload())
+        assert response.status_code == 409
+        assert len(self.round_scores()) == 1
+        print("Duplicate score rejected")
+
+    def test_batch_replay_reports_existing(self):
+        """Test re-sending a batch returns the stored scores as existing"""
+        items = [self.payload(client_key="batch-key-1")]
+        first = requests.post(f"{BASE_URL}/api/judge/scores/batch", headers=self.judge_headers, json={"scores": items})
+        assert first.json()["created"] == 1
+        replay = requests.post(f"{BASE_URL}/api/judge/scores/batch", headers=self.judge_headers, json={"scores": items})
+        data = replay.json()
+        assert data["created"] == 0 and data["existing"] == 1
+        assert data["results"][0]["score"]["id"] == first.json()["results"][0]["score"]["id"]
+        assert len(self.round_scores()) == 1
+        print("Batch replay reported as existing")
+
+    def test_concurrent_batch_replays_report_existing(self):
+        """Test the same batch sent several times at once stores one score, never an error"""
+        items = [self.payload(client_key="batch-key-race")]
+        def send(_):
+            return requests.post(f"{BASE_URL}/api/judge/scores/batch", headers=self.judge_headers,
+                                 json={"scores": items}).json()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            responses = list(pool.map(send, range(4)))
+        statuses = [r["results"][0]["status"] for r in responses]
+        assert statuses.count("created") == 1 and statuses.count("existing") == 3, statuses
+        assert len({r["results"][0]["score"]["id"] for r in responses}) == 1
+        assert len(self.round_scores()) == 1
+        print(f"Concurrent replays: {statuses}")
+
+    def test_unique_index_declared(self):
+        """Test the index report lists the judge/competitor/round index as unique and present"""
+        response = requests.get(f"{BASE_URL}/api/admin/db/indexes", headers=self.headers)
+        assert response.status_code == 200
+        entry = next(i for i in response.json()["indexes"]
+                     if i["collection"] == "scores" and i["name"] == "round_id_1_competitor_id_1_judge_id_1")
+        assert entry["unique"] is True
+        assert entry["exists"] is True
@@ -0,0 +1,155 @@
+"""
+Test Scoring-Error Detector
+- GET /api/admin/scoring-errors - reports deviations between active judges' scores
+- Competitor scored only by a since-deactivated judge is still reported as missing scores
+- Scores in completed rounds are not checked
+- POST /api/admin/scores/{id}/acknowledge-deviation - removes the deviation from the list immediately
+- POST /api/admin/scoring-errors/rebuild - rebuilt registry matches the incrementally maintained one
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestScoringErrorDetector:
+    """Test scoring-error detection for one round"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login, create a class, two competitors, a round and two judges"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        suffix = uuid.uuid4().hex[:8]
+
+        self.class_id = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_SE_Class_{suffix}"
+        }).json()["id"]
+        self.competitor_ids = []
+        for idx in range(2):
+            self.competitor_ids.append(requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+                "name": f"TEST_SE_Competitor_{idx}",
+                "car_number": f"SE{idx}{suffix[:3]}",
+                "vehicle_info": "Test Vehicle",
+                "plate": "SE000",
+                "class_id": self.class_id
+            }).json()["id"])
+        self.round_id = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_SE_Round_{suffix}"
+        }).json()["id"]
+
+        self.judge_ids = []
+        self.judge_headers = []
+        for idx in range(2):
+            username = f"TEST_se_judge_{idx}_{suffix}"
+            response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+                "username": username,
+                "password": "test123",
+                "name": f"TEST SE Judge {idx}",
+                "role": "judge"
+            })
+            self.judge_ids.append(response.json()["id"])
+            response = requests.post(f"{BASE_URL}/api/auth/login", json={
+                "username": username,
+                "password": "test123"
+            })
+            self.judge_headers.append({"Authorization": f"Bearer {response.json()['token']}"})
+        self.score_ids = []
+
+        yield
+
+        for score_id in self.score_ids:
+            requests.delete(f"{BASE_URL}/api/admin/scores/{score_id}", headers=self.headers)
+        for judge_id in self.judge_ids:
+            requests.delete(f"{BASE_URL}/api/admin/judges/{judge_id}", headers=self.headers)
+        for competitor_id in self.competitor_ids:
+            requests.delete(f"{BASE_URL}/api/admin/competitors/{competitor_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers)
+        requests.delete(f"{BASE_URL}/api/admin/classes/{self.class_id}", headers=self.headers)
+
+    def submit(self, judge_idx, competitor_id, driving_skill):
+        response = requests.post(f"{BASE_URL}/api/judge/scores", headers=self.judge_headers[judge_idx], json={
+            "competitor_id": competitor_id,
+            "round_id": self.round_id,
+            "driving_skill": driving_skill
+        })
+        assert response.status_code == 200, f"Score submit failed: {response.text}"
+        self.score_ids.append(response.json()["id"])
+
+    def round_errors(self):
+        response = requests.get(f"{BASE_URL}/api/admin/scoring-errors", headers=self.headers)
+        assert response.status_code == 200
+        return [e for e in response.json() if e["round_id"] == self.round_id]
+
+    def test_deviation_between_active_judges(self):
+        """Test both scores of a widely split pair are reported as deviations"""
+        comp_a = self.competitor_ids[0]
+        self.submit(0, comp_a, 5)
+        self.submit(1, comp_a, 40)
+
+        deviations = [e for e in self.round_errors()
+                      if e["competitor_id"] == comp_a and e["error_type"] == "score_deviation"]
+        assert {e["score_id"] for e in deviations} == set(self.score_ids)
+        print(f"Deviation errors: {[e['details'] for e in deviations]}")
+
+    def test_inactive_judge_only_competitor_reported_missing(self):
+        """Test a competitor scored only by a deactivated judge still shows as missing"""
+        comp_b = self.competitor_ids[1]
+        self.submit(1, comp_b, 30)
+        response = requests.put(f"{BASE_URL}/api/admin/judges/{self.judge_ids[1]}/toggle-active", headers=self.headers)
+        assert response.status_code == 200
+
+        missing = [e for e in self.round_errors()
+                   if e["competitor_id"] == comp_b and e["error_type"] == "missing_scores"]
+        assert len(missing) == 1
+        assert missing[0]["judge_count"] == 0
+        print(f"Missing error: {missing[0]['details']}")
+
+    def test_completed_round_not_checked(self):
+        """Test errors are only reported for active rounds"""
+        self.submit(0, self.competitor_ids[0], 20)
+        assert self.round_errors(), "Expected missing scores while the round is active"
+
+        response = requests.put(f"{BASE_URL}/api/admin/rounds/{self.round_id}", headers=self.headers, json={
+            "name": "TEST_SE_Round_Completed",
+            "round_status": "completed"
+        })
+        assert response.status_code == 200
+        assert self.round_errors() == []
+        print("Completed round skipped")
+
+    def test_acknowledge_updates_registry(self):
+        """Test acknowledging a deviation removes it from the next read"""
+        comp_a = self.competitor_ids[0]
+        self.submit(0, comp_a, 5)
+        self.submit(1, comp_a, 40)
+
+        response = requests.post(f"{BASE_URL}/api/admin/scores/{self.score_ids[0]}/acknowledge-deviation",
+                                 headers=self.headers)
+        assert response.status_code == 200
+
+        deviation_ids = {e["score_id"] for e in self.round_errors() if e["error_type"] == "score_deviation"}
+        assert self.score_ids[0] not in deviation_ids
+        assert self.score_ids[1] in deviation_ids
+        print("Acknowledged deviation dropped from the registry")
+
+    def test_rebuild_matches_incremental_registry(self):
+        """Test POST /api/admin/scoring-errors/rebuild returns the same errors"""
+        self.submit(0, self.competitor_ids[0], 5)
+        self.submit(1, self.competitor_ids[0], 40)
+        self.submit(0, self.competitor_ids[1], 20)
+
+        before = requests.get(f"{BASE_URL}/api/admin/scoring-errors", headers=self.headers).json()
+        response = requests.post(f"{BASE_URL}/api/admin/scoring-errors/rebuild", headers=self.headers)
+        assert response.status_code == 200
+        assert "entries" in response.json()
+
+        after = requests.get(f"{BASE_URL}/api/admin/scoring-errors", headers=self.headers).json()
+        assert before == after
+        print(f"Rebuild verified: {response.json()['message']}")
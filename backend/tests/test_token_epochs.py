@@ -0,0 +1,118 @@
+"""
+Test Signed-Claim Tokens and Revocation Epochs
+- POST /api/auth/login - token carries role, name and epoch claims
+- Requests with a current token are authorized from the claims (claim_hits increase)
+- PUT /api/admin/judges/{id}/toggle-active - revokes the judge's existing token
+- PUT /api/auth/profile - password change revokes the old token and returns a new one
+- DELETE /api/admin/judges/{id} - the judge's token is rejected
+"""
+
+import pytest
+import requests
+import os
+import uuid
+import jwt
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestTokenEpochs:
+    """Test claim-based auth and epoch revocation"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login as admin and create a judge"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+        self.judge_username = f"TEST_epoch_judge_{uuid.uuid4().hex[:8]}"
+        response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": self.judge_username,
+            "password": "test123",
+            "name": "TEST Epoch Judge",
+            "role": "judge"
+        })
+        assert response.status_code == 200
+        self.judge_id = response.json()["id"]
+        self.judge_token = self.login("test123")
+
+        yield
+
+        requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+
+    def login(self, password):
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": self.judge_username,
+            "password": password
+        })
+        assert response.status_code == 200, f"Judge login failed: {response.text}"
+        return response.json()["token"]
+
+    def judge_get(self, token):
+        return requests.get(f"{BASE_URL}/api/admin/rounds", headers={"Authorization": f"Bearer {token}"})
+
+    def epoch_stats(self):
+        response = requests.get(f"{BASE_URL}/api/admin/metrics", headers=self.headers)
+        assert response.status_code == 200
+        return response.json()["token_epochs"]
+
+    def test_token_carries_claims(self):
+        """Test the login token contains the claims used for authorization"""
+        claims = jwt.decode(self.judge_token, options={"verify_signature": False})
+        assert claims["user_id"] == self.judge_id
+        assert claims["role"] == "judge"
+        assert claims["name"] == "TEST Epoch Judge"
+        assert claims["is_active"] is True
+        assert "epoch" in claims
+        print(f"Token claims: {sorted(claims)}")
+
+    def test_current_token_uses_claims(self):
+        """Test requests with a current token are authorized without a fallback lookup"""
+        self.judge_get(self.judge_token)
+        before = self.epoch_stats()
+        for _ in range(3):
+            assert self.judge_get(self.judge_token).status_code == 200
+        after = self.epoch_stats()
+        assert after["claim_hits"] >= before["claim_hits"] + 3
+        assert after["fallbacks"] == before["fallbacks"]
+        print(f"Token epochs: {after}")
+
+    def test_toggle_revokes_token(self):
+        """Test deactivating a judge rejects the old token; a new login works"""
+        response = requests.put(f"{BASE_URL}/api/admin/judges/{self.judge_id}/toggle-active", headers=self.headers)
+        assert response.status_code == 200
+
+        response = self.judge_get(self.judge_token)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Token revoked"
+
+        new_token = self.login("test123")
+        assert jwt.decode(new_token, options={"verify_signature": False})["is_active"] is False
+        assert self.judge_get(new_token).status_code == 200
+        print("Toggle revoked the judge's token")
+
+    def test_password_change_returns_new_token(self):
+        """Test a password change revokes the old token and returns a working one"""
+        response = requests.put(f"{BASE_URL}/api/auth/profile",
+                                headers={"Authorization": f"Bearer {self.judge_token}"},
+                                json={"password": "test456"})
+        assert response.status_code == 200
+        new_token = response.json()["token"]
+        assert new_token
+
+        assert self.judge_get(self.judge_token).status_code == 401
+        assert self.judge_get(new_token).status_code == 200
+        self.login("test456")
+        print("Password change issued a replacement token")
+
+    def test_deleted_judge_token_rejected(self):
+        """Test a deleted judge's current token is rejected"""
+        assert self.judge_get(self.judge_token).status_code == 200
+        response = requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+        assert response.status_code == 200
+
+        assert self.judge_get(self.judge_token).status_code == 401
+        print("Deleted judge's token rejected")
@@ -0,0 +1,114 @@
+"""
+Test User Cache for Authentication
+- GET /api/admin/metrics - reports user_cache size, hits and misses
+- Repeated authenticated requests do not add cache misses (no user lookups)
+- PUT /api/auth/profile - the new name is used for the next score submitted
+- DELETE /api/admin/judges/{id} - the judge's token stops working immediately
+"""
+
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+class TestUserCache:
+    """Test cached user lookups and their invalidation"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup - login as admin and create a judge"""
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": "admin",
+            "password": "admin123"
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+        self.judge_username = f"TEST_cache_judge_{uuid.uuid4().hex[:8]}"
+        response = requests.post(f"{BASE_URL}/api/auth/register", headers=self.headers, json={
+            "username": self.judge_username,
+            "password": "test123",
+            "name": "TEST Cache Judge",
+            "role": "judge"
+        })
+        assert response.status_code == 200
+        self.judge_id = response.json()["id"]
+        response = requests.post(f"{BASE_URL}/api/auth/login", json={
+            "username": self.judge_username,
+            "password": "test123"
+        })
+        self.judge_headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+        yield
+
+        requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+
+    def cache_stats(self):
+        response = requests.get(f"{BASE_URL}/api/admin/metrics", headers=self.headers)
+        assert response.status_code == 200
+        return response.json()["user_cache"]
+
+    def test_metrics_report_cache_counters(self):
+        """Test repeated requests by the same user need no further user lookups"""
+        before = self.cache_stats()
+        for field in ["size", "max_size", "ttl_seconds", "hits", "misses", "evictions", "hit_rate"]:
+            assert field in before, f"Missing field: {field}"
+
+        for _ in range(3):
+            assert requests.get(f"{BASE_URL}/api/admin/rounds", headers=self.headers).status_code == 200
+
+        after = self.cache_stats()
+        assert after["misses"] == before["misses"]
+        print(f"User cache: {after}")
+
+    def test_profile_update_is_visible_immediately(self):
+        """Test a name change is used as judge_name on the next score"""
+        suffix = uuid.uuid4().hex[:8]
+        cls = requests.post(f"{BASE_URL}/api/admin/classes", headers=self.headers, json={
+            "name": f"TEST_Cache_Class_{suffix}"
+        }).json()
+        competitor = requests.post(f"{BASE_URL}/api/admin/competitors", headers=self.headers, json={
+            "name": "TEST_Cache_Competitor",
+            "car_number": f"UC{suffix[:4]}",
+            "vehicle_info": "Test Vehicle",
+            "plate": "UC000",
+            "class_id": cls["id"]
+        }).json()
+        round_ = requests.post(f"{BASE_URL}/api/admin/rounds", headers=self.headers, json={
+            "name": f"TEST_Cache_Round_{suffix}"
+        }).json()
+
+        try:
+            requests.get(f"{BASE_URL}/api/admin/rounds", headers=self.judge_headers)
+            response = requests.put(f"{BASE_URL}/api/auth/profile", headers=self.judge_headers, json={
+                "name": "TEST Cache Judge Renamed"
+            })
+            assert response.status_code == 200
+            judge_headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+            response = requests.post(f"{BASE_URL}/api/judge/scores", headers=judge_headers, json={
+                "competitor_id": competitor["id"],
+                "round_id": round_["id"],
+                "driving_skill": 20
+            })
+            assert response.status_code == 200
+            assert response.json()["judge_name"] == "TEST Cache Judge Renamed"
+            requests.delete(f"{BASE_URL}/api/admin/scores/{response.json()['id']}", headers=self.headers)
+            print("Profile update invalidated the cached judge")
+        finally:
+            requests.delete(f"{BASE_URL}/api/admin/competitors/{competitor['id']}", headers=self.headers)
+            requests.delete(f"{BASE_URL}/api/admin/rounds/{round_['id']}", headers=self.headers)
+            requests.delete(f"{BASE_URL}/api/admin/classes/{cls['id']}", headers=self.headers)
+
+    def test_deleted_judge_token_rejected(self):
+        """Test a deleted judge's token is rejected on the next request"""
+        assert requests.get(f"{BASE_URL}/api/admin/rounds", headers=self.judge_headers).status_code == 200
+
+        response = requests.delete(f"{BASE_URL}/api/admin/judges/{self.judge_id}", headers=self.headers)
+        assert response.status_code == 200
+
+        response = requests.get(f"{BASE_URL}/api/admin/rounds", headers=self.judge_headers)
+        assert response.status_code == 401
+        print("Deleted judge rejected despite the cache")
@@ -17,6 +17,17 @@ const getAuthHeaders = () => ({
   headers: { Authorization: `Bearer ${localStorage.getItem('token')}` }
 });
 
+// Poll a background job until it finishes; resolves with the job document
+const pollJob = async (jobId, onProgress) => {
+  for (;;) {
+    const response = await axios.get(`${API}/admin/jobs/${jobId}`, getAuthHeaders());
+    const job = response.data;
+    if (job.status === 'completed' || job.status === 'failed') return job;
+    if (onProgress) onProgress(job);
+    await new Promise((resolve) => setTimeout(resolve, 1000));
+  }
+};
+
 export default function AdminDashboard({ user, onLogout }) {
   const navigate = useNavigate();
   const [judges, setJudges] = useState([]);
@@ -28,6 +39,7 @@ export default function AdminDashboard({ user, onLogout }) {
   const [profileData, setProfileData] = useState({ name: '', password: '' });
   const [resetConfirm, setResetConfirm] = useState('');
   const [isResetting, setIsResetting] = useState(false);
+  const [exportFormat, setExportFormat] = useState('csv');
   
   // Logo and website settings
   const [logo, setLogo] = useState(null);
@@ -36,12 +48,14 @@ export default function AdminDashboard({ user, onLogout }) {
   
   // SMTP Settings
   const [smtpSettings, setSmtpSettings] = useState({ 
-    smtp_server: '', smtp_port: 587, smtp_email: '', smtp_password: '', smtp_use_tls: true 
+    smtp_server: '', smtp_port: 587, smtp_email: '', smtp_password: '', smtp_use_tls: true,
+    smtp_max_connections: 3, smtp_rate_limit: 0
   });
   const [smtpTesting, setSmtpTesting] = useState(false);
   
   // Score deviation settings
   const [deviationThreshold, setDeviationThreshold] = useState(5);
+  const [deviationMode, setDeviationMode] = useState('mean');
   
   // Scoring errors
   const [scoringErrors, setScoringErrors] = useState([]);
@@ -97,6 +111,7 @@ export default function AdminDashboard({ user, onLogout }) {
     try {
       const deviationRes = await axios.get(`${API}/admin/settings/score-deviation`, getAuthHeaders());
       setDeviationThreshold(deviationRes.data.threshold);
+      setDeviationMode(deviationRes.data.mode || 'mean');
     } catch (error) {
       // Use default
     }
@@ -191,7 +206,7 @@ export default function AdminDashboard({ user, onLogout }) {
 
   const handleDeviationThresholdUpdate = async () => {
     try {
-      await axios.put(`${API}/admin/settings/score-deviation?threshold=${deviationThreshold}`, {}, getAuthHeaders());
+      await axios.put(`${API}/admin/settings/score-deviation?threshold=${deviationThreshold}&mode=${deviationMode}`, {}, getAuthHeaders());
       toast.success('Score deviation threshold saved');
       fetchScoringErrors();
     } catch (error) {
@@ -220,7 +235,11 @@ export default function AdminDashboard({ user, onLogout }) {
         return;
       }
 
-      await axios.put(`${API}/auth/profile`, updateData, getAuthHeaders());
+      const response = await axios.put(`${API}/auth/profile`, updateData, getAuthHeaders());
+      // Name/password changes revoke the old token; keep the replacement
+      if (response.data.token) {
+        localStorage.setItem('token', response.data.token);
+      }
       toast.success('Profile updated successfully');
       setProfileOpen(false);
       setProfileData({ name: '', password: '' });
@@ -276,23 +295,39 @@ export default function AdminDashboard({ user, onLogout }) {
             </div>
           </div>
           <div className="flex gap-3">
+            <Select value={exportFormat} onValueChange={setExportFormat}>
+              <SelectTrigger className="w-28 bg-[#18181b] border-[#27272a] text-white" data-testid="export-format-select">
+                <SelectValue />
+              </SelectTrigger>
+              <SelectContent className="bg-[#18181b] border-[#27272a]">
+                <SelectItem value="csv">CSV</SelectItem>
+                <SelectItem value="xlsx">Excel</SelectItem>
+                <SelectItem value="parquet">Parquet</SelectItem>
+                <SelectItem value="feather">Feather</SelectItem>
+                <SelectItem value="jsonl">JSON Lines</SelectItem>
+              </SelectContent>
+            </Select>
             <Button
               onClick={async () => {
                 try {
-                  const response = await axios.get(`${API}/export/all-data`, {
+                  const response = await axios.get(`${API}/export/all-data?format=${exportFormat}`, {
                     headers: { Authorization: `Bearer ${localStorage.getItem('token')}` },
                     responseType: 'blob'
                   });
                   const url = window.URL.createObjectURL(new Blob([response.data]));
                   const link = document.createElement('a');
                   link.href = url;
-                  link.setAttribute('download', 'burnout_scoring_all_data.csv');
+                  link.setAttribute('download', `burnout_scoring_all_data.${exportFormat}`);
                   document.body.appendChild(link);
                   link.click();
                   link.remove();
                   toast.success('Data exported successfully');
                 } catch (error) {
-                  toast.error('Failed to export data');
+                  // Error bodies arrive as a Blob because of responseType
+                  const detail = error.response?.data instanceof Blob
+                    ? JSON.parse(await error.response.data.text()).detail
+                    : null;
+                  toast.error(detail || 'Failed to export data');
                 }
               }}
               className="bg-[#22c55e] hover:bg-[#16a34a] text-white"
@@ -629,6 +664,20 @@ export default function AdminDashboard({ user, onLogout }) {
                     data-testid="deviation-threshold-input"
                   />
                 </div>
+                <div className="flex-1">
+                  <Label className="text-xs">Compare Against</Label>
+                  <Select value={deviationMode} onValueChange={setDeviationMode}>
+                    <SelectTrigger className="bg-[#18181b] border-[#27272a] text-sm" data-testid="deviation-mode-select">
+                      <SelectValue />
+                    </SelectTrigger>
+                    <SelectContent className="bg-[#18181b] border-[#27272a]">
+                      <SelectItem value="mean">Average</SelectItem>
+                      <SelectItem value="median">Median</SelectItem>
+                      <SelectItem value="mad">Median + spread (MAD)</SelectItem>
+                      <SelectItem value="per_category">Each category average</SelectItem>
+                    </SelectContent>
+                  </Select>
+                </div>
                 <Button 
                   onClick={handleDeviationThresholdUpdate} 
                   size="sm" 
@@ -639,7 +688,9 @@ export default function AdminDashboard({ user, onLogout }) {
                 </Button>
               </div>
               <p className="text-xs text-[#71717a] mt-2">
-                Example: If threshold is 5, a score that differs more than 5 points from the average will be flagged for review.
+                Example: If threshold is 5, a score that differs more than 5 points from the average of all judges' scores (its own included) will be flagged for review.
+                Median ignores a single outlier judge; MAD also widens the threshold when the judges disagree with each other;
+                each-category compares every scoring category separately.
                 You can acknowledge reviewed scores to dismiss the warning.
               </p>
             </div>
@@ -695,6 +746,30 @@ export default function AdminDashboard({ user, onLogout }) {
                     className="bg-[#18181b] border-[#27272a] text-sm"
                   />
                 </div>
+                <div>
+                  <Label className="text-xs">Parallel Connections (bulk email)</Label>
+                  <Input
+                    type="number"
+                    min="1"
+                    max="20"
+                    value={smtpSettings.smtp_max_connections}
+                    onChange={(e) => setSmtpSettings({ ...smtpSettings, smtp_max_connections: parseInt(e.target.value) || 1 })}
+                    placeholder="3"
+                    className="bg-[#18181b] border-[#27272a] text-sm"
+                  />
+                </div>
+                <div>
+                  <Label className="text-xs">Max Emails per Second (0 = no limit)</Label>
+                  <Input
+                    type="number"
+                    min="0"
+                    step="0.1"
+                    value={smtpSettings.smtp_rate_limit}
+                    onChange={(e) => setSmtpSettings({ ...smtpSettings, smtp_rate_limit: parseFloat(e.target.value) || 0 })}
+                    placeholder="0"
+                    className="bg-[#18181b] border-[#27272a] text-sm"
+                  />
+                </div>
               </div>
               
               <div className="flex items-center gap-2 mt-3">
@@ -1057,6 +1132,9 @@ function CompetitorsPanel({ competitors, classes, onRefresh }) {
   const [editOpen, setEditOpen] = useState(false);
   const [editingCompetitor, setEditingCompetitor] = useState(null);
   const [csvData, setCsvData] = useState('');
+  const [bulkUpsert, setBulkUpsert] = useState(false);
+  const [importing, setImporting] = useState(false);
+  const [importReport, setImportReport] = useState(null);
   const [formData, setFormData] = useState({ name: '', car_number: '', vehicle_info: '', plate: '', class_id: '', email: '' });
 
   const handleCreate = async () => {
@@ -1071,20 +1149,43 @@ function CompetitorsPanel({ competitors, classes, onRefresh }) {
     }
   };
 
-  const handleBulkImport = async () => {
+  const handleBulkImport = async (dryRun = false) => {
+    setImporting(true);
+    setImportReport(null);
     try {
-      await axios.post(`${API}/admin/competitors/bulk`, csvData, {
+      const response = await axios.post(
+        `${API}/admin/competitors/bulk?upsert=${bulkUpsert}&dry_run=${dryRun}`, csvData, {
         headers: {
           Authorization: `Bearer ${localStorage.getItem('token')}`,
           'Content-Type': 'text/plain'
         }
       });
-      toast.success('Competitors imported successfully');
-      setBulkOpen(false);
-      setCsvData('');
+      let report = response.data;
+      if (response.status === 202) {
+        // Large file - the import runs in the background
+        toast.info('Import started...');
+        const job = await pollJob(report.job_id);
+        if (job.status === 'failed') {
+          toast.error(`Import failed: ${job.error}`);
+          return;
+        }
+        report = job.result;
+      }
+      setImportReport(report);
+      if (dryRun) {
+        toast.info(report.message);
+        return;
+      }
+      toast.success(report.message || 'Competitors imported successfully');
+      if (!report.error_count) {
+        setBulkOpen(false);
+        setCsvData('');
+      }
       onRefresh();
     } catch (error) {
       toast.error(error.response?.data?.detail || 'Import failed');
+    } finally {
+      setImporting(false);
     }
   };
 
@@ -1153,9 +1254,32 @@ function CompetitorsPanel({ competitors, classes, onRefresh }) {
                     data-testid="csv-textarea"
                   />
                 </div>
-                <Button onClick={handleBulkImport} className="w-full btn-primary" data-testid="import-csv-button">
-                  Import CSV
-                </Button>
+                <div className="flex items-center gap-3">
+                  <input
+                    type="checkbox"
+                    id="bulk_upsert"
+                    checked={bulkUpsert}
+                    onChange={(e) => setBulkUpsert(e.target.checked)}
+                    className="w-4 h-4 rounded border-[#27272a] bg-[#09090b]"
+                    data-testid="bulk-upsert-checkbox"
+                  />
+                  <Label htmlFor="bulk_upsert" className="cursor-pointer">Update existing competitors with the same car number</Label>
+                </div>
+                {importReport && importReport.errors?.length > 0 && (
+                  <div className="max-h-32 overflow-y-auto p-2 bg-[#09090b] border border-[#27272a] rounded text-xs text-[#fca5a5]" data-testid="import-errors">
+                    {importReport.errors.map((e) => (
+                      <div key={e.row}>Row {e.row}: {e.error}</div>
+                    ))}
+                  </div>
+                )}
+                <div className="flex gap-3">
+                  <Button onClick={() => handleBulkImport(true)} disabled={importing} variant="outline" className="flex-1 border-[#27272a]" data-testid="validate-csv-button">
+                    Validate Only
+                  </Button>
+                  <Button onClick={() => handleBulkImport(false)} disabled={importing} className="flex-1 btn-primary" data-testid="import-csv-button">
+                    {importing ? 'Importing...' : 'Import CSV'}
+                  </Button>
+                </div>
               </div>
             </DialogContent>
           </Dialog>
@@ -1779,6 +1903,7 @@ function ScoresPanel({ rounds, judges, competitors, pendingEmails, onRefresh })
   const [bulkEmailDialog, setBulkEmailDialog] = useState(false);
   const [bulkEmailData, setBulkEmailData] = useState([]);
   const [sendingBulk, setSendingBulk] = useState(false);
+  const [bulkProgress, setBulkProgress] = useState('');
 
   const fetchScores = async () => {
     setLoading(true);
@@ -1889,9 +2014,18 @@ function ScoresPanel({ rounds, judges, competitors, pendingEmails, onRefresh })
         }))
       }, getAuthHeaders());
       
-      toast.success(response.data.message);
-      if (response.data.failed?.length > 0) {
-        response.data.failed.forEach(f => {
+      // Emails go out from a background job - follow its progress
+      const job = await pollJob(response.data.job_id, (j) => {
+        setBulkProgress(j.status === 'queued' ? 'Queued...' : `Sending ${j.processed || 0}/${j.total}...`);
+      });
+      if (job.status === 'failed') {
+        toast.error(`Bulk email failed: ${job.error}`);
+        return;
+      }
+      const result = job.result;
+      toast.success(result.message);
+      if (result.failed?.length > 0) {
+        result.failed.forEach(f => {
           toast.error(`Failed: #${f.competitor_id} - ${f.error}`);
         });
       }
@@ -1902,6 +2036,7 @@ function ScoresPanel({ rounds, judges, competitors, pendingEmails, onRefresh })
       toast.error(error.response?.data?.detail || 'Failed to send bulk emails');
     } finally {
       setSendingBulk(false);
+      setBulkProgress('');
     }
   };
 
@@ -2351,7 +2486,7 @@ function ScoresPanel({ rounds, judges, competitors, pendingEmails, onRefresh })
                 className="bg-[#3b82f6] hover:bg-[#2563eb] text-white"
                 disabled={sendingBulk || bulkEmailData.filter(d => d.selected && d.email).length === 0}
               >
-                {sendingBulk ? 'Sending...' : `Send ${bulkEmailData.filter(d => d.selected && d.email).length} Emails`}
+                {sendingBulk ? (bulkProgress || 'Sending...') : `Send ${bulkEmailData.filter(d => d.selected && d.email).length} Emails`}
               </Button>
             </div>
           </div>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import axios from 'axios';
 import { toast } from 'sonner';
 import { LogOut, Trophy, Flame, Minus, Plus, AlertTriangle, CheckCircle2, Settings } from 'lucide-react';
@@ -16,6 +16,8 @@ const getAuthHeaders = () => ({
   headers: { Authorization: `Bearer ${localStorage.getItem('token')}` }
 });
 
+const newClientKey = () => `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+
 export default function JudgeScoring({ user, onLogout }) {
   const navigate = useNavigate();
   const [rounds, setRounds] = useState([]);
@@ -31,6 +33,12 @@ export default function JudgeScoring({ user, onLogout }) {
   const [profileOpen, setProfileOpen] = useState(false);
   const [profileData, setProfileData] = useState({ name: '', password: '' });
   const [competitorSortBy, setCompetitorSortBy] = useState(localStorage.getItem('competitorSortBy') || 'number');
+  // Scores submitted while offline, pushed with /judge/scores/batch when the connection returns
+  const [queuedScores, setQueuedScores] = useState(() => JSON.parse(localStorage.getItem('queuedScores') || '[]'));
+  const [syncing, setSyncing] = useState(false);
+  // One client key per score form, kept until the score is stored or queued, so
+  // resubmitting after a lost response replays the same score instead of a new one
+  const clientKeyRef = useRef(newClientKey());
 
   const [scoreData, setScoreData] = useState({
     tip_in: 0,
@@ -54,6 +62,16 @@ export default function JudgeScoring({ user, onLogout }) {
     fetchMyScores();
   }, []);
 
+  useEffect(() => {
+    localStorage.setItem('queuedScores', JSON.stringify(queuedScores));
+  }, [queuedScores]);
+
+  useEffect(() => {
+    syncQueuedScores();
+    window.addEventListener('online', syncQueuedScores);
+    return () => window.removeEventListener('online', syncQueuedScores);
+  }, []);
+
   useEffect(() => {
     if (selectedRound) {
       fetchCompetitors();
@@ -175,43 +193,89 @@ export default function JudgeScoring({ user, onLogout }) {
     return { subtotal, penalties, final: subtotal - penalties };
   };
 
+  const syncQueuedScores = async () => {
+    const queue = JSON.parse(localStorage.getItem('queuedScores') || '[]');
+    if (queue.length === 0) return;
+    setSyncing(true);
+    let synced = 0;
+    let created = 0;
+    let failed = 0;
+    try {
+      // The server accepts up to 50 scores per batch
+      while (synced < queue.length) {
+        const batch = queue.slice(synced, synced + 50);
+        const response = await axios.post(`${API}/judge/scores/batch`, { scores: batch }, getAuthHeaders());
+        synced += batch.length;
+        created += response.data.created;
+        failed += response.data.failed;
+      }
+    } catch (error) {
+      // Still offline (or rejected as a whole) - keep the rest of the queue for the next attempt
+      if (error.response) {
+        toast.error(error.response.data?.detail || 'Failed to sync queued scores');
+      }
+    } finally {
+      // Drop what was sent; scores queued while syncing stay queued
+      setQueuedScores((current) => current.slice(synced));
+      setSyncing(false);
+    }
+    if (synced > 0) {
+      if (failed > 0) {
+        toast.error(`Synced ${created} queued scores, ${failed} rejected`);
+      } else {
+        toast.success(`Synced ${created} queued scores`);
+      }
+      fetchMyScores();
+    }
+  };
+
   const handleSubmit = async () => {
     if (!selectedCompetitor) {
       toast.error('Please select a competitor');
       return;
     }
 
+    // The key makes retries and queued re-syncs safe: the server returns the stored score
+    const payload = {
+      ...scoreData,
+      competitor_id: selectedCompetitor.id,
+      round_id: selectedRound,
+      client_key: clientKeyRef.current
+    };
     try {
-      await axios.post(`${API}/judge/scores`, {
-        ...scoreData,
-        competitor_id: selectedCompetitor.id,
-        round_id: selectedRound
-      }, getAuthHeaders());
+      await axios.post(`${API}/judge/scores`, payload, getAuthHeaders());
 
       toast.success('Score submitted successfully!');
-      
-      // Reset form
-      setScoreData({
-        tip_in: 0,
-        instant_smoke: 0,
-        constant_smoke: 0,
-        volume_of_smoke: 0,
-        driving_skill: 0,
-        tyres_popped: 0,
-        penalty_reversing: 0,
-        penalty_stopping: 0,
-        penalty_contact_barrier: 0,
-        penalty_small_fire: 0,
-        penalty_failed_drive_off: 0,
-        penalty_large_fire: 0,
-        penalty_disqualified: false
-      });
-      setSelectedCompetitor(null);
-      setCarNumberSearch('');
-      fetchMyScores();
     } catch (error) {
-      toast.error(error.response?.data?.detail || 'Failed to submit score');
+      if (error.response) {
+        toast.error(error.response.data?.detail || 'Failed to submit score');
+        return;
+      }
+      // No response - the tablet is offline, queue the score and sync later
+      setQueuedScores((queue) => [...queue, payload]);
+      toast.warning('No connection - score saved on this device and will sync when back online');
     }
+
+    // Reset form - the next score gets a new key
+    clientKeyRef.current = newClientKey();
+    setScoreData({
+      tip_in: 0,
+      instant_smoke: 0,
+      constant_smoke: 0,
+      volume_of_smoke: 0,
+      driving_skill: 0,
+      tyres_popped: 0,
+      penalty_reversing: 0,
+      penalty_stopping: 0,
+      penalty_contact_barrier: 0,
+      penalty_small_fire: 0,
+      penalty_failed_drive_off: 0,
+      penalty_large_fire: 0,
+      penalty_disqualified: false
+    });
+    setSelectedCompetitor(null);
+    setCarNumberSearch('');
+    fetchMyScores();
   };
 
   const handleProfileUpdate = async () => {
@@ -225,7 +289,11 @@ export default function JudgeScoring({ user, onLogout }) {
         return;
       }
 
-      await axios.put(`${API}/auth/profile`, updateData, getAuthHeaders());
+      const response = await axios.put(`${API}/auth/profile`, updateData, getAuthHeaders());
+      // Name/password changes revoke the old token; keep the replacement
+      if (response.data.token) {
+        localStorage.setItem('token', response.data.token);
+      }
       toast.success('Profile updated successfully');
       setProfileOpen(false);
       setProfileData({ name: '', password: '' });
@@ -257,6 +325,17 @@ export default function JudgeScoring({ user, onLogout }) {
             </div>
           </div>
           <div className="flex gap-2">
+            {queuedScores.length > 0 && (
+              <Button
+                onClick={syncQueuedScores}
+                disabled={syncing}
+                className="bg-[#eab308] hover:bg-[#ca8a04] text-black"
+                size="sm"
+                data-testid="sync-queued-scores-button"
+              >
+                {syncing ? 'Syncing...' : `Sync ${queuedScores.length} Queued`}
+              </Button>
+            )}
             <Button
               onClick={() => setShowReview(true)}
               className="bg-[#0ea5e9] hover:bg-[#0284c7] text-white"
@@ -8,6 +8,7 @@ import { useNavigate } from 'react-router-dom';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+const LEADERBOARD_POLL_MS = 10000; // Fallback refresh while the live stream is unavailable
 
 const getAuthHeaders = () => ({
   headers: { Authorization: `Bearer ${localStorage.getItem('token')}` }
@@ -62,6 +63,52 @@ export default function Leaderboard({ user }) {
     }
   }, [selectedRound, selectedClass, leaderboardType]);
 
+  // Keep the current sort preference available to the live stream handler
+  const scoreDisplayRef = useRef(scoreDisplay);
+  useEffect(() => {
+    scoreDisplayRef.current = scoreDisplay;
+  }, [scoreDisplay]);
+
+  // Live updates - the server pushes new rankings only when scores change.
+  // EventSource reconnects on its own and resumes with Last-Event-ID. While the
+  // stream is down (or EventSource is unavailable) the board is polled instead.
+  useEffect(() => {
+    const streamRound = leaderboardType === 'minor' ? 'minor-rounds' : selectedRound;
+    if (!streamRound) return;
+
+    let source = null;
+    if (typeof EventSource !== 'undefined') {
+      const params = new URLSearchParams({ token: localStorage.getItem('token') || '' });
+      if (selectedClass) params.append('class_id', selectedClass);
+      source = new EventSource(`${API}/leaderboard/${streamRound}/stream?${params.toString()}`);
+
+      source.addEventListener('leaderboard', (event) => {
+        const entries = JSON.parse(event.data);
+        const sorted = [...entries].sort((a, b) => {
+          if (scoreDisplayRef.current === 'total') {
+            return b.total_score - a.total_score;
+          }
+          return b.average_score - a.average_score;
+        });
+        setLeaderboard(sorted);
+      });
+    }
+
+    const poll = setInterval(() => {
+      if (source && source.readyState === EventSource.OPEN) return;
+      if (leaderboardType === 'minor') {
+        fetchMinorRoundsLeaderboard(true);
+      } else {
+        fetchLeaderboard(true);
+      }
+    }, LEADERBOARD_POLL_MS);
+
+    return () => {
+      clearInterval(poll);
+      if (source) source.close();
+    };
+  }, [selectedRound, selectedClass, leaderboardType]);
+
   const fetchSettings = async () => {
     try {
       const [logoRes, websiteRes] = await Promise.all([
@@ -105,10 +152,10 @@ export default function Leaderboard({ user }) {
     }
   };
 
-  const fetchLeaderboard = async () => {
+  const fetchLeaderboard = async (quiet = false) => {
     if (!selectedRound) return;
     
-    setLoading(true);
+    if (!quiet) setLoading(true);
     try {
       const url = selectedClass 
         ? `${API}/leaderboard/${selectedRound}?class_id=${selectedClass}`
@@ -117,21 +164,21 @@ export default function Leaderboard({ user }) {
       
       // Sort based on scoreDisplay preference
       const sorted = [...response.data].sort((a, b) => {
-        if (scoreDisplay === 'total') {
+        if (scoreDisplayRef.current === 'total') {
           return b.total_score - a.total_score;
         }
         return b.average_score - a.average_score;
       });
       setLeaderboard(sorted);
     } catch (error) {
-      toast.error('Failed to load leaderboard');
+      if (!quiet) toast.error('Failed to load leaderboard');
     } finally {
-      setLoading(false);
+      if (!quiet) setLoading(false);
     }
   };
 
-  const fetchMinorRoundsLeaderboard = async () => {
-    setLoading(true);
+  const fetchMinorRoundsLeaderboard = async (quiet = false) => {
+    if (!quiet) setLoading(true);
     try {
       const url = selectedClass 
         ? `${API}/leaderboard/minor-rounds/cumulative?class_id=${selectedClass}`
@@ -140,16 +187,16 @@ export default function Leaderboard({ user }) {
       
       // Sort based on scoreDisplay preference
       const sorted = [...response.data].sort((a, b) => {
-        if (scoreDisplay === 'total') {
+        if (scoreDisplayRef.current === 'total') {
           return b.total_score - a.total_score;
         }
         return b.average_score - a.average_score;
       });
       setLeaderboard(sorted);
     } catch (error) {
-      toast.error('Failed to load minor rounds leaderboard');
+      if (!quiet) toast.error('Failed to load minor rounds leaderboard');
     } finally {
-      setLoading(false);
+      if (!quiet) setLoading(false);
     }
   };
 
@@ -114,6 +114,7 @@ MONGO_URL=mongodb://localhost:27017
 DB_NAME=burnout_competition
 JWT_SECRET=$(openssl rand -hex 32)
 CORS_ORIGINS=*
+RATE_LIMIT_STORAGE_URI=mongodb://localhost:27017
 EOF
 echo "✓ Backend configured"
 